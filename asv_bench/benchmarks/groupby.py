@@ -13,6 +13,7 @@ from pandas import (
     Series,
     Timestamp,
     date_range,
+    option_context,
     period_range,
     to_timedelta,
 )
@@ -143,6 +144,21 @@ class Apply:
         self.df.groupby("key").apply(self.df_copy_function)
 
 
+class ApplyProcesses:
+    param_names = ["engine"]
+    params = ["python", "processes"]
+
+    def setup(self, engine):
+        N = 100_000
+        self.df = DataFrame(
+            {"key": np.random.randint(0, 1000, size=N), "values": np.random.randn(N)}
+        )
+
+    def time_apply_describe(self, engine):
+        # an unbound method can be pickled, unlike a lambda
+        self.df.groupby("key")[["values"]].apply(DataFrame.describe, engine=engine)
+
+
 class ApplyNonUniqueUnsortedIndex:
     def setup(self):
         # GH 46527
@@ -630,6 +646,127 @@ class GroupByNumbaAgg(GroupByCythonAgg):
         self.df.groupby("key").agg(method, engine="numba")
 
 
+class Plan:
+    def setup(self):
+        N = 1_000_000
+        self.df = DataFrame(
+            {
+                "key1": np.random.randint(0, 1000, size=N).astype(str),
+                "key2": np.random.randint(0, 100, size=N),
+                "x": np.random.randn(N),
+                "y": np.random.randn(N),
+            }
+        )
+        self.plan = self.df.groupby(["key1", "key2"]).plan()
+
+    def time_groupby_sum(self):
+        self.df.groupby(["key1", "key2"]).sum()
+
+    def time_plan_sum(self):
+        self.df.groupby(self.plan).sum()
+
+
+class SortedKeys:
+    param_names = ["dtype", "method"]
+    params = [["int64", "float64"], ["sum", "max", "mean"]]
+
+    def setup(self, dtype, method):
+        N = 1_000_000
+        self.df = DataFrame(
+            {
+                "key": np.sort(np.random.randint(0, 10_000, size=N)),
+                "values": np.random.randint(0, 100, size=N).astype(dtype),
+            }
+        )
+
+    def time_sorted_keys(self, dtype, method):
+        getattr(self.df.groupby("key"), method)()
+
+
+class GroupByCythonAggThreads:
+    """
+    Benchmarks for the cython aggregations splitting the columns of wide
+    blocks across threads.
+    """
+
+    param_names = ["threads", "method"]
+    params = [[1, 4], ["sum", "mean", "var", "min", "cumsum"]]
+
+    def setup(self, threads, method):
+        N = 200_000
+        df = DataFrame(np.random.randn(N, 200))
+        self.keys = np.random.randint(0, 1000, size=N)
+        self.df = df
+
+    def time_frame_agg(self, threads, method):
+        with option_context("compute.groupby_threads", threads):
+            getattr(self.df.groupby(self.keys), method)()
+
+
+class GroupByCythonAggList:
+    """
+    Benchmarks for the aggregation with a list of reductions computed with a
+    single pass over the data.
+    """
+
+    param_names = ["funcs"]
+    params = ["all", "mean_std"]
+    func_lists = {
+        "all": ["sum", "mean", "std", "min", "max", "count"],
+        "mean_std": ["mean", "std"],
+    }
+
+    def setup(self, funcs):
+        N = 1_000_000
+        self.df = DataFrame(np.random.randn(N, 8))
+        self.keys = np.random.randint(0, 1000, size=N)
+
+    def time_frame_agg(self, funcs):
+        self.df.groupby(self.keys).agg(self.func_lists[funcs])
+
+    def time_series_agg(self, funcs):
+        self.df[0].groupby(self.keys).agg(self.func_lists[funcs])
+
+
+class Quantile:
+    param_names = ["method"]
+    params = ["exact", "ddsketch"]
+
+    def setup(self, method):
+        N = 1_000_000
+        self.df = DataFrame(np.random.lognormal(size=(N, 4)))
+        self.keys = np.random.randint(0, 1000, size=N)
+
+    def time_quantile(self, method):
+        self.df.groupby(self.keys).quantile([0.5, 0.99], method=method)
+
+
+class Nunique:
+    param_names = ["method"]
+    params = ["exact", "approx"]
+
+    def setup(self, method):
+        N = 1_000_000
+        self.ser = Series(np.random.randint(0, 100_000, size=N))
+        self.keys = np.random.randint(0, 100, size=N)
+
+    def time_nunique(self, method):
+        self.ser.groupby(self.keys).nunique(method=method)
+
+
+class NLargest:
+    param_names = ["method", "keep"]
+    params = [["nlargest", "nsmallest"], ["first", "all"]]
+
+    def setup(self, method, keep):
+        N = 1_000_000
+        self.ser = Series(np.random.randn(N))
+        self.keys = np.random.randint(0, 100_000, size=N)
+
+    def time_nselect(self, method, keep):
+        getattr(self.ser.groupby(self.keys), method)(3, keep=keep)
+
+
 class GroupByCythonAggEaDtypes:
     """
     Benchmarks specifically targeting our cython aggregation algorithms
@@ -623,4 +623,26 @@ class ReadCSVCParserLowMemory:
         read_csv(self.csv, engine="c", low_memory=False)
 
 
+class CSVCompressionThreads(BaseIO):
+    fname = "__test__.csv"
+    params = (["gzip", "bz2", "xz", "zstd"], [1, 4])
+    param_names = ["method", "threads"]
+
+    def setup(self, method, threads):
+        if method == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as err:
+                raise NotImplementedError from err
+        self.df = DataFrame(np.random.randn(200_000, 10))
+        self.compression = {"method": method, "threads": threads}
+        self.df.to_csv(self.fname, compression=self.compression)
+
+    def time_to_csv(self, method, threads):
+        self.df.to_csv(self.fname, compression=self.compression)
+
+    def time_read_csv(self, method, threads):
+        read_csv(self.fname, compression=self.compression)
+
+
 from ..pandas_vb_common import setup  # noqa: F401 isort:skip
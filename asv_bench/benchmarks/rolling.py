@@ -323,6 +323,21 @@ class GroupbyLargeGroups:
         self.df.groupby("A").rolling(3).mean()
 
 
+class GroupbyManyGroups:
+    params = [2, "10s"]
+    param_names = ["window"]
+
+    def setup(self, window):
+        N = 1_000_000
+        self.df = pd.DataFrame(
+            {"A": np.random.randint(0, N // 2, N), "B": np.random.randn(N)},
+            index=pd.date_range("2000", periods=N, freq="s"),
+        )
+
+    def time_rolling(self, window):
+        self.df.groupby("A")["B"].rolling(window).sum()
+
+
 class GroupbyEWM:
     params = ["var", "std", "cov", "corr"]
     param_names = ["method"]
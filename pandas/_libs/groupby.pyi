@@ -88,6 +88,37 @@ def group_var(
     is_datetimelike: bool = ...,
     name: str = ...,
 ) -> None: ...
+def group_fused_agg(
+    nobs: np.ndarray,  # int64_t[:, ::1]
+    values: np.ndarray,  # const float64_t[:, :]
+    labels: np.ndarray,  # const intp_t[:]
+    sumx: np.ndarray | None = ...,  # float64_t[:, ::1]
+    ssqdm: np.ndarray | None = ...,  # float64_t[:, ::1]
+    minx: np.ndarray | None = ...,  # float64_t[:, ::1]
+    maxx: np.ndarray | None = ...,  # float64_t[:, ::1]
+) -> None: ...
+def group_nunique(
+    out: np.ndarray,  # int64_t[::1]
+    codes: np.ndarray,  # const intp_t[::1]
+    labels: np.ndarray,  # const intp_t[::1]
+    sorter: np.ndarray,  # const intp_t[::1]
+    ncodes: int,
+) -> None: ...
+def group_hll(
+    registers: np.ndarray,  # uint8_t[:, ::1]
+    hashes: np.ndarray,  # const uint64_t[::1]
+    labels: np.ndarray,  # const intp_t[::1]
+) -> None: ...
+def group_nselect(
+    out: np.ndarray,  # intp_t[:, ::1]
+    counts: np.ndarray,  # int64_t[::1]
+    values: np.ndarray,  # const numeric_t[::1]
+    mask: np.ndarray,  # const uint8_t[::1]
+    labels: np.ndarray,  # const intp_t[::1]
+    sizes: np.ndarray,  # const int64_t[::1]
+    largest: bool,
+    keep_last: bool,
+) -> None: ...
 def group_skew(
     out: np.ndarray,  # float64_t[:, ::1]
     counts: np.ndarray,  # int64_t[::1]
@@ -907,6 +907,336 @@ def group_var(
                         out[i, j] /= (ct - ddof)
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_fused_agg(
+    int64_t[:, ::1] nobs,
+    const float64_t[:, :] values,
+    const intp_t[::1] labels,
+    float64_t[:, ::1] sumx=None,
+    float64_t[:, ::1] ssqdm=None,
+    float64_t[:, ::1] minx=None,
+    float64_t[:, ::1] maxx=None,
+) -> None:
+    """
+    Accumulate several reductions of each group in a single pass over values.
+
+    Only the accumulators that are passed are computed, with the same arithmetic
+    as the kernels of the single reductions, so that the results are identical.
+
+    Parameters
+    ----------
+    nobs : np.ndarray[np.int64, ndim=2]
+        Number of non-NA values of each group, updated in place.
+    values : np.ndarray[np.float64, ndim=2]
+        Values to aggregate.
+    labels : np.ndarray[np.intp]
+        Labels to group by.
+    sumx : np.ndarray[np.float64, ndim=2], optional
+        Kahan sum of each group, as in group_sum and group_mean.
+    ssqdm : np.ndarray[np.float64, ndim=2], optional
+        Sum of the squared deviations from the mean of each group, computed with
+        Welford's algorithm as in group_var.
+    minx, maxx : np.ndarray[np.float64, ndim=2], optional
+        Minimum and maximum of each group, as in group_min_max. Must be
+        initialized to inf and -inf respectively.
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val, y, t, oldmean
+        float64_t[:, ::1] compensation, mean
+        bint do_sum = sumx is not None
+        bint do_var = ssqdm is not None
+        bint do_min = minx is not None
+        bint do_max = maxx is not None
+
+    if len(values) != len(labels):
+        raise ValueError("len(index) != len(labels)")
+
+    N, K = (<object>values).shape
+
+    if do_sum:
+        compensation = np.zeros((<object>nobs).shape, dtype=np.float64)
+    if do_var:
+        mean = np.zeros((<object>nobs).shape, dtype=np.float64)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+                if val != val:
+                    continue
+
+                nobs[lab, j] += 1
+
+                if do_sum:
+                    y = val - compensation[lab, j]
+                    t = sumx[lab, j] + y
+                    compensation[lab, j] = t - sumx[lab, j] - y
+                    if compensation[lab, j] != compensation[lab, j]:
+                        # see group_sum: with +/- infinity the compensation
+                        #  is NaN
+                        compensation[lab, j] = 0.
+                    sumx[lab, j] = t
+
+                if do_var:
+                    oldmean = mean[lab, j]
+                    mean[lab, j] += (val - oldmean) / nobs[lab, j]
+                    ssqdm[lab, j] += (val - mean[lab, j]) * (val - oldmean)
+
+                if do_min and val < minx[lab, j]:
+                    minx[lab, j] = val
+                if do_max and val > maxx[lab, j]:
+                    maxx[lab, j] = val
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_nunique(
+    int64_t[::1] out,
+    const intp_t[::1] codes,
+    const intp_t[::1] labels,
+    const intp_t[::1] sorter,
+    Py_ssize_t ncodes,
+) -> None:
+    """
+    Count the distinct codes of each group.
+
+    The values of each group are visited together, so that a code is new to a
+    group if it was last seen in another group.
+
+    Parameters
+    ----------
+    out : np.ndarray[np.int64]
+        Number of distinct codes of each group, must be initialized to 0.
+    codes : np.ndarray[np.intp]
+        Codes of the factorized values, -1 for the values to skip.
+    labels : np.ndarray[np.intp]
+        Labels to group by.
+    sorter : np.ndarray[np.intp]
+        Positions of the values with non-negative labels, ordered by label.
+    ncodes : int
+        Number of distinct codes.
+    """
+    cdef:
+        Py_ssize_t i, pos, lab, code
+        intp_t[::1] last_label = np.full(ncodes, -1, dtype=np.intp)
+
+    if len(codes) != len(labels):
+        raise ValueError("len(index) != len(labels)")
+
+    with nogil:
+        for i in range(len(sorter)):
+            pos = sorter[i]
+            code = codes[pos]
+            if code < 0:
+                continue
+            lab = labels[pos]
+            if last_label[code] != lab:
+                last_label[code] = lab
+                out[lab] += 1
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_hll(
+    uint8_t[:, ::1] registers,
+    const uint64_t[::1] hashes,
+    const intp_t[::1] labels,
+) -> None:
+    """
+    Update the HyperLogLog registers of each group with hashed values.
+
+    The first bits of a hash select a register, which keeps the maximum rank of
+    the first set bit of the remaining bits.
+
+    Parameters
+    ----------
+    registers : np.ndarray[np.uint8, ndim=2]
+        Registers of each group, updated in place. The number of registers must
+        be a power of 2.
+    hashes : np.ndarray[np.uint64]
+        64-bit hashes of the values.
+    labels : np.ndarray[np.intp]
+        Labels to group by, -1 for the values to skip.
+    """
+    cdef:
+        Py_ssize_t i, lab, N = len(hashes)
+        int precision = (<object>registers).shape[1].bit_length() - 1
+        int max_rank = 64 - precision + 1
+        uint64_t h, idx, top = (<uint64_t>1) << 63
+        uint8_t rank
+
+    if len(hashes) != len(labels):
+        raise ValueError("len(index) != len(labels)")
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+            h = hashes[i]
+            idx = h >> (64 - precision)
+            h = h << precision
+            rank = 1
+            while rank < max_rank and not (h & top):
+                h = h << 1
+                rank += 1
+            if rank > registers[lab, idx]:
+                registers[lab, idx] = rank
+
+
+cdef inline bint _nselect_worse(
+    const numeric_t[::1] values,
+    const uint8_t[::1] mask,
+    intp_t a,
+    intp_t b,
+    bint largest,
+    bint tie_last,
+) noexcept nogil:
+    # whether the row a comes after the row b in the result: the missing values
+    #  come last in their original order, and the ties are ordered by position
+    if mask[a] or mask[b]:
+        if mask[a] and mask[b]:
+            return a > b
+        return mask[a]
+    if values[a] != values[b]:
+        if largest:
+            return values[a] < values[b]
+        return values[a] > values[b]
+    if tie_last:
+        return a < b
+    return a > b
+
+
+cdef inline void _nselect_sift_down(
+    intp_t[:, ::1] heap,
+    Py_ssize_t lab,
+    Py_ssize_t start,
+    Py_ssize_t size,
+    const numeric_t[::1] values,
+    const uint8_t[::1] mask,
+    bint largest,
+    bint tie_last,
+) noexcept nogil:
+    # the root of the heap is the row coming last in the result
+    cdef:
+        Py_ssize_t child, i = start
+        intp_t tmp
+
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _nselect_worse(
+            values, mask, heap[lab, child + 1], heap[lab, child], largest, tie_last
+        ):
+            child += 1
+        if not _nselect_worse(
+            values, mask, heap[lab, child], heap[lab, i], largest, tie_last
+        ):
+            break
+        tmp = heap[lab, i]
+        heap[lab, i] = heap[lab, child]
+        heap[lab, child] = tmp
+        i = child
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_nselect(
+    intp_t[:, ::1] out,
+    int64_t[::1] counts,
+    const numeric_t[::1] values,
+    const uint8_t[::1] mask,
+    const intp_t[::1] labels,
+    const int64_t[::1] sizes,
+    bint largest,
+    bint keep_last,
+) -> None:
+    """
+    Select the positions of the n largest or smallest values of each group.
+
+    A bounded heap of the rows selected so far is kept per group, so that the
+    values are visited once. The rows with missing values are selected after
+    the other rows, in their original order, as in :meth:`Series.nlargest`.
+
+    Parameters
+    ----------
+    out : np.ndarray[np.intp, ndim=2]
+        Array of shape ``(ngroups, n)`` to store the selected positions of each
+        group, in the order of the result.
+    counts : np.ndarray[np.int64]
+        Number of selected positions of each group, must be initialized to 0.
+    values : np.ndarray[numeric_t]
+        Values to select from.
+    mask : np.ndarray[np.uint8]
+        Whether each value is missing.
+    labels : np.ndarray[np.intp]
+        Labels to group by, -1 for the values to skip.
+    sizes : np.ndarray[np.int64]
+        Number of values of each group.
+    largest : bool
+        Select the largest rather than the smallest values.
+    keep_last : bool
+        Select the last rather than the first of tied values, in the groups
+        with more than n values.
+    """
+    cdef:
+        Py_ssize_t i, j, lab, cnt, N = len(labels), n = out.shape[1]
+        intp_t tmp
+        bint tie_last
+
+    if len(values) != N:
+        raise ValueError("len(index) != len(labels)")
+    if n == 0:
+        return
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+            cnt = counts[lab]
+            if cnt < n:
+                # sift up the new row
+                j = cnt
+                out[lab, j] = i
+                while j > 0 and _nselect_worse(
+                    values, mask, out[lab, j], out[lab, (j - 1) // 2],
+                    largest, keep_last
+                ):
+                    tmp = out[lab, j]
+                    out[lab, j] = out[lab, (j - 1) // 2]
+                    out[lab, (j - 1) // 2] = tmp
+                    j = (j - 1) // 2
+                counts[lab] = cnt + 1
+            elif _nselect_worse(values, mask, out[lab, 0], i, largest, keep_last):
+                out[lab, 0] = i
+                _nselect_sift_down(out, lab, 0, n, values, mask, largest, keep_last)
+
+        # sort each heap, moving the root to the end, the groups with at most
+        #  n values keep the ties in their original order
+        for lab in range(len(counts)):
+            cnt = counts[lab]
+            tie_last = keep_last and sizes[lab] > n
+            if tie_last != keep_last:
+                for j in range(cnt // 2 - 1, -1, -1):
+                    _nselect_sift_down(
+                        out, lab, j, cnt, values, mask, largest, tie_last
+                    )
+            for j in range(cnt - 1, 0, -1):
+                tmp = out[lab, 0]
+                out[lab, 0] = out[lab, j]
+                out[lab, j] = tmp
+                _nselect_sift_down(out, lab, 0, j, values, mask, largest, tie_last)
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 @cython.cdivision(True)
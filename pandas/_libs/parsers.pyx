@@ -107,6 +107,8 @@ from pandas.core.dtypes.inference import is_dict_like
 
 from pandas.core.arrays.boolean import BooleanDtype
 
+from pandas.io.instrumentation import io_stage
+
 cdef:
     float64_t INF = <float64_t>np.inf
     float64_t NEGINF = -INF
@@ -888,25 +890,29 @@ cdef class TextReader:
             int64_t buffered_lines
             int64_t irows
 
-        if rows is not None:
-            irows = rows
-            buffered_lines = self.parser.lines - self.parser_start
-            if buffered_lines < irows:
-                self._tokenize_rows(irows - buffered_lines)
+        with io_stage("tokenize"):
+            if rows is not None:
+                irows = rows
+                buffered_lines = self.parser.lines - self.parser_start
+                if buffered_lines < irows:
+                    self._tokenize_rows(irows - buffered_lines)
 
-            if self.skipfooter > 0:
-                raise ValueError("skipfooter can only be used to read "
-                                 "the whole file")
-        else:
-            with nogil:
-                status = tokenize_all_rows(self.parser, self.encoding_errors)
+                if self.skipfooter > 0:
+                    raise ValueError("skipfooter can only be used to read "
+                                     "the whole file")
+            else:
+                with nogil:
+                    status = tokenize_all_rows(self.parser, self.encoding_errors)
 
-            self._check_tokenize_status(status)
+                self._check_tokenize_status(status)
 
         if self.parser_start >= self.parser.lines:
             raise StopIteration
 
-        columns = self._convert_column_data(rows)
+        with io_stage("convert") as stage:
+            columns = self._convert_column_data(rows)
+            if len(columns) > 0:
+                stage.record(rows=len(next(iter(columns.values()))))
         if len(columns) > 0:
             rows_read = len(list(columns.values())[0])
             # trim
@@ -1,5 +1,6 @@
 # cython: language_level=3, initializedcheck=False
 # cython: warn.maybe_uninitialized=True, warn.unused=True
+cimport cython
 from cython cimport Py_ssize_t
 from libc.stddef cimport size_t
 from libc.stdint cimport (
@@ -13,6 +14,12 @@ from libc.stdlib cimport (
     calloc,
     free,
 )
+from libc.string cimport (
+    memcpy,
+    memset,
+)
+
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -58,176 +65,254 @@ cdef buf_free(Buffer buf):
     if buf.data != NULL:
         free(buf.data)
 
+# Status codes returned by the decompressors. These run without the GIL, so
+# they cannot raise; callers translate the codes with check_decompress_status.
+cdef enum DecompressStatus:
+    decompress_read_error = -1
+    decompress_write_error = -2
+    decompress_control_byte_error = -3
+
+
+cdef inline bint can_read(Buffer buf, size_t offset, size_t length) noexcept nogil:
+    return offset + length <= buf.length
+
+
+cdef inline bint can_write(Buffer buf, size_t offset, size_t length) noexcept nogil:
+    return offset + length <= buf.length
+
+
+cdef int check_decompress_status(int status) except -1:
+    if status == decompress_read_error:
+        raise AssertionError("Out of bounds read")
+    elif status == decompress_write_error:
+        raise AssertionError("Out of bounds write")
+    elif status == decompress_control_byte_error:
+        raise ValueError("unknown control byte in compressed row")
+    return status
+
+
 # rle_decompress decompresses data using a Run Length Encoding
 # algorithm.  It is partially documented here:
 #
 # https://cran.r-project.org/package=sas7bdat/vignettes/sas7bdat.pdf
 # Licence at LICENSES/SAS7BDAT_LICENSE
-cdef int rle_decompress(Buffer inbuff, Buffer outbuff) except? 0:
+cdef int rle_decompress(Buffer inbuff, Buffer outbuff) noexcept nogil:
+    # Returns the number of bytes written or a negative DecompressStatus.
 
     cdef:
         uint8_t control_byte, x
-        int rpos = 0
-        int i, nbytes, end_of_first_byte
+        size_t rpos = 0
         size_t ipos = 0
-        Py_ssize_t _
+        size_t nbytes, end_of_first_byte
 
     while ipos < inbuff.length:
-        control_byte = buf_get(inbuff, ipos) & 0xF0
-        end_of_first_byte = <int>(buf_get(inbuff, ipos) & 0x0F)
+        control_byte = inbuff.data[ipos] & 0xF0
+        end_of_first_byte = <size_t>(inbuff.data[ipos] & 0x0F)
         ipos += 1
 
         if control_byte == 0x00:
-            nbytes = <int>(buf_get(inbuff, ipos)) + 64 + end_of_first_byte * 256
+            if not can_read(inbuff, ipos, 1):
+                return decompress_read_error
+            nbytes = <size_t>inbuff.data[ipos] + 64 + end_of_first_byte * 256
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos))
-                rpos += 1
-                ipos += 1
+            if not can_read(inbuff, ipos, nbytes):
+                return decompress_read_error
+            if not can_write(outbuff, rpos, nbytes):
+                return decompress_write_error
+            memcpy(&outbuff.data[rpos], &inbuff.data[ipos], nbytes)
+            rpos += nbytes
+            ipos += nbytes
         elif control_byte == 0x40:
             # not documented
-            nbytes = <int>(buf_get(inbuff, ipos)) + 18 + end_of_first_byte * 256
-            ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos))
-                rpos += 1
-            ipos += 1
-        elif control_byte == 0x60:
-            nbytes = end_of_first_byte * 256 + <int>(buf_get(inbuff, ipos)) + 17
-            ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x20)
-                rpos += 1
-        elif control_byte == 0x70:
-            nbytes = end_of_first_byte * 256 + <int>(buf_get(inbuff, ipos)) + 17
+            if not can_read(inbuff, ipos, 2):
+                return decompress_read_error
+            nbytes = <size_t>inbuff.data[ipos] + 18 + end_of_first_byte * 256
+            x = inbuff.data[ipos + 1]
+            ipos += 2
+            if not can_write(outbuff, rpos, nbytes):
+                return decompress_write_error
+            memset(&outbuff.data[rpos], x, nbytes)
+            rpos += nbytes
+        elif control_byte == 0x60 or control_byte == 0x70:
+            if not can_read(inbuff, ipos, 1):
+                return decompress_read_error
+            nbytes = end_of_first_byte * 256 + <size_t>inbuff.data[ipos] + 17
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x00)
-                rpos += 1
-        elif control_byte == 0x80:
-            nbytes = end_of_first_byte + 1
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0x90:
-            nbytes = end_of_first_byte + 17
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0xA0:
-            nbytes = end_of_first_byte + 33
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
-            ipos += nbytes
-        elif control_byte == 0xB0:
-            nbytes = end_of_first_byte + 49
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
+            if not can_write(outbuff, rpos, nbytes):
+                return decompress_write_error
+            memset(&outbuff.data[rpos], 0x20 if control_byte == 0x60 else 0x00, nbytes)
+            rpos += nbytes
+        elif (
+            control_byte == 0x80
+            or control_byte == 0x90
+            or control_byte == 0xA0
+            or control_byte == 0xB0
+        ):
+            # literal runs of 1-16, 17-32, 33-48 and 49-64 bytes
+            nbytes = end_of_first_byte + 1 + 16 * ((control_byte - 0x80) >> 4)
+            if not can_read(inbuff, ipos, nbytes):
+                return decompress_read_error
+            if not can_write(outbuff, rpos, nbytes):
+                return decompress_write_error
+            memcpy(&outbuff.data[rpos], &inbuff.data[ipos], nbytes)
+            rpos += nbytes
             ipos += nbytes
         elif control_byte == 0xC0:
             nbytes = end_of_first_byte + 3
-            x = buf_get(inbuff, ipos)
+            if not can_read(inbuff, ipos, 1):
+                return decompress_read_error
+            x = inbuff.data[ipos]
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, x)
-                rpos += 1
-        elif control_byte == 0xD0:
-            nbytes = end_of_first_byte + 2
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x40)
-                rpos += 1
-        elif control_byte == 0xE0:
-            nbytes = end_of_first_byte + 2
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x20)
-                rpos += 1
-        elif control_byte == 0xF0:
+            if not can_write(outbuff, rpos, nbytes):
+                return decompress_write_error
+            memset(&outbuff.data[rpos], x, nbytes)
+            rpos += nbytes
+        elif control_byte == 0xD0 or control_byte == 0xE0 or control_byte == 0xF0:
             nbytes = end_of_first_byte + 2
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x00)
-                rpos += 1
+            if control_byte == 0xD0:
+                x = 0x40
+            elif control_byte == 0xE0:
+                x = 0x20
+            else:
+                x = 0x00
+            if not can_write(outbuff, rpos, nbytes):
+                return decompress_write_error
+            memset(&outbuff.data[rpos], x, nbytes)
+            rpos += nbytes
         else:
-            raise ValueError(f"unknown control byte: {control_byte}")
+            return decompress_control_byte_error
 
-    return rpos
+    return <int>rpos
 
 
 # rdc_decompress decompresses data using the Ross Data Compression algorithm:
 #
 # http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
-cdef int rdc_decompress(Buffer inbuff, Buffer outbuff) except? 0:
+cdef int rdc_decompress(Buffer inbuff, Buffer outbuff) noexcept nogil:
+    # Returns the number of bytes written or a negative DecompressStatus.
 
     cdef:
         uint8_t cmd
         uint16_t ctrl_bits = 0, ctrl_mask = 0, ofs, cnt
-        int rpos = 0, k, ii
+        size_t rpos = 0, k
         size_t ipos = 0
 
-    ii = -1
-
     while ipos < inbuff.length:
-        ii += 1
         ctrl_mask = ctrl_mask >> 1
         if ctrl_mask == 0:
-            ctrl_bits = ((<uint16_t>buf_get(inbuff, ipos) << 8) +
-                         <uint16_t>buf_get(inbuff, ipos + 1))
+            if not can_read(inbuff, ipos, 2):
+                return decompress_read_error
+            ctrl_bits = ((<uint16_t>inbuff.data[ipos] << 8) +
+                         <uint16_t>inbuff.data[ipos + 1])
             ipos += 2
             ctrl_mask = 0x8000
 
+        if not can_read(inbuff, ipos, 1):
+            return decompress_read_error
+
         if ctrl_bits & ctrl_mask == 0:
-            buf_set(outbuff, rpos, buf_get(inbuff, ipos))
+            if not can_write(outbuff, rpos, 1):
+                return decompress_write_error
+            outbuff.data[rpos] = inbuff.data[ipos]
             ipos += 1
             rpos += 1
             continue
 
-        cmd = (buf_get(inbuff, ipos) >> 4) & 0x0F
-        cnt = <uint16_t>(buf_get(inbuff, ipos) & 0x0F)
+        cmd = (inbuff.data[ipos] >> 4) & 0x0F
+        cnt = <uint16_t>(inbuff.data[ipos] & 0x0F)
         ipos += 1
 
         # short RLE
         if cmd == 0:
             cnt += 3
-            for k in range(cnt):
-                buf_set(outbuff, rpos + k, buf_get(inbuff, ipos))
+            if not can_read(inbuff, ipos, 1):
+                return decompress_read_error
+            if not can_write(outbuff, rpos, cnt):
+                return decompress_write_error
+            memset(&outbuff.data[rpos], inbuff.data[ipos], cnt)
             rpos += cnt
             ipos += 1
 
         # long RLE
         elif cmd == 1:
-            cnt += <uint16_t>buf_get(inbuff, ipos) << 4
+            if not can_read(inbuff, ipos, 2):
+                return decompress_read_error
+            cnt += <uint16_t>inbuff.data[ipos] << 4
             cnt += 19
             ipos += 1
-            for k in range(cnt):
-                buf_set(outbuff, rpos + k, buf_get(inbuff, ipos))
+            if not can_write(outbuff, rpos, cnt):
+                return decompress_write_error
+            memset(&outbuff.data[rpos], inbuff.data[ipos], cnt)
             rpos += cnt
             ipos += 1
 
         # long pattern
         elif cmd == 2:
+            if not can_read(inbuff, ipos, 2):
+                return decompress_read_error
             ofs = cnt + 3
-            ofs += <uint16_t>buf_get(inbuff, ipos) << 4
+            ofs += <uint16_t>inbuff.data[ipos] << 4
             ipos += 1
-            cnt = <uint16_t>buf_get(inbuff, ipos)
+            cnt = <uint16_t>inbuff.data[ipos]
             ipos += 1
             cnt += 16
+            if ofs > rpos:
+                return decompress_read_error
+            if not can_write(outbuff, rpos, cnt):
+                return decompress_write_error
+            # the source and destination may overlap, copy byte by byte
             for k in range(cnt):
-                buf_set(outbuff, rpos + k, buf_get(outbuff, rpos - <int>ofs + k))
+                outbuff.data[rpos + k] = outbuff.data[rpos - ofs + k]
             rpos += cnt
 
         # short pattern
         else:
+            if not can_read(inbuff, ipos, 1):
+                return decompress_read_error
             ofs = cnt + 3
-            ofs += <uint16_t>buf_get(inbuff, ipos) << 4
+            ofs += <uint16_t>inbuff.data[ipos] << 4
             ipos += 1
+            if ofs > rpos:
+                return decompress_read_error
+            if not can_write(outbuff, rpos, cmd):
+                return decompress_write_error
             for k in range(cmd):
-                buf_set(outbuff, rpos + k, buf_get(outbuff, rpos - <int>ofs + k))
+                outbuff.data[rpos + k] = outbuff.data[rpos - ofs + k]
             rpos += cmd
 
-    return rpos
+    return <int>rpos
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef bint decompress_rows(
+    int (*decompress)(Buffer, Buffer) noexcept nogil,
+    const uint8_t[:] source,
+    const int64_t[:] source_offsets,
+    const int64_t[:] source_lengths,
+    uint8_t[:, :] rows,
+    Py_ssize_t start,
+    Py_ssize_t stop,
+    Py_ssize_t *failed_row,
+    int *failed_result,
+) noexcept nogil:
+    # Decompress the staged rows [start, stop) into rows[start:stop]. On
+    # failure, the row and the decompressor's result are reported back.
+    cdef:
+        Py_ssize_t i
+        size_t row_length = rows.shape[1]
+        int rpos
+        Buffer inbuff, outbuff
+
+    for i in range(start, stop):
+        inbuff = Buffer(<uint8_t *>&source[source_offsets[i]], source_lengths[i])
+        outbuff = Buffer(&rows[i, 0], row_length)
+        rpos = decompress(inbuff, outbuff)
+        if rpos < 0 or <size_t>rpos != row_length:
+            failed_row[0] = i
+            failed_result[0] = rpos
+            return False
+    return True
 
 
 cdef enum ColumnTypes:
@@ -235,6 +320,11 @@ cdef enum ColumnTypes:
     column_type_string = 2
 
 
+# Number of compressed rows collected before they are decompressed on the
+# thread pool when reading with nthreads > 1.
+cdef Py_ssize_t decompress_batch_rows = 8192
+
+
 # Const aliases
 assert len(const.page_meta_types) == 2
 cdef:
@@ -324,8 +414,19 @@ cdef class Parser:
         int subheader_pointer_length
         int current_page_type
         bint is_little_endian
-        int (*decompress)(Buffer, Buffer) except? 0
+        int (*decompress)(Buffer, Buffer) noexcept nogil
         object parser
+        # compressed rows staged for multi-threaded decompression
+        int nthreads
+        bint stage_compressed_rows
+        object executor
+        uint8_t[:] staged_source
+        int64_t[:] staged_offsets
+        int64_t[:] staged_lengths
+        int64_t[:] staged_rows
+        uint8_t[:, :] staged_decompressed
+        Py_ssize_t staged_count
+        int64_t staged_position
 
     def __init__(self, object parser):
         cdef:
@@ -368,6 +469,12 @@ cdef class Parser:
         else:
             self.decompress = NULL
 
+        self.nthreads = parser.nthreads
+        self.stage_compressed_rows = False
+        self.executor = None
+        self.staged_count = 0
+        self.staged_position = 0
+
         # update to current state of the parser
         self.current_row_in_chunk_index = parser._current_row_in_chunk_index
         self.current_row_in_file_index = parser._current_row_in_file_index
@@ -376,12 +483,33 @@ cdef class Parser:
     def read(self, int nrows):
         cdef:
             bint done
-            Py_ssize_t _
-
-        for _ in range(nrows):
-            done = self.readline()
-            if done:
-                break
+            Py_ssize_t _, batch
+
+        if self.nthreads > 1 and self.decompress != NULL:
+            # Compressed rows are staged as they are found on the pages and
+            # decompressed in batches on a thread pool without the GIL.
+            batch = min(nrows, decompress_batch_rows)
+            self.staged_source = np.empty(batch * self.row_length, dtype=np.uint8)
+            self.staged_offsets = np.empty(batch, dtype=np.int64)
+            self.staged_lengths = np.empty(batch, dtype=np.int64)
+            self.staged_rows = np.empty(batch, dtype=np.int64)
+            self.staged_decompressed = np.empty(
+                (batch, self.row_length), dtype=np.uint8
+            )
+            self.executor = ThreadPoolExecutor(max_workers=self.nthreads)
+            self.stage_compressed_rows = True
+
+        try:
+            for _ in range(nrows):
+                done = self.readline()
+                if done:
+                    break
+            self.flush_staged_rows()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+            self.stage_compressed_rows = False
 
         # update the parser
         self.parser._current_row_on_page_index = self.current_row_on_page_index
@@ -480,38 +608,121 @@ cdef class Parser:
     cdef void process_byte_array_with_data(self, int offset, int length) except *:
 
         cdef:
-            Py_ssize_t j
-            int s, k, m, jb, js, current_row, rpos
-            int64_t lngt, start, ct
+            int rpos
             Buffer source, decompressed_source
-            int64_t[:] column_types
-            int64_t[:] lengths
-            int64_t[:] offsets
-            uint8_t[:, :] byte_chunk
-            object[:, :] string_chunk
             bint compressed
 
         assert offset + length <= self.cached_page_len, "Out of bounds read"
         source = Buffer(&self.cached_page[offset], length)
 
         compressed = self.decompress != NULL and length < self.row_length
-        if compressed:
+        if compressed and self.stage_compressed_rows:
+            self.stage_row(source)
+        elif compressed:
             decompressed_source = buf_new(self.row_length)
-            rpos = self.decompress(source, decompressed_source)
-            if rpos != self.row_length:
-                raise ValueError(
-                    f"Expected decompressed line of length {self.row_length} bytes "
-                    f"but decompressed {rpos} bytes"
-                )
-            source = decompressed_source
+            try:
+                with nogil:
+                    rpos = self.decompress(source, decompressed_source)
+                self.check_decompressed(rpos)
+                self.process_row(decompressed_source, self.current_row_in_chunk_index)
+            finally:
+                buf_free(decompressed_source)
+        else:
+            self.process_row(source, self.current_row_in_chunk_index)
+
+        self.current_row_on_page_index += 1
+        self.current_row_in_chunk_index += 1
+        self.current_row_in_file_index += 1
+
+    cdef check_decompressed(self, int rpos):
+        check_decompress_status(rpos)
+        if rpos != self.row_length:
+            raise ValueError(
+                f"Expected decompressed line of length {self.row_length} bytes "
+                f"but decompressed {rpos} bytes"
+            )
+
+    cdef stage_row(self, Buffer source):
+        cdef Py_ssize_t i
+
+        if self.staged_count == len(self.staged_rows):
+            self.flush_staged_rows()
+        i = self.staged_count
+        memcpy(&self.staged_source[self.staged_position], source.data, source.length)
+        self.staged_offsets[i] = self.staged_position
+        self.staged_lengths[i] = source.length
+        self.staged_rows[i] = self.current_row_in_chunk_index
+        self.staged_position += source.length
+        self.staged_count += 1
+
+    def decompress_staged_rows(self, Py_ssize_t start, Py_ssize_t stop):
+        cdef:
+            const uint8_t[:] source = self.staged_source
+            const int64_t[:] offsets = self.staged_offsets
+            const int64_t[:] lengths = self.staged_lengths
+            uint8_t[:, :] rows = self.staged_decompressed
+            Py_ssize_t failed_row = -1
+            int failed_result = 0
+            bint ok
+
+        with nogil:
+            ok = decompress_rows(
+                self.decompress,
+                source,
+                offsets,
+                lengths,
+                rows,
+                start,
+                stop,
+                &failed_row,
+                &failed_result,
+            )
+        if not ok:
+            self.check_decompressed(failed_result)
+
+    cdef flush_staged_rows(self):
+        cdef:
+            Py_ssize_t i, n = self.staged_count, step
+
+        if n == 0:
+            return
+
+        step = -(-n // self.nthreads)
+        futures = [
+            self.executor.submit(
+                self.decompress_staged_rows, start, min(start + step, n)
+            )
+            for start in range(0, n, step)
+        ]
+        for future in futures:
+            future.result()
+
+        for i in range(n):
+            self.process_row(
+                Buffer(&self.staged_decompressed[i, 0], self.row_length),
+                self.staged_rows[i],
+            )
+        self.staged_count = 0
+        self.staged_position = 0
+
+    cdef void process_row(self, Buffer source, int current_row) except *:
+
+        cdef:
+            Py_ssize_t j
+            int s, k, m, jb, js
+            int64_t lngt, start, ct
+            int64_t[:] column_types
+            int64_t[:] lengths
+            int64_t[:] offsets
+            uint8_t[:, :] byte_chunk
+            object[:, :] string_chunk
 
-        current_row = self.current_row_in_chunk_index
         column_types = self.column_types
         lengths = self.lengths
         offsets = self.offsets
         byte_chunk = self.byte_chunk
         string_chunk = self.string_chunk
-        s = 8 * self.current_row_in_chunk_index
+        s = 8 * current_row
         js = 0
         jb = 0
         for j in range(self.column_count):
@@ -540,10 +751,3 @@ cdef class Parser:
                 else:
                     string_chunk[js, current_row] = buf_as_bytes(source, start, lngt)
                 js += 1
-
-        self.current_row_on_page_index += 1
-        self.current_row_in_chunk_index += 1
-        self.current_row_in_file_index += 1
-
-        if compressed:
-            buf_free(decompressed_source)
@@ -10,3 +10,10 @@ def calculate_variable_window_bounds(
     closed: str | None,
     index: np.ndarray,  # const int64_t[:]
 ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: ...
+def calculate_grouped_variable_window_bounds(
+    sizes: np.ndarray,  # const int64_t[:]
+    window_size: int,  # int64_t
+    center: bool,
+    closed: str | None,
+    index: np.ndarray,  # const int64_t[:]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: ...
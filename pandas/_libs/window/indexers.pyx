@@ -46,15 +46,90 @@ def calculate_variable_window_bounds(
     (ndarray[int64], ndarray[int64])
     """
     cdef:
-        bint left_closed = False
-        bint right_closed = False
+        bint left_closed, right_closed
         ndarray[int64_t, ndim=1] start, end
-        int64_t start_bound, end_bound, index_growth_sign = 1
-        Py_ssize_t i, j
 
     if num_values <= 0:
         return np.empty(0, dtype="int64"), np.empty(0, dtype="int64")
 
+    left_closed, right_closed = _closed_sides(closed, center, window_size)
+
+    start = np.empty(num_values, dtype="int64")
+    end = np.empty(num_values, dtype="int64")
+    _variable_window_bounds(
+        start, end, num_values, window_size, center, left_closed, right_closed, index
+    )
+    return start, end
+
+
+def calculate_grouped_variable_window_bounds(
+    const int64_t[:] sizes,
+    int64_t window_size,
+    bint center,
+    str closed,
+    const int64_t[:] index
+):
+    """
+    Calculate window boundaries for rolling windows from a time offset, over
+    groups of consecutive values, the windows restarting at each group.
+
+    Parameters
+    ----------
+    sizes : ndarray[int64]
+        number of values of each group, in the order of the values
+
+    window_size : int64
+        window size calculated from the offset
+
+    center : bint
+        center the rolling window on the current observation
+
+    closed : str
+        string of side of the window that should be closed
+
+    index : ndarray[int64]
+        time series index to roll over, monotonic within each group
+
+    Returns
+    -------
+    (ndarray[int64], ndarray[int64])
+    """
+    cdef:
+        bint left_closed, right_closed
+        int64_t[::1] start, end
+        Py_ssize_t i, k, offset = 0, num_values = len(index)
+        int64_t n
+
+    left_closed, right_closed = _closed_sides(closed, center, window_size)
+
+    start = np.empty(num_values, dtype="int64")
+    end = np.empty(num_values, dtype="int64")
+    with nogil:
+        for k in range(len(sizes)):
+            n = sizes[k]
+            if n > 0:
+                _variable_window_bounds(
+                    start[offset:offset + n],
+                    end[offset:offset + n],
+                    n,
+                    window_size,
+                    center,
+                    left_closed,
+                    right_closed,
+                    index[offset:offset + n],
+                )
+                for i in range(offset, offset + n):
+                    start[i] += offset
+                    end[i] += offset
+            offset += n
+    return np.asarray(start), np.asarray(end)
+
+
+cdef tuple _closed_sides(str closed, bint center, int64_t window_size):
+    cdef:
+        bint left_closed = False
+        bint right_closed = False
+
     # default is 'right'
     if closed is None:
         closed = "right"
@@ -73,14 +148,26 @@ def calculate_variable_window_bounds(
         right_closed = True
         left_closed = True
 
+    return left_closed, right_closed
+
+
+cdef void _variable_window_bounds(
+    int64_t[:] start,
+    int64_t[:] end,
+    int64_t num_values,
+    int64_t window_size,
+    bint center,
+    bint left_closed,
+    bint right_closed,
+    const int64_t[:] index,
+) noexcept nogil:
+    cdef:
+        int64_t start_bound, end_bound, index_growth_sign = 1
+        Py_ssize_t i, j
+
     if index[num_values - 1] < index[0]:
         index_growth_sign = -1
 
-    start = np.empty(num_values, dtype="int64")
-    start.fill(-1)
-    end = np.empty(num_values, dtype="int64")
-    end.fill(-1)
-
     start[0] = 0
 
     # right endpoint is closed
@@ -100,52 +187,49 @@ def calculate_variable_window_bounds(
                 end[0] = j
                 break
 
-    with nogil:
+    # start is start of slice interval (including)
+    # end is end of slice interval (not including)
+    for i in range(1, num_values):
+        if center:
+            end_bound = index[i] + index_growth_sign * window_size / 2
+            start_bound = index[i] - index_growth_sign * window_size / 2
+        else:
+            end_bound = index[i]
+            start_bound = index[i] - index_growth_sign * window_size
+
+        # left endpoint is closed
+        if left_closed:
+            start_bound -= 1 * index_growth_sign
+
+        # advance the start bound until we are
+        # within the constraint
+        start[i] = i
+        for j in range(start[i - 1], i):
+            if (index[j] - start_bound) * index_growth_sign > 0:
+                start[i] = j
+                break
 
-        # start is start of slice interval (including)
-        # end is end of slice interval (not including)
-        for i in range(1, num_values):
-            if center:
-                end_bound = index[i] + index_growth_sign * window_size / 2
-                start_bound = index[i] - index_growth_sign * window_size / 2
-            else:
-                end_bound = index[i]
-                start_bound = index[i] - index_growth_sign * window_size
-
-            # left endpoint is closed
-            if left_closed:
-                start_bound -= 1 * index_growth_sign
-
-            # advance the start bound until we are
-            # within the constraint
-            start[i] = i
-            for j in range(start[i - 1], i):
-                if (index[j] - start_bound) * index_growth_sign > 0:
-                    start[i] = j
+        # for centered window advance the end bound until we are
+        # outside the constraint
+        if center:
+            for j in range(end[i - 1], num_values + 1):
+                if j == num_values:
+                    end[i] = j
+                elif ((index[j] - end_bound) * index_growth_sign == 0 and
+                      right_closed):
+                    end[i] = j + 1
+                elif (index[j] - end_bound) * index_growth_sign >= 0:
+                    end[i] = j
                     break
-
-            # for centered window advance the end bound until we are
-            # outside the constraint
-            if center:
-                for j in range(end[i - 1], num_values + 1):
-                    if j == num_values:
-                        end[i] = j
-                    elif ((index[j] - end_bound) * index_growth_sign == 0 and
-                          right_closed):
-                        end[i] = j + 1
-                    elif (index[j] - end_bound) * index_growth_sign >= 0:
-                        end[i] = j
-                        break
-            # end bound is previous end
-            # or current index
-            elif index[end[i - 1]] == end_bound and not right_closed:
-                end[i] = end[i - 1] + 1
-            elif (index[end[i - 1]] - end_bound) * index_growth_sign <= 0:
-                end[i] = i + 1
-            else:
-                end[i] = end[i - 1]
-
-            # right endpoint is open
-            if not right_closed and not center:
-                end[i] -= 1
-    return start, end
+        # end bound is previous end
+        # or current index
+        elif index[end[i - 1]] == end_bound and not right_closed:
+            end[i] = end[i - 1] + 1
+        elif (index[end[i - 1]] - end_bound) * index_growth_sign <= 0:
+            end[i] = i + 1
+        else:
+            end[i] = end[i - 1]
+
+        # right endpoint is open
+        if not right_closed and not center:
+            end[i] -= 1
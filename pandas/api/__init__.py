@@ -2,6 +2,7 @@
 
 from pandas.api import (
     extensions,
+    groupby,
     indexers,
     interchange,
     types,
@@ -11,6 +12,7 @@ from pandas.api import (
 __all__ = [
     "interchange",
     "extensions",
+    "groupby",
     "indexers",
     "types",
     "typing",
@@ -0,0 +1,7 @@
+"""
+Public API for incremental groupby aggregations.
+"""
+
+from pandas.core.groupby.incremental import IncrementalAggregator
+
+__all__ = ["IncrementalAggregator"]
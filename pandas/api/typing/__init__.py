@@ -9,6 +9,7 @@ from pandas.core.groupby import (
     DataFrameGroupBy,
     SeriesGroupBy,
 )
+from pandas.core.groupby.grouper import GroupByPlan
 from pandas.core.indexes.frozen import FrozenList
 from pandas.core.resample import (
     DatetimeIndexResamplerGroupby,
@@ -41,6 +42,7 @@ __all__ = [
     "ExponentialMovingWindow",
     "ExponentialMovingWindowGroupby",
     "FrozenList",
+    "GroupByPlan",
     "JsonReader",
     "NaTType",
     "NAType",
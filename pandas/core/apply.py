@@ -1543,6 +1543,41 @@ class GroupByApply(Apply):
         result = self.wrap_results_list_like(keys, results)
         return result
 
+    def compute_list_like(
+        self,
+        op_name: Literal["agg", "apply"],
+        selected_obj: Series | DataFrame,
+        kwargs: dict[str, Any],
+    ) -> tuple[list[Hashable] | Index, list[Any]]:
+        from pandas.core.groupby.base import OutputKey
+        from pandas.core.groupby.generic import DataFrameGroupBy
+
+        obj = self.obj
+        if (
+            op_name == "agg"
+            and isinstance(obj, DataFrameGroupBy)
+            and selected_obj.ndim == 2
+            and not self.args
+            and not kwargs
+        ):
+            # compute the reductions of all columns with a single pass if possible
+            func = cast(list[AggFuncTypeBase], self.func)
+            fused = obj._agg_fused(list(func))
+            if fused is not None:
+                results = []
+                for index, col in enumerate(selected_obj):
+                    colg = obj._gotitem(col, ndim=1, subset=selected_obj.iloc[:, index])
+                    res = {
+                        OutputKey(label=name, position=position): fused[name].iloc[
+                            :, index
+                        ]
+                        for position, name in enumerate(func)
+                    }
+                    results.append(colg._wrap_multiple_funcs(res))
+                return selected_obj.columns, results
+
+        return super().compute_list_like(op_name, selected_obj, kwargs)
+
     def agg_or_apply_dict_like(
         self, op_name: Literal["agg", "apply"]
     ) -> DataFrame | Series:
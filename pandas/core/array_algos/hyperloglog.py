@@ -0,0 +1,97 @@
+"""
+HyperLogLog estimates of the number of distinct values of groups.
+
+The values are hashed to 64 bits. The first ``precision`` bits of a hash select
+one of the ``2 ** precision`` registers of the group of the value, and the
+register keeps the maximum rank of the first set bit of the remaining bits. The
+number of distinct values is estimated from the harmonic mean of
+``2 ** register`` over the registers of a group, with a relative standard error
+of about ``1.04 / sqrt(2 ** precision)``.
+
+Registers are merged by taking their maximum, so that the registers of chunks
+of the data can be computed separately.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas._libs import groupby as libgroupby
+
+from pandas.core.dtypes.missing import isna
+
+from pandas.core.util.hashing import hash_array
+
+if TYPE_CHECKING:
+    from pandas._typing import (
+        ArrayLike,
+        npt,
+    )
+
+# hash standing for all NA values when they are counted as a distinct value
+_NA_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+def group_registers(
+    values: ArrayLike,
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    precision: int,
+    dropna: bool,
+) -> npt.NDArray[np.uint8]:
+    """
+    Compute the registers of each group.
+
+    Parameters
+    ----------
+    values : np.ndarray or ExtensionArray
+    ids : np.ndarray[np.intp]
+        Group of each value, -1 for values to skip.
+    ngroups : int
+    precision : int
+        Base 2 logarithm of the number of registers of each group, between 4
+        and 18.
+    dropna : bool
+        Skip the NA values rather than count them as a distinct value.
+
+    Returns
+    -------
+    np.ndarray[np.uint8]
+        Array of shape ``(ngroups, 2 ** precision)``.
+    """
+    if not 4 <= precision <= 18:
+        raise ValueError(f"precision must be between 4 and 18, got {precision}")
+
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fc":
+        # -0.0 + 0.0 is 0.0, so that both zeros have the same hash
+        values = values + 0.0
+    hashes = hash_array(values)
+    mask = isna(values)
+    if mask.any():
+        if dropna:
+            ids = np.where(mask, -1, ids)
+        else:
+            hashes[mask] = _NA_HASH
+
+    registers = np.zeros((ngroups, 1 << precision), dtype=np.uint8)
+    libgroupby.group_hll(registers, hashes, ids)
+    return registers
+
+
+def estimate_counts(registers: npt.NDArray[np.uint8]) -> npt.NDArray[np.float64]:
+    """
+    Estimate the number of distinct values of each group from its registers.
+    """
+    m = registers.shape[1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+    harmonic = np.ldexp(1.0, -registers.astype(np.int32)).sum(axis=1)
+    estimate = alpha * m * m / harmonic
+
+    # for small counts, the number of empty registers is a better estimate
+    empty = (registers == 0).sum(axis=1)
+    small = (estimate <= 2.5 * m) & (empty > 0)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / empty)
+    return np.where(small, linear, estimate)
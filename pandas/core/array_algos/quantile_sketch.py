@@ -0,0 +1,160 @@
+"""
+Mergeable sketches of the distribution of the values of groups, giving
+approximate quantiles with a bounded relative error (DDSketch).
+
+The sketch of a group counts its values in logarithmically sized bins: the
+bin with key ``k > 0`` holds the positive values in
+``(gamma ** (k - 1 - OFFSET), gamma ** (k - OFFSET)]`` with
+``gamma = (1 + relative_accuracy) / (1 - relative_accuracy)``, negative values
+go to the bins with the negated keys and zeros to the bin with key 0. Any value
+in a bin is within ``relative_accuracy`` of the value representing the bin.
+
+Sketches are merged by adding the counts of their bins, so that the sketches
+of chunks of the data can be computed separately.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas.core.algorithms import factorize_array
+
+if TYPE_CHECKING:
+    from pandas._typing import npt
+
+# offset of the keys of the bins of nonzero values, so that the keys are
+#  positive for positive values and negative for negative values
+OFFSET = 1 << 32
+# keys of the bins of the infinite values
+INF_KEY = 1 << 62
+
+
+def _gamma(relative_accuracy: float) -> float:
+    if not 0 < relative_accuracy < 1:
+        raise ValueError("relative_accuracy must be between 0 and 1")
+    return (1 + relative_accuracy) / (1 - relative_accuracy)
+
+
+def bin_keys(
+    values: npt.NDArray[np.float64], relative_accuracy: float
+) -> npt.NDArray[np.int64]:
+    """
+    Compute the key of the bin of each value, which must not be NA.
+    """
+    log_gamma = np.log(_gamma(relative_accuracy))
+    magnitude = np.abs(values)
+    finite = np.isfinite(magnitude)
+    nonzero = finite & (magnitude > 0)
+
+    log = np.zeros(len(values), dtype=np.float64)
+    np.log(magnitude, out=log, where=nonzero)
+    keys = np.ceil(log / log_gamma).astype(np.int64) + OFFSET
+    keys[~nonzero] = 0
+    keys[~finite] = INF_KEY
+    return np.where(values < 0, -keys, keys)
+
+
+def bin_values(
+    keys: npt.NDArray[np.int64], relative_accuracy: float
+) -> npt.NDArray[np.float64]:
+    """
+    Compute the value representing each bin, within the relative accuracy of
+    all values of the bin.
+    """
+    gamma = _gamma(relative_accuracy)
+    magnitude = np.abs(keys)
+    with np.errstate(over="ignore"):
+        values = 2 * gamma ** (magnitude - OFFSET).astype(np.float64) / (gamma + 1)
+    values[magnitude == 0] = 0
+    values[magnitude == INF_KEY] = np.inf
+    return np.where(keys < 0, -values, values)
+
+
+def group_sketches(
+    ids: npt.NDArray[np.intp],
+    keys: npt.NDArray[np.int64],
+    counts: npt.NDArray[np.int64] | None = None,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    Count the values of each group in each bin.
+
+    Parameters
+    ----------
+    ids : np.ndarray[np.intp]
+        Group of each value, -1 for values to skip.
+    keys : np.ndarray[np.int64]
+        Bin of each value.
+    counts : np.ndarray[np.int64], optional
+        Number of values of each item, e.g. when merging sketches.
+
+    Returns
+    -------
+    ids, keys, counts : np.ndarray
+        The nonempty bins of the sketches of all groups, sorted by group and bin.
+    """
+    keep = ids >= 0
+    if not keep.all():
+        ids = ids[keep]
+        keys = keys[keep]
+        if counts is not None:
+            counts = counts[keep]
+
+    # number the distinct bins, then the distinct (group, bin) pairs by hashing,
+    #  as only the (few) nonempty bins need to be sorted
+    key_codes, key_uniques = factorize_array(keys)
+    nkeys = max(len(key_uniques), 1)
+    pairs = ids.astype(np.int64) * nkeys + key_codes
+    pair_codes, pair_uniques = factorize_array(pairs)
+    pair_counts = np.bincount(pair_codes, weights=counts, minlength=len(pair_uniques))
+
+    sketch_ids = (pair_uniques // nkeys).astype(np.intp)
+    sketch_keys = key_uniques[pair_uniques % nkeys]
+    order = np.lexsort((sketch_keys, sketch_ids))
+    return (
+        sketch_ids[order],
+        sketch_keys[order],
+        pair_counts[order].astype(np.int64),
+    )
+
+
+def sketch_quantiles(
+    ids: npt.NDArray[np.intp],
+    keys: npt.NDArray[np.int64],
+    counts: npt.NDArray[np.int64],
+    ngroups: int,
+    qs: npt.NDArray[np.float64],
+    relative_accuracy: float,
+) -> npt.NDArray[np.float64]:
+    """
+    Compute approximate quantiles of each group from the sketches of the groups.
+
+    The quantile ``q`` of a group of ``n`` values is approximated by the value of
+    the bin of the value of rank ``floor(q * (n - 1))``, i.e. the quantile with
+    ``interpolation="lower"``, within the relative accuracy.
+
+    Parameters
+    ----------
+    ids, keys, counts : np.ndarray
+        Sketches of the groups as returned by :func:`group_sketches`.
+    ngroups : int
+    qs : np.ndarray[np.float64]
+    relative_accuracy : float
+
+    Returns
+    -------
+    np.ndarray[np.float64]
+        Array of shape ``(ngroups, len(qs))``, NaN for empty groups.
+    """
+    values = bin_values(keys, relative_accuracy)
+    cumulative = np.cumsum(counts)
+    sizes = np.bincount(ids, weights=counts, minlength=ngroups).astype(np.int64)
+    offsets = np.cumsum(sizes) - sizes
+
+    result = np.full((ngroups, len(qs)), np.nan)
+    nonempty = sizes > 0
+    for i, q in enumerate(qs):
+        ranks = offsets[nonempty] + np.floor(q * (sizes[nonempty] - 1))
+        result[nonempty, i] = values[np.searchsorted(cumulative, ranks, side="right")]
+    return result
@@ -72,6 +72,15 @@ def use_numba_cb(key: str) -> None:
     numba_.set_use_numba(cf.get_option(key))
 
 
+groupby_threads_doc = """
+: int
+    Number of threads splitting the columns of the cython groupby
+    aggregations and transformations of large numeric blocks. The kernels
+    release the GIL, so the columns are processed concurrently.
+    The default is 1, i.e. single-threaded; 0 uses one thread per CPU.
+"""
+
+
 with cf.config_prefix("compute"):
     cf.register_option(
         "use_bottleneck",
@@ -86,6 +95,9 @@ with cf.config_prefix("compute"):
     cf.register_option(
         "use_numba", False, use_numba_doc, validator=is_bool, cb=use_numba_cb
     )
+    cf.register_option(
+        "groupby_threads", 1, groupby_threads_doc, validator=is_nonnegative_int
+    )
 #
 # options from the "display" namespace
 
@@ -9062,15 +9062,21 @@ class DataFrame(NDFrame, OpsMixin):
         by=None,
         level: IndexLabel | None = None,
         as_index: bool = True,
-        sort: bool = True,
+        sort: bool | lib.NoDefault = lib.no_default,
         group_keys: bool = True,
-        observed: bool = True,
-        dropna: bool = True,
+        observed: bool | Literal["sparse"] | lib.NoDefault = lib.no_default,
+        dropna: bool | lib.NoDefault = lib.no_default,
     ) -> DataFrameGroupBy:
         from pandas.core.groupby.generic import DataFrameGroupBy
+        from pandas.core.groupby.grouper import GroupByPlan
 
         if level is None and by is None:
             raise TypeError("You have to supply one of 'by' and 'level'")
+        if not isinstance(by, GroupByPlan):
+            # a plan checks the options passed against its own
+            sort = True if sort is lib.no_default else sort
+            observed = True if observed is lib.no_default else observed
+            dropna = True if dropna is lib.no_default else dropna
 
         return DataFrameGroupBy(
             obj=self,
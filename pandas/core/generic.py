@@ -3015,6 +3015,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
         compression: CompressionOptions = "infer",
         protocol: int = pickle.HIGHEST_PROTOCOL,
         storage_options: StorageOptions | None = None,
+        out_of_band: bool = False,
     ) -> None:
         """
         Pickle (serialize) object to file.
@@ -3036,6 +3037,15 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
 
         {storage_options}
 
+        out_of_band : bool, default False
+            Write the data buffers of the object, such as the arrays of its
+            blocks, out-of-band after the pickle stream instead of inline,
+            aligned in the same file. Requires ``protocol`` 5 or higher. With
+            ``read_pickle(..., memory_map=True)`` the arrays of such a file
+            are backed by the mapped file without copying them.
+
+            .. versionadded:: 3.0.0
+
         See Also
         --------
         read_pickle : Load pickled pandas object (or any object) from file.
@@ -3074,6 +3084,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
             compression=compression,
             protocol=protocol,
             storage_options=storage_options,
+            out_of_band=out_of_band,
         )
 
     @final
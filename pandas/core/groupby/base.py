@@ -56,6 +56,12 @@ reduction_kernels = frozenset(
     ]
 )
 
+# Reductions that a list-like aggregation of float64 data computes together with
+# a single pass over the data, see libgroupby.group_fused_agg.
+fused_reduction_kernels = frozenset(
+    ["count", "max", "mean", "min", "std", "sum", "var"]
+)
+
 # List of transformation functions.
 # a transformation is a function that, for each group,
 # produces a result that has the same shape as the group.
@@ -101,10 +107,14 @@ groupby_other_methods = frozenset(
         "indices",
         "ndim",
         "ngroups",
+        "nlargest",
+        "nsmallest",
         "nth",
         "ohlc",
         "pipe",
+        "plan",
         "plot",
+        "reindex_unobserved",
         "resample",
         "rolling",
         "tail",
@@ -25,8 +25,7 @@ import warnings
 
 import numpy as np
 
-from pandas._libs import Interval
-from pandas._libs.hashtable import duplicated
+import pandas._libs.groupby as libgroupby
 from pandas.errors import SpecificationError
 from pandas.util._decorators import (
     Appender,
@@ -36,18 +35,14 @@ from pandas.util._decorators import (
 from pandas.util._exceptions import find_stack_level
 
 from pandas.core.dtypes.common import (
-    ensure_int64,
+    ensure_platform_int,
     is_bool,
     is_dict_like,
-    is_integer_dtype,
     is_list_like,
     is_numeric_dtype,
     is_scalar,
 )
-from pandas.core.dtypes.dtypes import (
-    CategoricalDtype,
-    IntervalDtype,
-)
+from pandas.core.dtypes.dtypes import CategoricalDtype
 from pandas.core.dtypes.inference import is_hashable
 from pandas.core.dtypes.missing import (
     isna,
@@ -61,9 +56,13 @@ from pandas.core.apply import (
     reconstruct_func,
     validate_func_kwargs,
 )
+from pandas.core.array_algos import hyperloglog
 import pandas.core.common as com
 from pandas.core.frame import DataFrame
-from pandas.core.groupby import base
+from pandas.core.groupby import (
+    base,
+    processes,
+)
 from pandas.core.groupby.groupby import (
     GroupBy,
     GroupByPlot,
@@ -73,12 +72,10 @@ from pandas.core.groupby.groupby import (
 )
 from pandas.core.indexes.api import (
     Index,
-    MultiIndex,
     all_indexes_same,
     default_index,
 )
 from pandas.core.series import Series
-from pandas.core.sorting import get_group_index
 from pandas.core.util.numba_ import maybe_use_numba
 
 from pandas.plotting import boxplot_frame_groupby
@@ -214,7 +211,14 @@ class SeriesGroupBy(GroupBy[Series]):
     """
     )
 
-    def apply(self, func, *args, **kwargs) -> Series:
+    def apply(
+        self,
+        func,
+        *args,
+        engine: Literal["processes"] | None = None,
+        engine_kwargs: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Series:
         """
         Apply function ``func`` group-wise and combine the results together.
 
@@ -240,6 +244,20 @@ class SeriesGroupBy(GroupBy[Series]):
         *args : tuple
             Optional positional arguments to pass to ``func``.
 
+        engine : {None, 'processes'}, default None
+            With ``'processes'``, ``func`` is called on the groups in a pool of
+            worker processes, see :meth:`.DataFrameGroupBy.apply`. Other values
+            are passed to ``func`` as the keyword argument ``engine``.
+
+            .. versionadded:: 3.0.0
+
+        engine_kwargs : dict, default None
+            For ``engine='processes'``, ``max_workers`` and ``batch_size``.
+            Otherwise passed to ``func`` as the keyword argument
+            ``engine_kwargs``.
+
+            .. versionadded:: 3.0.0
+
         **kwargs : dict
             Optional keyword arguments to pass to ``func``.
 
@@ -322,7 +340,9 @@ class SeriesGroupBy(GroupBy[Series]):
         b    0
         dtype: int64
         """
-        return super().apply(func, *args, **kwargs)
+        return super().apply(
+            func, *args, engine=engine, engine_kwargs=engine_kwargs, **kwargs
+        )
 
     @doc(_agg_template_series, examples=_agg_examples_doc, klass="Series")
     def aggregate(self, func=None, *args, engine=None, engine_kwargs=None, **kwargs):
@@ -403,10 +423,29 @@ class SeriesGroupBy(GroupBy[Series]):
         with com.temp_setattr(self, "as_index", True):
             # Combine results using the index, need to adjust index after
             # if as_index=False (GH#50724)
+            arg = list(arg)
+            fused = None
+            if (
+                not args
+                and kwargs.keys() <= {"engine", "engine_kwargs"}
+                and not maybe_use_numba(kwargs.get("engine"))
+            ):
+                fused = self._agg_fused([func for _, func in arg])
             for idx, (name, func) in enumerate(arg):
                 key = base.OutputKey(label=name, position=idx)
-                results[key] = self.aggregate(func, *args, **kwargs)
+                if fused is not None:
+                    results[key] = fused[func]
+                else:
+                    results[key] = self.aggregate(func, *args, **kwargs)
+
+        return self._wrap_multiple_funcs(results)
 
+    def _wrap_multiple_funcs(
+        self, results: dict[base.OutputKey, DataFrame | Series]
+    ) -> DataFrame:
+        """
+        Combine the results of the functions of _aggregate_multiple_funcs.
+        """
         if any(isinstance(x, DataFrame) for x in results.values()):
             from pandas import concat
 
@@ -567,15 +606,23 @@ class SeriesGroupBy(GroupBy[Series]):
         assert callable(func)
         klass = type(self.obj)
 
-        results = []
-        for name, group in self._grouper.get_iterator(
-            self._obj_with_exclusions,
-        ):
-            # this setattr is needed for test_transform_lambda_with_datetimetz
-            object.__setattr__(group, "name", name)
-            res = func(group, *args, **kwargs)
+        if engine == "processes":
+            results, _ = processes.apply_groupwise(
+                self._grouper,
+                partial(_transform_series_group, klass, func, args, kwargs),
+                self._obj_with_exclusions,
+                engine_kwargs,
+            )
+        else:
+            results = []
+            for name, group in self._grouper.get_iterator(
+                self._obj_with_exclusions,
+            ):
+                # this setattr is needed for test_transform_lambda_with_datetimetz
+                object.__setattr__(group, "name", name)
+                res = func(group, *args, **kwargs)
 
-            results.append(klass(res, index=group.index))
+                results.append(klass(res, index=group.index))
 
         # check for empty "results" to avoid concat ValueError
         if results:
@@ -662,7 +709,12 @@ class SeriesGroupBy(GroupBy[Series]):
         filtered = self._apply_filter(indices, dropna)
         return filtered
 
-    def nunique(self, dropna: bool = True) -> Series | DataFrame:
+    def nunique(
+        self,
+        dropna: bool = True,
+        method: Literal["exact", "approx"] = "exact",
+        precision: int = 12,
+    ) -> Series | DataFrame:
         """
         Return number of unique elements in the group.
 
@@ -670,6 +722,22 @@ class SeriesGroupBy(GroupBy[Series]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        method : {'exact', 'approx'}, default 'exact'
+            With ``"exact"``, the values are factorized and the distinct values
+            of each group are counted. With ``"approx"``, the number of distinct
+            values of each group is estimated with a HyperLogLog sketch of
+            ``2 ** precision`` bytes per group, without keeping the distinct
+            values in memory.
+
+            .. versionadded:: 3.0.0
+
+        precision : int, default 12
+            Base 2 logarithm of the number of registers of the HyperLogLog
+            sketch of each group with ``method="approx"``, between 4 and 18. The
+            relative standard error of the counts is about
+            ``1.04 / sqrt(2 ** precision)``, 1.6% by default.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -698,29 +766,24 @@ class SeriesGroupBy(GroupBy[Series]):
         ids = self._grouper.ids
         ngroups = self._grouper.ngroups
         val = self.obj._values
-        codes, uniques = algorithms.factorize(val, use_na_sentinel=dropna, sort=False)
-
-        if self._grouper.has_dropped_na:
-            mask = ids >= 0
-            ids = ids[mask]
-            codes = codes[mask]
-
-        group_index = get_group_index(
-            labels=[ids, codes],
-            shape=(ngroups, len(uniques)),
-            sort=False,
-            xnull=dropna,
-        )
-
-        if dropna:
-            mask = group_index >= 0
-            if (~mask).any():
-                ids = ids[mask]
-                group_index = group_index[mask]
 
-        mask = duplicated(group_index, "first")
-        res = np.bincount(ids[~mask], minlength=ngroups)
-        res = ensure_int64(res)
+        if method == "approx":
+            registers = hyperloglog.group_registers(
+                val, ids, ngroups, precision, dropna
+            )
+            res = np.rint(hyperloglog.estimate_counts(registers)).astype(np.int64)
+        elif method == "exact":
+            codes, uniques = algorithms.factorize(
+                val, use_na_sentinel=dropna, sort=False
+            )
+            res = np.zeros(ngroups, dtype=np.int64)
+            libgroupby.group_nunique(
+                res, codes, ids, self._grouper.result_ilocs, len(uniques)
+            )
+        else:
+            raise ValueError(
+                f"method must be 'exact' or 'approx', got {method!r} instead"
+            )
 
         ri = self._grouper.result_index
         result: Series | DataFrame = self.obj._constructor(
@@ -833,10 +896,8 @@ class SeriesGroupBy(GroupBy[Series]):
             result.name = name
             return result
 
-        from pandas.core.reshape.merge import get_join_indexers
         from pandas.core.reshape.tile import cut
 
-        ids = self._grouper.ids
         val = self.obj._values
 
         index_names = self._grouper.names + [self.obj.name]
@@ -858,133 +919,21 @@ class SeriesGroupBy(GroupBy[Series]):
             ser.index.names = index_names
             return ser
 
-        # groupby removes null keys from groupings
-        mask = ids != -1
-        ids, val = ids[mask], val[mask]
-
-        lab: Index | np.ndarray
-        if bins is None:
-            lab, lev = algorithms.factorize(val, sort=True)
-            llab = lambda lab, inc: lab[inc]
-        else:
-            # lab is a Categorical with categories an IntervalIndex
-            cat_ser = cut(Series(val, copy=False), bins, include_lowest=True)
-            cat_obj = cast("Categorical", cat_ser._values)
-            lev = cat_obj.categories
-            lab = lev.take(
-                cat_obj.codes,
-                allow_fill=True,
-                fill_value=lev._na_value,
-            )
-            llab = lambda lab, inc: lab[inc]._multiindex.codes[-1]
-
-        if isinstance(lab.dtype, IntervalDtype):
-            # TODO: should we do this inside II?
-            lab_interval = cast(Interval, lab)
-
-            sorter = np.lexsort((lab_interval.left, lab_interval.right, ids))
-        else:
-            sorter = np.lexsort((lab, ids))
-
-        ids, lab = ids[sorter], lab[sorter]
-
-        # group boundaries are where group ids change
-        idchanges = 1 + np.nonzero(ids[1:] != ids[:-1])[0]
-        idx = np.r_[0, idchanges]
-        if not len(ids):
-            idx = idchanges
-
-        # new values are where sorted labels change
-        lchanges = llab(lab, slice(1, None)) != llab(lab, slice(None, -1))
-        inc = np.r_[True, lchanges]
-        if not len(val):
-            inc = lchanges
-        inc[idx] = True  # group boundaries are also new values
-        out = np.diff(np.nonzero(np.r_[inc, True])[0])  # value counts
-
-        # num. of times each group should be repeated
-        rep = partial(np.repeat, repeats=np.add.reduceat(inc, idx))
-
-        # multi-index components
-        if isinstance(self._grouper.result_index, MultiIndex):
-            codes = list(self._grouper.result_index.codes)
-        else:
-            codes = [
-                algorithms.factorize(
-                    self._grouper.result_index,
-                    sort=self._grouper._sort,
-                    use_na_sentinel=self._grouper.dropna,
-                )[0]
-            ]
-        codes = [rep(level_codes) for level_codes in codes] + [llab(lab, inc)]
-        levels = self._grouper.levels + [lev]
-
-        if dropna:
-            mask = codes[-1] != -1
-            if mask.all():
-                dropna = False
-            else:
-                out, codes = out[mask], [level_codes[mask] for level_codes in codes]
-
-        if normalize:
-            out = out.astype("float")
-            d = np.diff(np.r_[idx, len(ids)])
-            if dropna:
-                m = ids[lab == -1]
-                np.add.at(d, m, -1)
-                acc = rep(d)[mask]
-            else:
-                acc = rep(d)
-            out /= acc
-
-        if sort and bins is None:
-            cat = ids[inc][mask] if dropna else ids[inc]
-            sorter = np.lexsort((out if ascending else -out, cat))
-            out, codes[-1] = out[sorter], codes[-1][sorter]
-
-        if bins is not None:
-            # for compat. with libgroupby.value_counts need to ensure every
-            # bin is present at every index level, null filled with zeros
-            diff = np.zeros(len(out), dtype="bool")
-            for level_codes in codes[:-1]:
-                diff |= np.r_[True, level_codes[1:] != level_codes[:-1]]
-
-            ncat, nbin = diff.sum(), len(levels[-1])
-
-            left = [np.repeat(np.arange(ncat), nbin), np.tile(np.arange(nbin), ncat)]
-
-            right = [diff.cumsum() - 1, codes[-1]]
-
-            # error: Argument 1 to "get_join_indexers" has incompatible type
-            # "List[ndarray[Any, Any]]"; expected "List[Union[Union[ExtensionArray,
-            # ndarray[Any, Any]], Index, Series]]
-            _, idx = get_join_indexers(
-                left,  # type: ignore[arg-type]
-                right,
-                sort=False,
-                how="left",
-            )
-            if idx is not None:
-                out = np.where(idx != -1, out[idx], 0)
-
-            if sort:
-                sorter = np.lexsort((out if ascending else -out, left[0]))
-                out, left[-1] = out[sorter], left[-1][sorter]
-
-            # build the multi-index w/ full levels
-            def build_codes(lev_codes: np.ndarray) -> np.ndarray:
-                return np.repeat(lev_codes[diff], nbin)
-
-            codes = [build_codes(lev_codes) for lev_codes in codes[:-1]]
-            codes.append(left[-1])
-
-        mi = MultiIndex(
-            levels=levels, codes=codes, names=index_names, verify_integrity=False
+        # a Categorical with categories an IntervalIndex
+        cat_ser = cut(Series(val, copy=False), bins, include_lowest=True)
+        cat_obj = cast("Categorical", cat_ser._values)
+        # every bin is present for each group, with a count of 0 if empty
+        result = self._value_counts_by_codes(
+            [ensure_platform_int(cat_obj.codes)],
+            [cat_obj.categories],
+            [self.obj.name],
+            normalize=normalize,
+            sort=sort,
+            ascending=ascending,
+            dropna=dropna,
+            all_values=True,
         )
-
-        if is_integer_dtype(out.dtype):
-            out = ensure_int64(out)
-        result = self.obj._constructor(out, index=mi, name=name)
+        result.name = name
         if not self.as_index:
             result = result.reset_index()
         return result
@@ -1155,23 +1104,13 @@ class SeriesGroupBy(GroupBy[Series]):
     def nlargest(
         self, n: int = 5, keep: Literal["first", "last", "all"] = "first"
     ) -> Series:
-        f = partial(Series.nlargest, n=n, keep=keep)
-        data = self._obj_with_exclusions
-        # Don't change behavior if result index happens to be the same, i.e.
-        # already ordered and n >= all group sizes.
-        result = self._python_apply_general(f, data, not_indexed_same=True)
-        return result
+        return self._nselect("nlargest", n, keep)
 
     @doc(Series.nsmallest.__doc__)
     def nsmallest(
         self, n: int = 5, keep: Literal["first", "last", "all"] = "first"
     ) -> Series:
-        f = partial(Series.nsmallest, n=n, keep=keep)
-        data = self._obj_with_exclusions
-        # Don't change behavior if result index happens to be the same, i.e.
-        # already ordered and n >= all group sizes.
-        result = self._python_apply_general(f, data, not_indexed_same=True)
-        return result
+        return self._nselect("nsmallest", n, keep)
 
     def idxmin(self, skipna: bool = True) -> Series:
         """
@@ -1809,6 +1748,16 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             if group.size > 0:
                 res = _wrap_transform_general_frame(self.obj, group, res)
                 applied.append(res)
+            if engine == "processes":
+                # the path chosen with the first group is used for all groups
+                results, _ = processes.apply_groupwise(
+                    self._grouper,
+                    partial(_transform_frame_group, path, self.obj.iloc[:0]),
+                    obj,
+                    engine_kwargs,
+                )
+                applied = [res for res in results if res is not None]
+                gen = iter(())
 
         # Compute and process with the remaining groups
         for name, group in gen:
@@ -1890,16 +1839,10 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         )
 
     def _define_paths(self, func, *args, **kwargs):
-        if isinstance(func, str):
-            fast_path = lambda group: getattr(group, func)(*args, **kwargs)
-            slow_path = lambda group: group.apply(
-                lambda x: getattr(x, func)(*args, **kwargs), axis=0
-            )
-        else:
-            fast_path = lambda group: func(group, *args, **kwargs)
-            slow_path = lambda group: group.apply(
-                lambda x: func(x, *args, **kwargs), axis=0
-            )
+        # partial functions of module level functions rather than lambdas, so
+        #  that the paths can be sent to worker processes
+        fast_path = partial(_transform_fast_path, func, args, kwargs)
+        slow_path = partial(_transform_slow_path, func, args, kwargs)
         return fast_path, slow_path
 
     def _choose_path(self, fast_path: Callable, slow_path: Callable, group: DataFrame):
@@ -2121,7 +2064,12 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             res_df = self._insert_inaxis_grouper(res_df)
         return res_df
 
-    def nunique(self, dropna: bool = True) -> DataFrame:
+    def nunique(
+        self,
+        dropna: bool = True,
+        method: Literal["exact", "approx"] = "exact",
+        precision: int = 12,
+    ) -> DataFrame:
         """
         Return DataFrame with counts of unique elements in each position.
 
@@ -2129,6 +2077,17 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        method : {'exact', 'approx'}, default 'exact'
+            With ``"approx"``, estimate the counts with HyperLogLog sketches,
+            see :meth:`.SeriesGroupBy.nunique`.
+
+            .. versionadded:: 3.0.0
+
+        precision : int, default 12
+            Base 2 logarithm of the number of registers of the HyperLogLog
+            sketch of each group with ``method="approx"``.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -2169,7 +2128,9 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         4   ham       5      x
         5   ham       5      y
         """
-        return self._apply_to_column_groupbys(lambda sgb: sgb.nunique(dropna))
+        return self._apply_to_column_groupbys(
+            lambda sgb: sgb.nunique(dropna, method=method, precision=precision)
+        )
 
     def idxmax(
         self,
@@ -2587,6 +2548,24 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         result = GroupByPlot(self)
         return result
 
+    @doc(DataFrame.nlargest.__doc__)
+    def nlargest(
+        self,
+        n: int,
+        columns: IndexLabel,
+        keep: Literal["first", "last", "all"] = "first",
+    ) -> DataFrame:
+        return self._nselect("nlargest", n, keep, columns)
+
+    @doc(DataFrame.nsmallest.__doc__)
+    def nsmallest(
+        self,
+        n: int,
+        columns: IndexLabel,
+        keep: Literal["first", "last", "all"] = "first",
+    ) -> DataFrame:
+        return self._nselect("nsmallest", n, keep, columns)
+
     @doc(DataFrame.corr.__doc__)
     def corr(
         self,
@@ -2825,6 +2804,34 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         return result
 
 
+def _transform_fast_path(func, args: tuple, kwargs: dict, group: DataFrame):
+    if isinstance(func, str):
+        return getattr(group, func)(*args, **kwargs)
+    return func(group, *args, **kwargs)
+
+
+def _transform_slow_path(func, args: tuple, kwargs: dict, group: DataFrame):
+    if isinstance(func, str):
+        return group.apply(lambda x: getattr(x, func)(*args, **kwargs), axis=0)
+    return group.apply(lambda x: func(x, *args, **kwargs), axis=0)
+
+
+def _transform_series_group(
+    klass: type[Series], func: Callable, args: tuple, kwargs: dict, group: Series
+) -> Series:
+    return klass(func(group, *args, **kwargs), index=group.index)
+
+
+def _transform_frame_group(
+    path: Callable, obj: DataFrame, group: DataFrame
+) -> DataFrame | None:
+    # obj is an empty DataFrame like the groupby object, its index is not that
+    #  of any result
+    if group.size == 0:
+        return None
+    return _wrap_transform_general_frame(obj, group, path(group))
+
+
 def _wrap_transform_general_frame(
     obj: DataFrame, group: DataFrame, res: DataFrame | Series
 ) -> DataFrame:
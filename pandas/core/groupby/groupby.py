@@ -72,6 +72,7 @@ from pandas.core.dtypes.cast import (
     ensure_dtype_can_hold_na,
 )
 from pandas.core.dtypes.common import (
+    ensure_platform_int,
     is_bool_dtype,
     is_float_dtype,
     is_hashable,
@@ -95,6 +96,7 @@ from pandas.core import (
     sample,
 )
 from pandas.core._numba import executor
+from pandas.core.array_algos import quantile_sketch
 from pandas.core.arrays import (
     ArrowExtensionArray,
     BaseMaskedArray,
@@ -119,8 +121,12 @@ from pandas.core.groupby import (
     base,
     numba_,
     ops,
+    processes,
+)
+from pandas.core.groupby.grouper import (
+    GroupByPlan,
+    get_grouper,
 )
-from pandas.core.groupby.grouper import get_grouper
 from pandas.core.groupby.indexing import (
     GroupByIndexingMixin,
     GroupByNthSelector,
@@ -131,8 +137,14 @@ from pandas.core.indexes.api import (
     default_index,
 )
 from pandas.core.internals.blocks import ensure_block_shape
+from pandas.core.methods.selectn import SelectN
 from pandas.core.series import Series
-from pandas.core.sorting import get_group_index_sorter
+from pandas.core.sorting import (
+    compress_group_index,
+    decons_obs_group_ids,
+    get_group_index,
+    get_group_index_sorter,
+)
 from pandas.core.util.numba_ import (
     get_jit_arguments,
     maybe_use_numba,
@@ -300,6 +312,11 @@ func : function, str
 engine : str, default None
     * ``'cython'`` : Runs the function through C-extensions from cython.
     * ``'numba'`` : Runs the function through JIT compiled code from numba.
+    * ``'processes'`` : Calls the function on the groups in a pool of worker
+      processes. The function and its arguments must be picklable.
+
+      .. versionadded:: 3.0.0
+
     * ``None`` : Defaults to ``'cython'`` or the global setting ``compute.use_numba``
 
 engine_kwargs : dict, default None
@@ -309,6 +326,9 @@ engine_kwargs : dict, default None
       ``False``. The default ``engine_kwargs`` for the ``'numba'`` engine is
       ``{'nopython': True, 'nogil': False, 'parallel': False}`` and will be
       applied to the function
+    * For ``'processes'`` engine, the engine can accept ``max_workers``, the
+      number of processes, and ``batch_size``, the number of groups sent to a
+      process at once
 
 **kwargs
     Keyword arguments to be passed into func.
@@ -411,6 +431,12 @@ engine_kwargs : dict, default None
       ``False``. The default ``engine_kwargs`` for the ``'numba'`` engine is
       ``{{'nopython': True, 'nogil': False, 'parallel': False}}`` and will be
       applied to the function
+    * For ``'numba'`` engine, ``{{'columnwise': False}}`` calls the function
+      once per group with the 2D array of all the columns of the group, and
+      the function may return a tuple of values, giving the columns of the
+      result. With ``parallel``, the groups are processed in parallel.
+
+      .. versionadded:: 3.0.0
 
 **kwargs
     * If ``func`` is None, ``**kwargs`` are used to define the output names and
@@ -489,6 +515,12 @@ engine_kwargs : dict, default None
       ``False``. The default ``engine_kwargs`` for the ``'numba'`` engine is
       ``{{'nopython': True, 'nogil': False, 'parallel': False}}`` and will be
       applied to the function
+    * For ``'numba'`` engine, ``{{'columnwise': False}}`` calls the function
+      once per group with the 2D array of all the columns of the group, and
+      the function may return a tuple of values, giving the columns of the
+      result. With ``parallel``, the groups are processed in parallel.
+
+      .. versionadded:: 3.0.0
 
 **kwargs
     * If ``func`` is None, ``**kwargs`` are used to define the output names and
@@ -1094,15 +1126,28 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         exclusions: frozenset[Hashable] | None = None,
         selection: IndexLabel | None = None,
         as_index: bool = True,
-        sort: bool = True,
+        sort: bool | lib.NoDefault = True,
         group_keys: bool = True,
-        observed: bool = False,
-        dropna: bool = True,
+        observed: bool | Literal["sparse"] | lib.NoDefault = False,
+        dropna: bool | lib.NoDefault = True,
     ) -> None:
         self._selection = selection
 
         assert isinstance(obj, NDFrame), type(obj)
 
+        if isinstance(keys, GroupByPlan):
+            # the options are part of the plan
+            sort, observed, dropna = keys._get_options(
+                sort=sort, observed=observed, dropna=dropna
+            )
+        assert sort is not lib.no_default
+        assert observed is not lib.no_default
+        assert dropna is not lib.no_default
+        if isinstance(observed, str) and observed != "sparse":
+            raise ValueError(
+                f"observed must be a boolean or 'sparse', got {observed!r}"
+            )
+
         self.level = level
         self.as_index = as_index
         self.keys = keys
@@ -1135,6 +1180,58 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             f"'{type(self).__name__}' object has no attribute '{attr}'"
         )
 
+    @final
+    def plan(self) -> GroupByPlan:
+        """
+        Return a reusable plan of the groups.
+
+        The plan holds the factorized keys, the sort order and the result
+        index of the groups. Passing it as ``by`` to ``groupby`` of this
+        object, or of any object with the same index, skips computing them
+        again. The plan is recomputed when the index or the key columns of
+        this object are modified.
+
+        .. versionadded:: 3.0.0
+
+        Returns
+        -------
+        pandas.api.typing.GroupByPlan
+            Plan to pass as ``by`` to :meth:`DataFrame.groupby` or
+            :meth:`Series.groupby`.
+
+        See Also
+        --------
+        DataFrame.groupby : Group DataFrame using a mapper or by a Series of
+            columns.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"key": ["a", "b", "a"], "x": [1, 2, 3]})
+        >>> plan = df.groupby("key").plan()
+        >>> df.groupby(plan).sum()
+             x
+        key
+        a    4
+        b    2
+
+        >>> other = pd.DataFrame({"y": [10.0, 20.0, 30.0]})
+        >>> other.groupby(plan).mean()
+                y
+        key
+        a    20.0
+        b    20.0
+        """
+        return GroupByPlan(
+            self.obj,
+            self.keys,
+            self.level,
+            sort=self.sort,
+            observed=self.observed,
+            dropna=self.dropna,
+            grouper=self._grouper,
+            exclusions=self.exclusions,
+        )
+
     @final
     def _op_via_apply(self, name: str, *args, **kwargs):
         """Compute the result of an operation by using GroupBy's apply."""
@@ -1428,6 +1525,10 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         to generate the indices of each group in the sorted data and then passes the
         data and indices into a Numba jitted function.
         """
+        if engine_kwargs is not None and not engine_kwargs.get("columnwise", True):
+            raise NotImplementedError(
+                "engine_kwargs={'columnwise': False} is not supported for transform"
+            )
         data = self._obj_with_exclusions
         index_sorting = self._grouper.result_ilocs
         df = data if data.ndim == 2 else data.to_frame()
@@ -1470,6 +1571,23 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
         starts, ends, sorted_index, sorted_data = self._numba_prep(df)
         numba_.validate_udf(func)
+        if engine_kwargs is not None and not engine_kwargs.get("columnwise", True):
+            res = self._aggregate_groups_with_numba(
+                func,
+                data,
+                starts,
+                ends,
+                sorted_index,
+                sorted_data,
+                *args,
+                engine_kwargs=engine_kwargs,
+                **kwargs,
+            )
+            if not self.as_index:
+                res = self._insert_inaxis_grouper(res)
+                res.index = default_index(len(res))
+            return res
+
         numba_agg_func = numba_.generate_numba_agg_func(
             func, **get_jit_arguments(engine_kwargs, kwargs)
         )
@@ -1493,10 +1611,52 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             res.index = default_index(len(res))
         return res
 
+    @final
+    def _aggregate_groups_with_numba(
+        self,
+        func,
+        data: NDFrameT,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        sorted_index: np.ndarray,
+        sorted_data: np.ndarray,
+        *args,
+        engine_kwargs=None,
+        **kwargs,
+    ) -> Series | DataFrame:
+        """
+        Call func once per group with the 2D array of all the columns of the
+        group, rather than once per group and column.
+
+        A func returning a scalar gives a Series, a func returning a tuple or an
+        array of k values gives a DataFrame with the columns 0, ..., k - 1.
+        """
+        index = self._grouper.result_index
+        if len(starts) == 0:
+            # func cannot be called to infer the number of outputs
+            result = np.empty((0, 1), dtype=np.float64)
+        else:
+            numba_agg_func = numba_.generate_numba_multi_column_agg_func(
+                func, **get_jit_arguments(engine_kwargs, kwargs)
+            )
+            result = numba_agg_func(sorted_data, sorted_index, starts, ends, *args)
+        if result.shape[1] == 1:
+            name = data.name if data.ndim == 1 else None
+            return Series(result[:, 0], index=index, name=name)
+        return DataFrame(result, index=index)
+
     # -----------------------------------------------------------------
     # apply/agg/transform
 
-    def apply(self, func, *args, include_groups: bool = True, **kwargs) -> NDFrameT:
+    def apply(
+        self,
+        func,
+        *args,
+        include_groups: bool = True,
+        engine: Literal["processes"] | None = None,
+        engine_kwargs: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> NDFrameT:
         """
         Apply function ``func`` group-wise and combine the results together.
 
@@ -1535,6 +1695,26 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             Setting include_groups to True is deprecated. Only the value
             False will be allowed in a future version of pandas.
 
+        engine : {None, 'processes'}, default None
+            With ``'processes'``, ``func`` is called on the groups in a pool of
+            worker processes, each receiving batches of consecutive groups. The
+            results are combined in the order of the groups as with
+            ``'python'``. ``func``, ``args`` and ``kwargs`` must be picklable,
+            e.g. ``func`` cannot be a lambda, and mutations of the groups or of
+            other objects are not visible to the caller. Other values are passed
+            to ``func`` as the keyword argument ``engine``.
+
+            .. versionadded:: 3.0.0
+
+        engine_kwargs : dict, default None
+            For ``engine='processes'``, ``max_workers`` is the number of worker
+            processes, by default the number of CPUs, and ``batch_size`` is the
+            number of groups sent to a process at once, by default such that
+            each process gets about four batches. Otherwise passed to ``func``
+            as the keyword argument ``engine_kwargs``.
+
+            .. versionadded:: 3.0.0
+
         **kwargs : dict
             Optional keyword arguments to pass to ``func``.
 
@@ -1637,6 +1817,14 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         0  1  4
         1  2  6
         """
+        if engine != "processes":
+            # engine and engine_kwargs are keyword arguments of func otherwise
+            if engine is not None:
+                kwargs["engine"] = engine
+            if engine_kwargs is not None:
+                kwargs["engine_kwargs"] = engine_kwargs
+            engine, engine_kwargs = "python", None
+
         if isinstance(func, str):
             if hasattr(self, func):
                 res = getattr(self, func)
@@ -1650,24 +1838,30 @@ class GroupBy(BaseGroupBy[NDFrameT]):
                 raise TypeError(f"apply func should be callable, not '{func}'")
 
         elif args or kwargs:
-            if callable(func):
+            if not callable(func):
+                raise ValueError(
+                    "func must be a callable if args or kwargs are supplied"
+                )
+            elif engine == "processes":
+                # a closure could not be sent to the worker processes
+                f = partial(processes.call_udf, func, args, kwargs)
+            else:
 
                 @wraps(func)
                 def f(g):
                     return func(g, *args, **kwargs)
 
-            else:
-                raise ValueError(
-                    "func must be a callable if args or kwargs are supplied"
-                )
         else:
             f = func
 
+        apply_general = partial(
+            self._python_apply_general, engine=engine, engine_kwargs=engine_kwargs
+        )
         if not include_groups:
-            return self._python_apply_general(f, self._obj_with_exclusions)
+            return apply_general(f, self._obj_with_exclusions)
 
         try:
-            result = self._python_apply_general(f, self._selected_obj)
+            result = apply_general(f, self._selected_obj)
             if (
                 not isinstance(self.obj, Series)
                 and self._selection is None
@@ -1687,7 +1881,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             # fails on *some* columns, e.g. a numeric operation
             # on a string grouper column
 
-            return self._python_apply_general(f, self._obj_with_exclusions)
+            return apply_general(f, self._obj_with_exclusions)
 
         return result
 
@@ -1699,6 +1893,8 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         not_indexed_same: bool | None = None,
         is_transform: bool = False,
         is_agg: bool = False,
+        engine: Literal["python", "processes"] = "python",
+        engine_kwargs: dict[str, Any] | None = None,
     ) -> NDFrameT:
         """
         Apply function f in python space
@@ -1720,13 +1916,22 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             Indicator for whether the function is an aggregation. When the
             result is empty, we don't want to warn for this case.
             See _GroupBy._python_agg_general.
+        engine : {'python', 'processes'}, default 'python'
+            Whether to call f on the groups in worker processes.
+        engine_kwargs : dict, optional
+            Options of the worker processes, see ``processes.apply_groupwise``.
 
         Returns
         -------
         Series or DataFrame
             data after applying f
         """
-        values, mutated = self._grouper.apply_groupwise(f, data)
+        if engine == "processes":
+            values, mutated = processes.apply_groupwise(
+                self._grouper, f, data, engine_kwargs
+            )
+        else:
+            values, mutated = self._grouper.apply_groupwise(f, data)
         if not_indexed_same is None:
             not_indexed_same = mutated
 
@@ -1737,6 +1942,161 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             is_transform,
         )
 
+    @final
+    def _nselect(
+        self,
+        method: Literal["nlargest", "nsmallest"],
+        n: int,
+        keep: Literal["first", "last", "all"],
+        columns: IndexLabel | None = None,
+    ) -> NDFrameT:
+        """
+        Select the rows of the n largest or smallest values of each group.
+
+        The rows are selected with bounded heaps in a single pass over the
+        values, giving the result of calling ``Series.nlargest`` or
+        ``DataFrame.nlargest`` on each group, except that the tied rows of the
+        groups with at most n rows keep their original order, where
+        ``Series.nlargest`` sorts them with ``sort_values``, which is not
+        stable.
+
+        With several columns, the rows are ordered by the values of the columns
+        in turn, and the rows tied on all the columns are ordered as the ties of
+        one column. With several columns and ``keep="last"`` or missing values,
+        ``DataFrame.nlargest`` is called on each group instead.
+        """
+        if keep not in ("first", "last", "all"):
+            raise ValueError('keep must be either "first", "last" or "all"')
+        data = self._obj_with_exclusions
+        if data.ndim == 1:
+            f = partial(getattr(Series, method), n=n, keep=keep)
+            prepared = self._nselect_values(method, data._values, data.dtype)
+        else:
+            f = partial(getattr(DataFrame, method), n=n, columns=columns, keep=keep)
+            if not is_list_like(columns) or isinstance(columns, tuple):
+                columns = [columns]
+            for column in columns:
+                dtype = data[column].dtype
+                if not SelectN.is_valid_dtype_n_method(dtype):
+                    raise TypeError(
+                        f"Column {column!r} has dtype {dtype}, "
+                        f"cannot use method {method!r} with this dtype"
+                    )
+            if len(columns) == 1:
+                prepared = self._nselect_values(
+                    method, data[columns[0]]._values, data[columns[0]].dtype
+                )
+            elif keep == "last" or data[columns].isna().to_numpy().any():
+                # DataFrame.nlargest selects the rows of several columns column
+                #  by column, which no single rank follows for the ties with
+                #  keep="last" or for missing values
+                prepared = None
+            else:
+                prepared = self._nselect_rank(method, data, columns)
+
+        ids = self._grouper.ids
+        ngroups = self._grouper.ngroups
+        if prepared is None or ngroups == 0 or len(data) == 0:
+            # e.g. an ExtensionArray without a numeric representation
+            return self._python_apply_general(f, data, not_indexed_same=True)
+        values, mask = prepared
+
+        valid = ids >= 0
+        sizes = np.bincount(ids[valid], minlength=ngroups)
+        # no group has more than max(sizes) rows to select
+        n = max(min(n, sizes.max()), 0)
+        out = np.empty((ngroups, n), dtype=np.intp)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        libgroupby.group_nselect(
+            out,
+            counts,
+            values,
+            mask.view(np.uint8),
+            ids,
+            sizes,
+            largest=method == "nlargest",
+            keep_last=keep == "last",
+        )
+        positions = out[np.arange(n) < counts[:, None]]
+        labels = np.repeat(np.arange(ngroups, dtype=np.intp), counts)
+
+        if keep == "all" and n > 0:
+            # the groups with at least n values keep the ties of their n-th
+            #  value, the others keep all their missing values
+            selected = np.zeros(len(ids), dtype=bool)
+            selected[positions] = True
+            nth = np.where(counts == n, out[:, n - 1], 0)
+            tied = (counts == n) & (sizes > n)
+            tied[tied] = ~mask[nth[tied]]
+            group_tied = tied[ids] & valid
+            extra = np.where(
+                group_tied, ~mask & (values == values[nth][ids]), mask & valid
+            )
+            (extra_positions,) = np.nonzero(extra & ~selected)
+            positions = np.concatenate([positions, extra_positions])
+            labels = np.concatenate([labels, ids[extra_positions]])
+            order = np.argsort(labels, kind="stable")
+            positions = positions[order]
+            labels = labels[order]
+
+        result = data.take(positions)
+        if self.group_keys and self.as_index:
+            keys = self._grouper.result_index.take(labels)
+            index = result.index
+            result.index = MultiIndex.from_arrays(
+                [keys.get_level_values(i) for i in range(keys.nlevels)]
+                + [index.get_level_values(i) for i in range(index.nlevels)],
+                names=[*self._grouper.names, *index.names],
+            )
+        return result
+
+    @final
+    @staticmethod
+    def _nselect_values(
+        method: str, values: ArrayLike, dtype: DtypeObj
+    ) -> tuple[np.ndarray, npt.NDArray[np.bool_]] | None:
+        """
+        Get the values to select from as a numpy array, and their mask.
+        """
+        if not SelectN.is_valid_dtype_n_method(dtype):
+            raise TypeError(f"Cannot use method '{method}' with dtype {dtype}")
+        mask = isna(values)
+        if needs_i8_conversion(dtype):
+            values = values.view("i8")
+        elif isinstance(values, BaseMaskedArray):
+            values = values._data
+        elif not isinstance(values, np.ndarray):
+            return None
+        if values.dtype.kind == "b":
+            values = values.view(np.uint8)
+        elif values.dtype == np.float16:
+            values = values.astype(np.float32)
+        return np.ascontiguousarray(values), np.asarray(mask)
+
+    @final
+    @staticmethod
+    def _nselect_rank(
+        method: str, data: DataFrame, columns: list[Hashable]
+    ) -> tuple[np.ndarray, npt.NDArray[np.bool_]]:
+        """
+        Rank the rows by the values of several columns in turn, missing values
+        ranking last.
+        """
+        codes = []
+        for column in columns:
+            col_codes, uniques = algorithms.factorize(data[column]._values, sort=True)
+            if method == "nsmallest":
+                col_codes[col_codes == -1] = len(uniques)
+            codes.append(col_codes)
+        # np.lexsort sorts by the last key first
+        order = np.lexsort(codes[::-1])
+        sorted_codes = np.vstack(codes)[:, order]
+        new_rank = np.ones(len(order), dtype=bool)
+        new_rank[1:] = (sorted_codes[:, 1:] != sorted_codes[:, :-1]).any(axis=0)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.cumsum(new_rank)
+        return rank, np.zeros(len(rank), dtype=bool)
+
     @final
     def _agg_general(
         self,
@@ -1846,6 +2206,51 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         out = self._wrap_aggregated_output(res)
         return out
 
+    @final
+    def _agg_fused(self, funcs: list) -> dict[str, NDFrameT] | None:
+        """
+        Compute a list of reductions with a single pass over the data.
+
+        Returns the result of each of ``funcs`` as returned by the methods of
+        the same name, or None if the reductions cannot be fused, i.e. unless
+        ``funcs`` are names in ``base.fused_reduction_kernels`` and all the data
+        to aggregate is float64.
+        """
+        if (
+            len(funcs) < 2
+            or not all(
+                isinstance(func, str) and func in base.fused_reduction_kernels
+                for func in funcs
+            )
+            or maybe_use_numba(None)
+        ):
+            return None
+
+        data = self._get_data_to_aggregate()
+        if not all(
+            isinstance(blk.values, np.ndarray) and blk.values.dtype == np.float64
+            for blk in data.blocks
+        ):
+            return None
+
+        # results of all funcs, by block
+        cache: dict[int, dict[str, np.ndarray]] = {}
+
+        def array_func(how: str, values: np.ndarray) -> np.ndarray:
+            if id(values) not in cache:
+                cache[id(values)] = self._grouper._fused_aggregate(values, funcs)
+            return cache[id(values)][how]
+
+        results = {}
+        for how in funcs:
+            new_mgr = data.grouped_reduce(partial(array_func, how))
+            res = self._wrap_agged_manager(new_mgr)
+            out = self._wrap_aggregated_output(res)
+            if how in ["max", "mean", "min", "sum"]:
+                out = out.__finalize__(self.obj, method="groupby")
+            results[how] = out
+        return results
+
     def _cython_transform(self, how: str, numeric_only: bool = False, **kwargs):
         raise AbstractMethodError(self)
 
@@ -1855,6 +2260,8 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         if not isinstance(func, str):
             return self._transform_general(func, engine, engine_kwargs, *args, **kwargs)
 
+        elif engine == "processes":
+            raise ValueError("engine='processes' requires func to be a callable")
         elif func not in base.transform_kernel_allowlist:
             msg = f"'{func}' is not a valid function name for transform(name)"
             raise ValueError(msg)
@@ -2673,7 +3080,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
                 if _name not in in_axis_names and _name in subsetted
             )
 
-        groupings = list(self._grouper.groupings)
+        value_groupings = []
         for key in keys:
             grouper, _, _ = get_grouper(
                 df,
@@ -2682,7 +3089,28 @@ class GroupBy(BaseGroupBy[NDFrameT]):
                 observed=False,
                 dropna=dropna,
             )
-            groupings += list(grouper.groupings)
+            value_groupings += list(grouper.groupings)
+        groupings = list(self._grouper.groupings) + value_groupings
+
+        if (
+            value_groupings
+            and not isinstance(self._grouper, ops.BinGrouper)
+            and all(
+                ping._observed or not ping._passed_categorical for ping in groupings
+            )
+        ):
+            # only observed combinations of the groups and the values
+            result_series = self._value_counts_by_codes(
+                [ensure_platform_int(ping.codes) for ping in value_groupings],
+                [Index._with_infer(ping.uniques) for ping in value_groupings],
+                [ping.name for ping in value_groupings],
+                normalize=normalize,
+                sort=sort,
+                ascending=ascending,
+                dropna=dropna,
+            )
+            result_series.name = name
+            return self._wrap_value_counts(result_series, name)
 
         # Take the size of the overall columns
         gb = df.groupby(
@@ -2729,6 +3157,135 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             # Handle groups of non-observed categories
             result_series = result_series.fillna(0.0)
 
+        return self._wrap_value_counts(result_series, name)
+
+    @final
+    def _value_counts_by_codes(
+        self,
+        codes: list[npt.NDArray[np.intp]],
+        levels: list[Index],
+        names: list[Hashable],
+        normalize: bool,
+        sort: bool,
+        ascending: bool,
+        dropna: bool,
+        all_values: bool = False,
+    ) -> Series:
+        """
+        Count the combinations of values of each group from the codes of the values.
+
+        The group ids and the codes are combined into one compressed key, so that
+        the rows are counted in a single pass and only the result is sorted.
+
+        Parameters
+        ----------
+        codes : list of np.ndarray[np.intp]
+            Codes of the values of each row, -1 for missing values to skip.
+        levels : list of Index
+            Values of the codes.
+        names : list of Hashable
+            Names of the values.
+        normalize, sort, ascending, dropna : bool
+            See ``DataFrameGroupBy.value_counts``.
+        all_values : bool, default False
+            With a single level, whether to include all its values for each group,
+            with a count of 0 if the group does not have the value, e.g. for bins.
+            The proportions are then relative to all the values of the group.
+
+        Returns
+        -------
+        Series
+            The counts, indexed by the groups and the values.
+        """
+        ids = self._grouper.ids
+        ngroups = self._grouper.ngroups
+        shape = (ngroups, *(len(level) for level in levels))
+        all_codes = [ids, *codes]
+        group_index = get_group_index(all_codes, shape, sort=True, xnull=True)
+
+        counted = ids >= 0
+        if dropna:
+            for level_codes in codes:
+                counted &= level_codes >= 0
+
+        result_codes: list[np.ndarray]
+        if all_values:
+            nvalues = shape[1]
+            counts = np.bincount(
+                group_index[group_index >= 0], minlength=ngroups * nvalues
+            ).reshape(ngroups, nvalues)
+            (present,) = np.nonzero(np.bincount(ids[counted], minlength=ngroups))
+            counts = counts[present].ravel()
+            result_codes = [
+                np.repeat(present, nvalues),
+                np.tile(np.arange(nvalues), len(present)),
+            ]
+        elif np.prod(shape, dtype=np.float64) <= len(ids):
+            # few possible combinations, count them all rather than hashing
+            (positions,) = np.nonzero(group_index >= 0)
+            group_index = group_index[positions]
+            counts = np.bincount(group_index, minlength=int(np.prod(shape)))
+            (obs_group_ids,) = np.nonzero(counts)
+            if not self._grouper._sort:
+                # in the order of their first row
+                first = np.empty(len(counts), dtype=np.intp)
+                first[group_index[::-1]] = positions[::-1]
+                obs_group_ids = obs_group_ids[np.argsort(first[obs_group_ids])]
+            counts = counts[obs_group_ids]
+            result_codes = list(np.unravel_index(obs_group_ids, shape))
+        else:
+            comp_ids, obs_group_ids = compress_group_index(
+                group_index, sort=self._grouper._sort
+            )
+            counts = np.bincount(comp_ids[comp_ids >= 0], minlength=len(obs_group_ids))
+            result_codes = decons_obs_group_ids(
+                comp_ids, obs_group_ids, shape, all_codes, xnull=True
+            )
+
+        if sort:
+            # by the counts rather than the proportions, also across groups
+            key = counts if ascending else -counts
+            if self._grouper._sort or all_values:
+                # the groups stay in order
+                sorter = np.lexsort((key, result_codes[0]))
+            else:
+                sorter = np.argsort(key, kind="stable")
+            counts = counts[sorter]
+            result_codes = [level_codes[sorter] for level_codes in result_codes]
+        group_codes = result_codes[0]
+
+        if normalize:
+            if all_values:
+                # like Series.value_counts, relative to all values, in bins or not
+                counted = ids >= 0
+            totals = np.bincount(ids[counted], minlength=ngroups)
+            counts = counts / totals[group_codes]
+
+        result_index = self._grouper.result_index
+        if isinstance(result_index, MultiIndex):
+            index_levels = list(result_index.levels)
+            index_codes = [
+                np.asarray(level_codes).take(group_codes)
+                for level_codes in result_index.codes
+            ]
+        else:
+            index_levels = [result_index]
+            index_codes = [group_codes]
+        index = MultiIndex(
+            levels=index_levels + levels,
+            codes=index_codes + result_codes[1:],
+            names=self._grouper.names + names,
+            verify_integrity=False,
+        )
+        return Series(counts, index=index)
+
+    @final
+    def _wrap_value_counts(
+        self, result_series: Series, name: str
+    ) -> Series | DataFrame:
+        """
+        Convert the counts to a DataFrame if the groupby ``as_index`` is False.
+        """
         result: Series | DataFrame
         if self.as_index:
             result = result_series
@@ -2938,6 +3495,72 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             result = result.rename("size").reset_index()  # type: ignore[assignment]
         return result
 
+    @final
+    def reindex_unobserved(self, result: NDFrameT, fill_value=np.nan) -> NDFrameT:
+        """
+        Reindex the result of an aggregation to all the combinations of categories.
+
+        With ``observed="sparse"`` or ``observed=True``, the result of an
+        aggregation holds the observed combinations of the categorical groupers
+        only. The unobserved combinations are restored with ``fill_value``, the
+        value of an empty group, as computed with ``observed=False``.
+
+        Parameters
+        ----------
+        result : Series or DataFrame
+            Result of an aggregation of this groupby, indexed by the groups.
+        fill_value : scalar, default np.nan
+            Value of the unobserved combinations: 0 for ``count``, ``size`` and
+            ``sum``, 1 for ``prod`` and NaN for most other reductions, such as
+            ``mean``, ``min`` or ``first``.
+
+        Returns
+        -------
+        Series or DataFrame
+            The result with a row for every combination of the categories, in
+            the order of the groups with ``observed=False``.
+
+        See Also
+        --------
+        DataFrame.reindex : Conform DataFrame to new index with optional filling
+            logic.
+        Series.reindex : Conform Series to new index with optional filling logic.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "a": pd.Categorical(["x", "x", "y"], categories=["x", "y"]),
+        ...         "b": pd.Categorical(["u", "v", "u"], categories=["u", "v"]),
+        ...         "value": [1, 2, 3],
+        ...     }
+        ... )
+        >>> gb = df.groupby(["a", "b"], observed="sparse")
+        >>> result = gb.sum()
+        >>> result
+             value
+        a b
+        x u      1
+          v      2
+        y u      3
+        >>> gb.reindex_unobserved(result, fill_value=0)
+             value
+        a b
+        x u      1
+          v      2
+        y u      3
+          v      0
+        """
+        index = result.index
+        if list(index.names) != list(self._grouper.names):
+            raise ValueError(
+                "result must be indexed by the groups, e.g. computed with "
+                "as_index=True"
+            )
+        # the groups of observed=False, in the same order
+        full_index = self._grouper.unobserved_grouper.result_index
+        return result.reindex(full_index, fill_value=fill_value)
+
     @final
     @doc(
         _groupby_agg_method_engine_template,
@@ -4242,6 +4865,8 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         q: float | AnyArrayLike = 0.5,
         interpolation: str = "linear",
         numeric_only: bool = False,
+        method: Literal["exact", "ddsketch"] = "exact",
+        relative_accuracy: float = 0.01,
     ):
         """
         Return group values at the given quantile, a la numpy.percentile.
@@ -4252,6 +4877,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             Value(s) between 0 and 1 providing the quantile(s) to compute.
         interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
             Method to use when the desired quantile falls between two points.
+            Ignored with ``method="ddsketch"``.
         numeric_only : bool, default False
             Include only `float`, `int` or `boolean` data.
 
@@ -4261,6 +4887,24 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
                 numeric_only now defaults to ``False``.
 
+        method : {'exact', 'ddsketch'}, default 'exact'
+            With ``"exact"``, the values of each group are sorted. With
+            ``"ddsketch"``, the values of each group are counted in
+            logarithmically sized bins (a DDSketch) without sorting them, and the
+            quantiles are approximated within ``relative_accuracy`` of the
+            quantiles with ``interpolation="lower"``. Only numeric data is
+            supported and the result is float64.
+
+            .. versionadded:: 3.0.0
+
+        relative_accuracy : float, default 0.01
+            Bound of the relative error of the quantiles with
+            ``method="ddsketch"``. The number of bins of the sketch of a group
+            grows with ``log(max / min) / relative_accuracy``, for the maximum and
+            minimum absolute values of the group.
+
+            .. versionadded:: 3.0.0
+
         Returns
         -------
         Series or DataFrame
@@ -4283,7 +4927,20 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         key
         a    2.0
         b    3.0
+
+        >>> df.groupby("key").quantile(method="ddsketch").round(3)
+               val
+        key
+        a    1.994
+        b    2.974
         """
+        if method == "ddsketch":
+            return self._quantile_sketch(q, numeric_only, relative_accuracy)
+        elif method != "exact":
+            raise ValueError(
+                f"method must be 'exact' or 'ddsketch', got {method!r} instead"
+            )
+
         mgr = self._get_data_to_aggregate(numeric_only=numeric_only, name="quantile")
         obj = self._wrap_agged_manager(mgr)
         splitter = self._grouper._get_splitter(obj)
@@ -4457,6 +5114,64 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         res = self._wrap_agged_manager(res_mgr)
         return self._wrap_aggregated_output(res, qs=pass_qs)
 
+    @final
+    def _quantile_sketch(
+        self,
+        q: float | AnyArrayLike,
+        numeric_only: bool,
+        relative_accuracy: float,
+    ):
+        """
+        Approximate the quantiles of the groups with a sketch of each group.
+        """
+        mgr = self._get_data_to_aggregate(numeric_only=numeric_only, name="quantile")
+
+        if is_scalar(q):
+            qs = np.array([q], dtype=np.float64)
+            pass_qs: None | np.ndarray = None
+        else:
+            qs = np.asarray(q, dtype=np.float64)
+            pass_qs = qs
+        for q_ in qs:
+            if not 0 <= q_ <= 1:
+                raise ValueError(
+                    f"Each 'q' must be between 0 and 1. Got '{q_}' instead"
+                )
+
+        ids = self._grouper.ids
+        ngroups = self._grouper.ngroups
+
+        def blk_func(values: ArrayLike) -> ArrayLike:
+            if not is_numeric_dtype(values.dtype) or is_bool_dtype(values.dtype):
+                raise TypeError(
+                    f"'quantile' with method='ddsketch' cannot be performed "
+                    f"against '{values.dtype}' dtypes!"
+                )
+            if isinstance(values, ExtensionArray):
+                vals = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                vals = values.astype(np.float64, copy=False)
+            vals2d = np.atleast_2d(vals)
+
+            out = np.empty((len(vals2d), ngroups * len(qs)), dtype=np.float64)
+            for i, row in enumerate(vals2d):
+                notna = ~np.isnan(row)
+                keys = quantile_sketch.bin_keys(row[notna], relative_accuracy)
+                sketches = quantile_sketch.group_sketches(ids[notna], keys)
+                out[i] = quantile_sketch.sketch_quantiles(
+                    *sketches, ngroups, qs, relative_accuracy
+                ).ravel()
+
+            if vals.ndim == 1:
+                out = out[0]
+            if isinstance(values, BaseMaskedArray):
+                return FloatingArray(out, np.isnan(out))
+            return out
+
+        res_mgr = mgr.grouped_reduce(blk_func)
+        res = self._wrap_agged_manager(res_mgr)
+        return self._wrap_aggregated_output(res, qs=pass_qs)
+
     @final
     @Substitution(name="groupby")
     def ngroup(self, ascending: bool = True):
@@ -5422,6 +6137,12 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
                 np.random.Generator objects now accepted
 
+            .. versionchanged:: 3.0.0
+
+                All groups are sampled at once, so that the rows sampled for a
+                given ``random_state`` differ from previous versions, and from
+                sampling each group separately.
+
         Returns
         -------
         Series or DataFrame
@@ -5454,16 +6175,16 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
         >>> df.groupby("a").sample(n=1, random_state=1)
                a  b
-        4  black  4
+        5  black  5
         2   blue  2
-        1    red  1
+        0    red  0
 
         Set `frac` to sample fixed proportions rather than counts:
 
         >>> df.groupby("a")["b"].sample(frac=0.5, random_state=2)
         5    5
-        2    2
-        0    0
+        3    3
+        1    1
         Name: b, dtype: int64
 
         Control sample probabilities within groups by setting weights:
@@ -5484,31 +6205,20 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         size = sample.process_sampling_size(n, frac, replace)
         if weights is not None:
             weights_arr = sample.preprocess_weights(self._selected_obj, weights, axis=0)
+        else:
+            weights_arr = None
 
         random_state = com.random_state(random_state)
 
-        group_iterator = self._grouper.get_iterator(self._selected_obj)
-
-        sampled_indices = []
-        for labels, obj in group_iterator:
-            grp_indices = self.indices[labels]
-            group_size = len(grp_indices)
-            if size is not None:
-                sample_size = size
-            else:
-                assert frac is not None
-                sample_size = round(frac * group_size)
-
-            grp_sample = sample.sample(
-                group_size,
-                size=sample_size,
-                replace=replace,
-                weights=None if weights is None else weights_arr[grp_indices],
-                random_state=random_state,
-            )
-            sampled_indices.append(grp_indices[grp_sample])
-
-        sampled_indices = np.concatenate(sampled_indices)
+        sampled_indices = sample.group_sample(
+            self._grouper.ids,
+            self._grouper.ngroups,
+            size,
+            frac,
+            replace,
+            weights_arr,
+            random_state,
+        )
         return self._selected_obj.take(sampled_indices, axis=0)
 
     def _idxmax_idxmin(
@@ -7,11 +7,17 @@ from __future__ import annotations
 
 from typing import (
     TYPE_CHECKING,
+    Literal,
     final,
 )
+import weakref
 
 import numpy as np
 
+from pandas._libs import (
+    algos as libalgos,
+    lib,
+)
 from pandas._libs.tslibs import OutOfBoundsDatetime
 from pandas.errors import InvalidIndexError
 from pandas.util._decorators import cache_readonly
@@ -25,7 +31,9 @@ from pandas.core.dtypes.dtypes import CategoricalDtype
 from pandas.core import algorithms
 from pandas.core.arrays import (
     Categorical,
+    DatetimeArray,
     ExtensionArray,
+    TimedeltaArray,
 )
 import pandas.core.common as com
 from pandas.core.frame import DataFrame
@@ -407,8 +415,9 @@ class Grouping:
     obj : DataFrame or Series
     name : Label
     level :
-    observed : bool, default False
-        If we are a Categorical, use the observed values
+    observed : bool or "sparse", default False
+        If we are a Categorical, use the observed values. With "sparse", the
+        levels of the result index hold all the categories.
     in_axis : if the Grouping is a column in self.obj and hence among
         Groupby.exclusions list
     dropna : bool, default True
@@ -440,7 +449,7 @@ class Grouping:
         obj: NDFrame | None = None,
         level=None,
         sort: bool = True,
-        observed: bool = False,
+        observed: bool | Literal["sparse"] = False,
         in_axis: bool = False,
         dropna: bool = True,
         uniques: ArrayLike | None = None,
@@ -531,7 +540,9 @@ class Grouping:
         elif isinstance(getattr(grouping_vector, "dtype", None), CategoricalDtype):
             # a passed Categorical
             self._orig_cats = grouping_vector.categories
-            grouping_vector = recode_for_groupby(grouping_vector, sort, observed)
+            grouping_vector = recode_for_groupby(
+                grouping_vector, sort, bool(observed)
+            )
 
         self.grouping_vector = grouping_vector
 
@@ -656,6 +667,10 @@ class Grouping:
             cat = Categorical(self.grouping_vector, categories=self._uniques)
             codes = cat.codes
             uniques = self._uniques
+        elif (
+            result := _factorize_monotonic(self.grouping_vector, sort=self._sort)
+        ) is not None:
+            codes, uniques = result
         else:
             # GH35667, replace dropna=False with use_na_sentinel=False
             # error: Incompatible types in assignment (expression has type "Union[
@@ -694,13 +709,180 @@ class Grouping:
         )
         return grouping
 
+    @cache_readonly
+    def unobserved_grouping(self) -> Grouping:
+        if not self._observed:
+            return self
+
+        grouping = Grouping(
+            self._index,
+            self._orig_grouper,
+            obj=self.obj,
+            level=self.level,
+            sort=self._sort,
+            observed=False,
+            in_axis=self.in_axis,
+            dropna=self._dropna,
+            uniques=self._uniques,
+        )
+        return grouping
+
+
+class GroupByPlan:
+    """
+    Reusable factorization of the keys of a groupby.
+
+    Returned by :meth:`.DataFrameGroupBy.plan` and :meth:`.SeriesGroupBy.plan`
+    and passed as ``by`` to :meth:`DataFrame.groupby` or :meth:`Series.groupby`
+    of the same object, or of any object with the same index, to skip
+    factorizing the keys and computing the groups again.
+
+    The plan keeps ``sort``, ``observed`` and ``dropna`` of the groupby it was
+    created from; passing other values to ``groupby`` together with the plan
+    raises. The plan is recomputed when the index or the key columns of the
+    object it was created from are modified, which copy-on-write detects. Keys
+    given as arrays, Series or Index are copied when the plan is created, so
+    that the plan keeps grouping by their values at that time.
+    """
+
+    def __init__(
+        self,
+        obj: NDFrame,
+        keys,
+        level,
+        *,
+        sort: bool,
+        observed: bool | Literal["sparse"],
+        dropna: bool,
+        grouper: ops.BaseGrouper,
+        exclusions: frozenset[Hashable],
+    ) -> None:
+        if isinstance(grouper, ops.BinGrouper):
+            raise NotImplementedError(
+                "plan is not supported for groupers by frequency"
+            )
+        self._obj_ref = weakref.ref(obj)
+        if isinstance(keys, list):
+            self._keys = [_copy_array_key(key, exclusions) for key in keys]
+        else:
+            self._keys = _copy_array_key(keys, exclusions)
+        self._level = level
+        self._sort = sort
+        self._observed = observed
+        self._dropna = dropna
+        self._set_grouper(obj, grouper, exclusions)
+
+    def _set_grouper(
+        self,
+        obj: NDFrame,
+        grouper: ops.BaseGrouper,
+        exclusions: frozenset[Hashable],
+    ) -> None:
+        # compute the codes, result index and sort order once
+        grouper.result_index_and_ids
+        grouper.result_ilocs
+        self._grouper = grouper
+        self._exclusions = exclusions
+        # views of the key columns; writing to the columns copies their values,
+        # which the views then no longer reference
+        self._key_columns = {
+            name: obj[name]
+            for name in exclusions
+            if isinstance(obj, DataFrame) and name in obj.columns
+        }
+
+    def _is_stale(self, obj: NDFrame) -> bool:
+        if obj.index is not self._grouper.axis:
+            return True
+        for name, view in self._key_columns.items():
+            column = obj.get(name)
+            if not isinstance(column, Series) or not view._mgr.references_same_values(
+                column._mgr, 0
+            ):
+                return True
+        return False
+
+    def _get_grouper(
+        self, obj: NDFrame
+    ) -> tuple[ops.BaseGrouper, frozenset[Hashable]]:
+        source = self._obj_ref()
+        if source is not None and self._is_stale(source):
+            grouper, exclusions, _ = get_grouper(
+                source,
+                self._keys,
+                level=self._level,
+                sort=self._sort,
+                observed=self._observed,
+                dropna=self._dropna,
+            )
+            self._set_grouper(source, grouper, exclusions)
+
+        if not obj.index.equals(self._grouper.axis):
+            raise ValueError(
+                "The index of the object does not match the index of the "
+                "groupby plan"
+            )
+        if obj is source:
+            exclusions = self._exclusions
+        else:
+            # exclude the key columns only if the object has them
+            exclusions = frozenset(
+                name
+                for name in self._exclusions
+                if isinstance(obj, DataFrame) and name in obj.columns
+            )
+        return self._grouper, exclusions
+
+    def _get_options(
+        self,
+        *,
+        sort: bool | lib.NoDefault,
+        observed: bool | Literal["sparse"] | lib.NoDefault,
+        dropna: bool | lib.NoDefault,
+    ) -> tuple[bool, bool | Literal["sparse"], bool]:
+        """
+        Return sort, observed and dropna of the plan, checking that the values
+        passed to groupby, if any, match them.
+        """
+        planned = {
+            "sort": self._sort,
+            "observed": self._observed,
+            "dropna": self._dropna,
+        }
+        passed = {"sort": sort, "observed": observed, "dropna": dropna}
+        for name, value in passed.items():
+            if value is not lib.no_default and value != planned[name]:
+                raise ValueError(
+                    f"{name}={value!r} does not match {name}={planned[name]!r} "
+                    "of the groupby plan"
+                )
+        return self._sort, self._observed, self._dropna
+
+    @property
+    def ngroups(self) -> int:
+        """Number of groups of the plan."""
+        return self._grouper.ngroups
+
+
+def _copy_array_key(key, exclusions: frozenset[Hashable]):
+    """
+    Copy a key given as an array, whose changes the plan does not track.
+
+    Series that are key columns of the object are tracked, and not copied.
+    """
+    if isinstance(key, Series) and key.name in exclusions:
+        return key
+    if isinstance(key, (np.ndarray, ExtensionArray, Index, Series)):
+        return key.copy()
+    return key
+
 
 def get_grouper(
     obj: NDFrameT,
     key=None,
     level=None,
     sort: bool = True,
-    observed: bool = False,
+    observed: bool | Literal["sparse"] = False,
     validate: bool = True,
     dropna: bool = True,
 ) -> tuple[ops.BaseGrouper, frozenset[Hashable], NDFrameT]:
@@ -784,6 +966,10 @@ def get_grouper(
     elif isinstance(key, ops.BaseGrouper):
         return key, frozenset(), obj
 
+    elif isinstance(key, GroupByPlan):
+        grouper, exclusions = key._get_grouper(obj)
+        return grouper, exclusions, obj
+
     if not isinstance(key, list):
         keys = [key]
         match_axis_length = False
@@ -935,3 +1121,46 @@ def _convert_grouper(axis: Index, grouper):
         return grouper
     else:
         return grouper
+
+
+def _factorize_monotonic(
+    values: ArrayLike | Index, sort: bool
+) -> tuple[npt.NDArray[np.intp], ArrayLike | Index] | None:
+    """
+    Factorize sorted numeric or datetimelike keys without hashing.
+
+    The groups of monotonic keys are the runs of equal values, found with a
+    single scan comparing neighbouring values.
+
+    Returns
+    -------
+    tuple[np.ndarray[np.intp], ArrayLike | Index] or None
+        The codes and uniques as returned by ``algorithms.factorize``, or None
+        if the keys are not monotonic or not supported.
+    """
+    arr = values._values if isinstance(values, Index) else values
+    if isinstance(arr, (DatetimeArray, TimedeltaArray)):
+        arr = arr._ndarray.view("i8")
+        timelike = True
+    elif isinstance(arr, np.ndarray) and arr.dtype.kind in "iuf":
+        timelike = False
+    else:
+        return None
+    if len(arr) == 0 or arr.ndim != 1:
+        return None
+
+    # NaN and NaT make the keys non-monotonic
+    is_increasing, is_decreasing, _ = libalgos.is_monotonic(arr, timelike)
+    if not (is_increasing or is_decreasing):
+        return None
+
+    starts = np.concatenate([[0], np.flatnonzero(arr[1:] != arr[:-1]) + 1])
+    lengths = np.diff(starts, append=len(arr))
+    codes = np.repeat(np.arange(len(starts), dtype=np.intp), lengths)
+    uniques = values.take(starts)
+    if isinstance(uniques, Index):
+        uniques = uniques.rename(None)
+    if sort and not is_increasing:
+        codes = len(uniques) - 1 - codes
+        uniques = uniques[::-1]
+    return codes, uniques
@@ -0,0 +1,359 @@
+"""
+Incremental groupby aggregation of a stream of DataFrame chunks.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+import numpy as np
+
+from pandas.util._decorators import set_module
+
+from pandas.core.dtypes.common import is_list_like
+
+from pandas.core.array_algos import quantile_sketch
+from pandas.core.frame import DataFrame
+from pandas.core.indexes.api import MultiIndex
+from pandas.core.reshape.concat import concat
+from pandas.core.series import Series
+from pandas.core.sorting import lexsort_indexer
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from pandas import Index
+
+# the partial states needed by each of the supported reductions
+_STATES = {
+    "count": ["count"],
+    "sum": ["sum"],
+    "mean": ["count", "sum"],
+    "var": ["count", "sum", "m2"],
+    "std": ["count", "sum", "m2"],
+    "min": ["min"],
+    "max": ["max"],
+    "median": ["count"],
+}
+
+
+@set_module("pandas.api.groupby")
+class IncrementalAggregator:
+    """
+    Aggregate the groups of a stream of DataFrame chunks.
+
+    The chunks, e.g. from ``read_csv`` with ``chunksize`` or from the batches of a
+    parquet file, are passed to :meth:`update` one at a time. Only a compact
+    state of the partial aggregations of each group is kept in memory, so that
+    data not fitting in memory can be aggregated. The states of aggregators
+    running in different processes can be combined with :meth:`merge`.
+
+    .. versionadded:: 3.0.0
+
+    Parameters
+    ----------
+    keys : label or list of labels
+        Columns of the chunks to group by.
+    aggs : dict of {label: str or list of str}
+        Columns to aggregate and the reductions to compute for them, among
+        ``"count"``, ``"sum"``, ``"mean"``, ``"var"``, ``"std"``, ``"min"``,
+        ``"max"`` and ``"median"``.
+    sort : bool, default True
+        Sort the groups of the result by their keys.
+    dropna : bool, default True
+        Drop the rows with NA keys, as in :meth:`DataFrame.groupby`.
+    relative_accuracy : float, default 0.01
+        Bound of the relative error of ``"median"``, which is approximated with
+        a sketch of the values of each group as in
+        ``DataFrameGroupBy.quantile(method="ddsketch")``.
+
+    See Also
+    --------
+    DataFrame.groupby : Group DataFrame using a mapper or by a Series of columns.
+    DataFrameGroupBy.agg : Aggregate using one or more operations.
+
+    Notes
+    -----
+    The result is the same as ``df.groupby(keys).agg(aggs)`` on the
+    concatenation ``df`` of the chunks, up to floating point rounding for
+    ``"sum"``, ``"mean"``, ``"var"`` and ``"std"``, and within
+    ``relative_accuracy`` of the median with ``interpolation="lower"`` for
+    ``"median"``. The variances are combined with the parallel algorithm of
+    Chan et al.
+
+    Examples
+    --------
+    >>> from pandas.api.groupby import IncrementalAggregator
+    >>> agg = IncrementalAggregator("key", {"x": ["sum", "mean"], "y": "max"})
+    >>> agg.update(pd.DataFrame({"key": ["a", "b"], "x": [1, 2], "y": [5, 6]}))
+    >>> agg.update(pd.DataFrame({"key": ["a", "c"], "x": [3, 4], "y": [7, 8]}))
+    >>> agg.result()
+           x          y
+         sum mean   max
+    key
+    a      4  2.0     7
+    b      2  2.0     6
+    c      4  4.0     8
+
+    Aggregators of separate parts of the data can be merged:
+
+    >>> other = IncrementalAggregator("key", {"x": ["sum", "mean"], "y": "max"})
+    >>> other.update(pd.DataFrame({"key": ["c"], "x": [6], "y": [0]}))
+    >>> agg.merge(other)
+    >>> agg.result()
+           x          y
+         sum mean   max
+    key
+    a      4  2.0     7
+    b      2  2.0     6
+    c     10  5.0     8
+    """
+
+    def __init__(
+        self,
+        keys: Hashable | list[Hashable],
+        aggs: dict[Hashable, str | list[str]],
+        *,
+        sort: bool = True,
+        dropna: bool = True,
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        if not isinstance(aggs, dict) or not aggs:
+            raise TypeError("aggs must be a non-empty dict of columns to reductions")
+        for col, funcs in aggs.items():
+            for func in [funcs] if isinstance(funcs, str) else funcs:
+                if func not in _STATES:
+                    raise ValueError(
+                        f"'{func}' is not supported by IncrementalAggregator, the "
+                        f"supported reductions are {list(_STATES)}"
+                    )
+        # validate early rather than on the first chunk
+        quantile_sketch.bin_keys(np.array([]), relative_accuracy)
+        self.keys = keys
+        self.aggs = aggs
+        self.sort = sort
+        self.dropna = dropna
+        self.relative_accuracy = relative_accuracy
+        # the partial states of each column, by group
+        self._state: DataFrame | None = None
+        # the counts of the bins of the sketches of the columns with a median,
+        #  by group and bin
+        self._sketches: dict[Hashable, Series] = {}
+
+    def __repr__(self) -> str:
+        ngroups = 0 if self._state is None else len(self._state)
+        return (
+            f"{type(self).__name__}(keys={self.keys!r}, aggs={self.aggs!r}, "
+            f"ngroups={ngroups})"
+        )
+
+    @property
+    def _key_list(self) -> list[Hashable]:
+        return list(self.keys) if is_list_like(self.keys) else [self.keys]
+
+    def _states(self, col: Hashable) -> list[str]:
+        funcs = self.aggs[col]
+        states = {
+            state
+            for func in ([funcs] if isinstance(funcs, str) else funcs)
+            for state in _STATES[func]
+        }
+        return [s for s in ["count", "sum", "m2", "min", "max"] if s in states]
+
+    def _has_median(self, col: Hashable) -> bool:
+        funcs = self.aggs[col]
+        return "median" in ([funcs] if isinstance(funcs, str) else funcs)
+
+    def update(self, df: DataFrame) -> None:
+        """
+        Add the rows of a chunk to the aggregation.
+
+        The groups of the chunk are aggregated with the groupby reductions and
+        merged into the state of the aggregator.
+
+        Parameters
+        ----------
+        df : DataFrame
+            Chunk with the key columns and the columns to aggregate.
+        """
+        gb = df.groupby(self.keys, sort=False, dropna=self.dropna, observed=True)
+        partials = {}
+        for col in self.aggs:
+            colgb = gb[col]
+            for state in self._states(col):
+                if state == "m2":
+                    # sum of the squared deviations from the mean of the group
+                    partial = colgb.var(ddof=0) * partials[col, "count"]
+                else:
+                    partial = getattr(colgb, state)()
+                partials[col, state] = partial
+        self._combine(DataFrame(partials))
+
+        grouper = gb._grouper
+        for col in self.aggs:
+            if not self._has_median(col):
+                continue
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            notna = ~np.isnan(values)
+            ids, bins, counts = quantile_sketch.group_sketches(
+                grouper.ids[notna],
+                quantile_sketch.bin_keys(values[notna], self.relative_accuracy),
+            )
+            groups = grouper.result_index.take(ids)
+            index = MultiIndex.from_arrays(
+                [groups.get_level_values(i) for i in range(groups.nlevels)] + [bins],
+                names=[*self._key_list, None],
+            )
+            self._combine_sketch(col, Series(counts, index=index))
+
+    def merge(self, other: IncrementalAggregator) -> None:
+        """
+        Merge the state of another aggregator into this one.
+
+        Parameters
+        ----------
+        other : IncrementalAggregator
+            Aggregator with the same keys and reductions, e.g. one that has
+            aggregated other chunks in another process.
+        """
+        if not isinstance(other, IncrementalAggregator):
+            raise TypeError(
+                f"can only merge an IncrementalAggregator, not {type(other).__name__}"
+            )
+        if (
+            other.keys != self.keys
+            or other.aggs != self.aggs
+            or other.relative_accuracy != self.relative_accuracy
+        ):
+            raise ValueError(
+                "can only merge aggregators with the same keys, aggs and "
+                "relative_accuracy"
+            )
+        if other._state is not None:
+            self._combine(other._state)
+        for col, sketch in other._sketches.items():
+            self._combine_sketch(col, sketch)
+
+    def _combine_sketch(self, col: Hashable, sketch: Series) -> None:
+        """
+        Merge the sketches of a column by adding up the counts of their bins.
+        """
+        if col in self._sketches:
+            sketch = concat([self._sketches[col], sketch])
+            levels = list(range(sketch.index.nlevels))
+            sketch = sketch.groupby(level=levels, sort=False, dropna=self.dropna).sum()
+        self._sketches[col] = sketch
+
+    def _combine(self, partials: DataFrame) -> None:
+        """
+        Combine partial states, possibly with several rows per group.
+        """
+        if self._state is not None:
+            partials = concat([self._state, partials])
+        levels = list(range(partials.index.nlevels))
+        gb = partials.groupby(level=levels, sort=False, dropna=self.dropna)
+
+        # counts and sums add up, minima and maxima are reduced again
+        results = []
+        for name, how in [
+            ("count", "sum"),
+            ("sum", "sum"),
+            ("min", "min"),
+            ("max", "max"),
+        ]:
+            columns = [key for key in partials.columns if key[1] == name]
+            if columns:
+                results.append(getattr(gb[columns], how)())
+        state = concat(results, axis=1)
+
+        # the sums of the squared deviations from the means of the partial states
+        #  are combined with the deviations of these means from the group means
+        ids = gb.ngroup().to_numpy()
+        for col, name in partials.columns:
+            if name != "m2":
+                continue
+            count = partials[(col, "count")].to_numpy()
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = partials[(col, "sum")].to_numpy(dtype=np.float64) / count
+                group_mean = state[(col, "sum")].to_numpy(dtype=np.float64) / state[
+                    (col, "count")
+                ].to_numpy()
+            m2 = partials[(col, "m2")].to_numpy(dtype=np.float64)
+            m2 = np.where(count > 0, m2 + count * (mean - group_mean[ids]) ** 2, 0.0)
+            state[(col, "m2")] = np.bincount(ids, weights=m2, minlength=len(state))
+        self._state = state.reindex(columns=partials.columns)
+
+    def _median(self, col: Hashable, groups: Index) -> Series:
+        """
+        Approximate the medians of a column from the sketches of the groups.
+        """
+        sketch = self._sketches.get(col)
+        if sketch is None:
+            return Series(np.nan, index=groups)
+        ids, bins, counts = quantile_sketch.group_sketches(
+            groups.get_indexer(sketch.index.droplevel(-1)),
+            sketch.index.get_level_values(-1).to_numpy(),
+            sketch.to_numpy(),
+        )
+        medians = quantile_sketch.sketch_quantiles(
+            ids, bins, counts, len(groups), np.array([0.5]), self.relative_accuracy
+        )
+        return Series(medians[:, 0], index=groups)
+
+    def result(self) -> DataFrame:
+        """
+        Compute the reductions of the groups of all chunks.
+
+        Returns
+        -------
+        DataFrame
+            The same as ``DataFrame.groupby(keys).agg(aggs)``.
+        """
+        if self._state is None:
+            raise ValueError("No chunks have been aggregated")
+        state = self._state
+        if self.sort:
+            index = state.index
+            # NA keys may be values of the levels of a MultiIndex
+            order = lexsort_indexer(
+                [index.get_level_values(i) for i in range(index.nlevels)],
+                na_position="last",
+            )
+            state = state.take(order)
+
+        results: dict[Hashable, Any] = {}
+        for col, funcs in self.aggs.items():
+            columns: dict[str, Series] = {}
+            for func in [funcs] if isinstance(funcs, str) else funcs:
+                if func in ["count", "sum", "min", "max"]:
+                    res = state[(col, func)]
+                elif func == "mean":
+                    res = state[(col, "sum")] / state[(col, "count")]
+                elif func == "median":
+                    res = self._median(col, state.index)
+                else:
+                    count = state[(col, "count")]
+                    res = state[(col, "m2")] / (count - 1).where(count > 1)
+                    if func == "std":
+                        res = np.sqrt(res)
+                columns[func] = res.rename(col)
+            results[col] = (
+                columns[funcs] if isinstance(funcs, str) else DataFrame(columns)
+            )
+
+        if all(isinstance(funcs, str) for funcs in self.aggs.values()):
+            result = DataFrame(results)
+        else:
+            result = concat(
+                [
+                    DataFrame({funcs: res}) if isinstance(funcs, str) else res
+                    for funcs, res in zip(self.aggs.values(), results.values())
+                ],
+                axis=1,
+                keys=list(results),
+            )
+        result.index.names = self._key_list
+        return result
@@ -123,6 +123,75 @@ def generate_numba_agg_func(
     return group_agg
 
 
+@functools.cache
+def generate_numba_multi_column_agg_func(
+    func: Callable[..., Scalar | tuple | np.ndarray],
+    nopython: bool,
+    nogil: bool,
+    parallel: bool,
+) -> Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Any], np.ndarray]:
+    """
+    Generate a numba jitted agg function receiving all the columns of a group.
+
+    1. jit the user's function
+    2. Return a groupby agg function with the jitted function inline, calling it
+       once per group with the 2D array of the values of the group
+
+    The user's function returns a scalar, or a tuple or array of the same
+    length for each group, e.g. several statistics of the group.
+
+    Configurations specified in engine_kwargs apply to both the user's
+    function _AND_ the groupby evaluation loop.
+
+    Parameters
+    ----------
+    func : function
+        function to be applied to each group and will be JITed
+    nopython : bool
+        nopython to be passed into numba.jit
+    nogil : bool
+        nogil to be passed into numba.jit
+    parallel : bool
+        parallel to be passed into numba.jit
+
+    Returns
+    -------
+    Numba function
+    """
+    numba_func = jit_user_function(func)
+    if TYPE_CHECKING:
+        import numba
+    else:
+        numba = import_optional_dependency("numba")
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def group_agg(
+        values: np.ndarray,
+        index: np.ndarray,
+        begin: np.ndarray,
+        end: np.ndarray,
+        *args: Any,
+    ) -> np.ndarray:
+        assert len(begin) == len(end)
+        num_groups = len(begin)
+
+        # the first group gives the number of outputs
+        group = values[begin[0] : end[0]]
+        group_index = index[begin[0] : end[0]]
+        first = np.atleast_1d(np.asarray(numba_func(group, group_index, *args)))
+        result = np.empty((num_groups, len(first)))
+        result[0] = first
+        # the groups are contiguous in the sorted data, so that each thread
+        #  works on its own slices of the data
+        for i in numba.prange(1, num_groups):
+            group = values[begin[i] : end[i]]
+            group_index = index[begin[i] : end[i]]
+            result[i] = np.atleast_1d(np.asarray(numba_func(group, group_index, *args)))
+        return result
+
+    return group_agg
+
+
 @functools.cache
 def generate_numba_transform_func(
     func: Callable[..., np.ndarray],
@@ -9,7 +9,13 @@ are contained *in* the SeriesGroupBy and DataFrameGroupBy objects.
 from __future__ import annotations
 
 import collections
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+)
 import functools
+import os
+import threading
 from typing import (
     TYPE_CHECKING,
     Generic,
@@ -18,6 +24,8 @@ from typing import (
 
 import numpy as np
 
+from pandas._config import get_option
+
 from pandas._libs import (
     NaT,
     lib,
@@ -72,6 +80,7 @@ if TYPE_CHECKING:
         Callable,
         Generator,
         Hashable,
+        Iterable,
         Iterator,
     )
 
@@ -103,6 +112,37 @@ def extract_result(res):
     return res
 
 
+# minimum number of values of a block to split its columns across threads
+_PARALLEL_MIN_SIZE = 1 << 16
+
+
+def _get_groupby_threads() -> int:
+    threads = get_option("compute.groupby_threads")
+    if threads == 0:
+        threads = os.cpu_count() or 1
+    return threads
+
+
+# the pool shared by the kernels, replaced when the number of threads changes
+_thread_pool: ThreadPoolExecutor | None = None
+_thread_pool_workers = 0
+_thread_pool_lock = threading.Lock()
+
+
+def _get_thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    global _thread_pool, _thread_pool_workers
+    with _thread_pool_lock:
+        if _thread_pool is None or _thread_pool_workers != max_workers:
+            if _thread_pool is not None:
+                # the threads exit once the tasks already submitted are done
+                _thread_pool.shutdown(wait=False)
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pandas-groupby"
+            )
+            _thread_pool_workers = max_workers
+        return _thread_pool
+
+
 class WrappedCythonOp:
     """
     Dispatch logic for functions defined in _libs.groupby
@@ -123,11 +163,35 @@ class WrappedCythonOp:
         ["any", "all", "rank", "count", "size", "idxmin", "idxmax"]
     )
 
+    # Reductions computed with the ufunc's reduceat over the segments of groups
+    #  that are contiguous in the values (see BaseGrouper.segment_starts), for
+    #  the dtype kinds with which the results are the same as with the cython
+    #  kernels (e.g. not float sums, which use Kahan summation).
+    _SEGMENT_REDUCTIONS: dict[str, tuple[np.ufunc, str]] = {
+        "sum": (np.add, "iub"),
+        "prod": (np.multiply, "iub"),
+        "min": (np.fmin, "iufb"),
+        "max": (np.fmax, "iufb"),
+    }
+
     def __init__(self, kind: str, how: str, has_dropped_na: bool) -> None:
         self.kind = kind
         self.how = how
         self.has_dropped_na = has_dropped_na
 
+    def uses_segments(self, values: ArrayLike, min_count: int) -> bool:
+        """
+        Whether the operation on values can be computed over contiguous segments.
+        """
+        if self.kind != "aggregate" or self.how not in self._SEGMENT_REDUCTIONS:
+            return False
+        kinds = self._SEGMENT_REDUCTIONS[self.how][1]
+        return (
+            isinstance(values, np.ndarray)
+            and values.dtype.kind in kinds
+            and min_count <= 1
+        )
+
     _CYTHON_FUNCTIONS: dict[str, dict] = {
         "aggregate": {
             "any": functools.partial(libgroupby.group_any_all, val_test="any"),
@@ -362,6 +426,7 @@ class WrappedCythonOp:
         comp_ids: np.ndarray,
         mask: npt.NDArray[np.bool_] | None,
         result_mask: npt.NDArray[np.bool_] | None,
+        segment_starts: npt.NDArray[np.intp] | None = None,
         **kwargs,
     ) -> np.ndarray:  # np.ndarray[ndim=2]
         orig_values = values
@@ -404,7 +469,23 @@ class WrappedCythonOp:
         out_dtype = self._get_out_dtype(values.dtype)
 
         result = maybe_fill(np.empty(out_shape, dtype=out_dtype))
-        if self.kind == "aggregate":
+
+        threads = _get_groupby_threads()
+        if (
+            threads > 1
+            and values.dtype != object
+            and self.how != "ohlc"
+            and values.shape[1] > 1
+            and values.size >= _PARALLEL_MIN_SIZE
+        ):
+            func = functools.partial(self._call_parallel, func, threads)
+
+        if self.kind == "aggregate" and segment_starts is not None:
+            # the groups are contiguous and non-empty
+            ufunc = self._SEGMENT_REDUCTIONS[self.how][0]
+            ufunc.reduceat(values, segment_starts, axis=0, out=result)
+            counts = np.diff(segment_starts, append=len(values))
+        elif self.kind == "aggregate":
             counts = np.zeros(ngroups, dtype=np.int64)
             if self.how in [
                 "idxmin",
@@ -432,10 +513,10 @@ class WrappedCythonOp:
                 if self.how in ["std", "sem"]:
                     kwargs["is_datetimelike"] = is_datetimelike
                 func(
-                    result,
-                    counts,
-                    values,
-                    comp_ids,
+                    out=result,
+                    counts=counts,
+                    values=values,
+                    labels=comp_ids,
                     min_count=min_count,
                     mask=mask,
                     result_mask=result_mask,
@@ -511,6 +592,49 @@ class WrappedCythonOp:
 
         return op_result
 
+    @final
+    def _call_parallel(self, func: Callable, threads: int, **kwargs) -> None:
+        """
+        Call the cython function on blocks of the columns on a thread pool.
+
+        Each block gets its own C-contiguous outputs, which are copied back to
+        the outputs once the kernel (which releases the GIL) has finished.
+        """
+        out = kwargs["out"]
+        values = kwargs["values"]
+        mask = kwargs.get("mask")
+        result_mask = kwargs.get("result_mask")
+        counts = kwargs.get("counts")
+
+        ncols = values.shape[1]
+        bounds = np.linspace(0, ncols, min(threads, ncols) + 1).astype(np.intp)
+
+        def call_block(start: int, stop: int) -> None:
+            cols = slice(start, stop)
+            block_kwargs = dict(kwargs)
+            block_kwargs["out"] = out[:, cols].copy()
+            block_kwargs["values"] = values[:, cols]
+            if mask is not None:
+                block_kwargs["mask"] = np.ascontiguousarray(mask[:, cols])
+            if result_mask is not None:
+                block_kwargs["result_mask"] = result_mask[:, cols].copy()
+            if counts is not None and start > 0:
+                # the counts by group are the same for all blocks
+                block_kwargs["counts"] = np.zeros_like(counts)
+            func(**block_kwargs)
+            out[:, cols] = block_kwargs["out"]
+            if result_mask is not None:
+                result_mask[:, cols] = block_kwargs["result_mask"]
+
+        pool = _get_thread_pool(threads)
+        futures = [
+            pool.submit(call_block, start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
     @final
     def _validate_axis(self, axis: AxisInt, values: ArrayLike) -> None:
         if values.ndim > 2:
@@ -721,6 +845,32 @@ class BaseGrouper:
         # return if my group orderings are monotonic
         return Index(self.ids).is_monotonic_increasing
 
+    @final
+    @cache_readonly
+    def segment_starts(self) -> npt.NDArray[np.intp] | None:
+        """
+        Start of each group in the input, if the groups are contiguous segments.
+
+        This is the case when the ids are monotonic increasing, e.g. with keys
+        sorted by ``sort_values`` or a sorted time index, and no group is empty
+        or dropped. Reductions can then run over the contiguous segments of the
+        values rather than scatter them into the groups by their ids.
+        """
+        ids = self.ids
+        ngroups = self.ngroups
+        if (
+            ngroups == 0
+            or ids[0] != 0
+            or ids[-1] != ngroups - 1
+            or not self.is_monotonic
+        ):
+            return None
+        starts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        if len(starts) != ngroups - 1:
+            # some ids are skipped, i.e. groups are empty
+            return None
+        return np.concatenate([[0], starts]).astype(np.intp, copy=False)
+
     @final
     @cache_readonly
     def has_dropped_na(self) -> bool:
@@ -763,7 +913,10 @@ class BaseGrouper:
             result_index.name = self.names[0]
             ids = ensure_platform_int(self.codes[0])
         elif all(obs):
-            result_index, ids = self._ob_index_and_ids(levels, self.codes, self.names)
+            codes = self.codes
+            if any(ping._observed == "sparse" for ping in self.groupings):
+                levels, codes = self._with_all_categories(levels, codes)
+            result_index, ids = self._ob_index_and_ids(levels, codes, self.names)
         elif not any(obs):
             result_index, ids = self._unob_index_and_ids(levels, self.codes, self.names)
         else:
@@ -830,6 +983,47 @@ class BaseGrouper:
         grouper = BaseGrouper(self.axis, groupings, sort=self._sort, dropna=self.dropna)
         return grouper
 
+    @cache_readonly
+    def unobserved_grouper(self) -> BaseGrouper:
+        if not any(ping._observed for ping in self.groupings):
+            return self
+
+        groupings = [ping.unobserved_grouping for ping in self.groupings]
+        grouper = BaseGrouper(self.axis, groupings, sort=self._sort, dropna=self.dropna)
+        return grouper
+
+    def _with_all_categories(
+        self,
+        levels: list[Index],
+        codes: list[npt.NDArray[np.intp]],
+    ) -> tuple[list[Index], list[npt.NDArray[np.intp]]]:
+        """
+        Replace the observed levels of the categorical groupings by all their
+        categories, and recode the codes accordingly.
+
+        With observed="sparse" the groups are the observed combinations of
+        categories, while the levels of the result index hold all the
+        categories, so that the unobserved combinations can be restored.
+        """
+        levels, codes = list(levels), list(codes)
+        for k, (ping, level) in enumerate(zip(self.groupings, levels)):
+            if not ping._passed_categorical:
+                continue
+            assert isinstance(level, CategoricalIndex)
+            n_categories = len(level.categories)
+            level_codes = level.codes
+            full_codes = np.arange(n_categories)
+            if (level_codes == -1).any():
+                # the NA group of dropna=False comes after the categories
+                level_codes = np.where(level_codes == -1, n_categories, level_codes)
+                full_codes = np.append(full_codes, -1)
+            levels[k] = CategoricalIndex(
+                Categorical.from_codes(full_codes, dtype=level.dtype),
+                name=level.name,
+            )
+            codes[k] = np.where(codes[k] == -1, -1, level_codes.take(codes[k]))
+        return levels, codes
+
     def _ob_index_and_ids(
         self,
         levels: list[Index],
@@ -894,6 +1088,8 @@ class BaseGrouper:
         assert kind in ["transform", "aggregate"]
 
         cy_op = WrappedCythonOp(kind=kind, how=how, has_dropped_na=self.has_dropped_na)
+        if cy_op.uses_segments(values, min_count):
+            kwargs["segment_starts"] = self.segment_starts
 
         return cy_op.cython_operation(
             values=values,
@@ -904,6 +1100,62 @@ class BaseGrouper:
             **kwargs,
         )
 
+    @final
+    def _fused_aggregate(
+        self, values: np.ndarray, hows: Iterable[str]
+    ) -> dict[str, np.ndarray]:
+        """
+        Compute several reductions of float64 values with a single pass.
+
+        Parameters
+        ----------
+        values : np.ndarray[np.float64]
+            Values of a block, 1D or 2D with the groups along the last axis.
+        hows : iterable of str
+            Names of the reductions, a subset of ``base.fused_reduction_kernels``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The result of each reduction, the same as ``_cython_operation``.
+        """
+        hows = set(hows)
+        ngroups = self.ngroups
+        values2d = np.atleast_2d(values)
+        shape = (ngroups, values2d.shape[0])
+
+        nobs = np.zeros(shape, dtype=np.int64)
+        sumx = np.zeros(shape) if hows & {"sum", "mean"} else None
+        ssqdm = np.zeros(shape) if hows & {"std", "var"} else None
+        minx = np.full(shape, np.inf) if "min" in hows else None
+        maxx = np.full(shape, -np.inf) if "max" in hows else None
+        libgroupby.group_fused_agg(
+            nobs, values2d.T, self.ids, sumx=sumx, ssqdm=ssqdm, minx=minx, maxx=maxx
+        )
+
+        empty = nobs == 0
+        results = {}
+        for how in hows:
+            if how == "count":
+                result = nobs
+            elif how == "sum":
+                result = sumx
+            elif how == "mean":
+                result = np.divide(sumx, nobs, where=~empty, out=np.full(shape, np.nan))
+            elif how in ["std", "var"]:
+                result = np.divide(
+                    ssqdm, nobs - 1, where=nobs > 1, out=np.full(shape, np.nan)
+                )
+                if how == "std":
+                    np.sqrt(result, out=result)
+            else:
+                result = minx if how == "min" else maxx
+                result[empty] = np.nan
+
+            result = result.T
+            results[how] = result if values.ndim == 2 else result[0]
+        return results
+
     @final
     def agg_series(
         self, obj: Series, func: Callable, preserve_dtype: bool = False
@@ -0,0 +1,157 @@
+"""
+Engine calling user defined functions on the groups in worker processes.
+
+The sorted data is cut into batches of consecutive groups, so that each worker
+receives a single contiguous slice of the data per batch rather than one
+object per group. The results are returned in the order of the groups.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+import numpy as np
+
+from pandas._libs import lib
+
+from pandas.core.groupby.ops import _is_indexed_like
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Hashable,
+    )
+
+    from pandas import (
+        DataFrame,
+        Series,
+    )
+    from pandas.core.groupby.ops import BaseGrouper
+
+
+def call_udf(func: Callable, args: tuple, kwargs: dict[str, Any], group):
+    """
+    Call ``func(group, *args, **kwargs)``, as a picklable partial function.
+    """
+    return func(group, *args, **kwargs)
+
+
+def _validate_engine_kwargs(
+    engine_kwargs: dict[str, Any] | None, ngroups: int
+) -> tuple[int, int]:
+    engine_kwargs = engine_kwargs or {}
+    unknown = set(engine_kwargs) - {"max_workers", "batch_size"}
+    if unknown:
+        raise ValueError(
+            "engine_kwargs for engine='processes' only accept 'max_workers' and "
+            f"'batch_size', got {sorted(unknown)}"
+        )
+    max_workers = engine_kwargs.get("max_workers") or os.cpu_count() or 1
+    batch_size = engine_kwargs.get("batch_size")
+    if batch_size is None:
+        # a few batches per worker to balance groups of unequal cost
+        batch_size = -(-ngroups // (4 * max_workers))
+    if not lib.is_integer(max_workers) or max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+    if not lib.is_integer(batch_size) or batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    return max_workers, batch_size
+
+
+def _apply_batch(
+    f: Callable,
+    batch: DataFrame | Series,
+    keys: list[Hashable],
+    starts: np.ndarray,
+    ends: np.ndarray,
+) -> tuple[list, bool]:
+    """
+    Call ``f`` on each group of a batch, in a worker process.
+    """
+    result_values = []
+    mutated = False
+    for key, start, end in zip(keys, starts, ends):
+        group = batch.iloc[start:end]
+        object.__setattr__(group, "name", key)
+        group_axes = group.axes
+        res = f(group)
+        if not mutated and not _is_indexed_like(res, group_axes):
+            mutated = True
+        result_values.append(res)
+    return result_values, mutated
+
+
+def apply_groupwise(
+    grouper: BaseGrouper,
+    f: Callable,
+    data: DataFrame | Series,
+    engine_kwargs: dict[str, Any] | None = None,
+) -> tuple[list, bool]:
+    """
+    Call ``f`` on each group in worker processes, like
+    :meth:`BaseGrouper.apply_groupwise`.
+
+    Parameters
+    ----------
+    grouper : BaseGrouper
+    f : callable
+        Function to call on each group, which must be picklable.
+    data : Series or DataFrame
+    engine_kwargs : dict, optional
+        ``max_workers``, the number of processes, by default the number of
+        CPUs, and ``batch_size``, the number of groups sent to a process at once.
+
+    Returns
+    -------
+    list
+        Results of the groups, in the order of the groups.
+    bool
+        Whether any result is not indexed like its group.
+    """
+    ngroups = grouper.ngroups
+    max_workers, batch_size = _validate_engine_kwargs(engine_kwargs, ngroups)
+    if ngroups == 0:
+        # the serial path handles the dummy call on the empty data
+        return grouper.apply_groupwise(f, data)
+
+    splitter = grouper._get_splitter(data)
+    sdata = splitter._sorted_data
+    starts, ends = lib.generate_slices(splitter._slabels, ngroups)
+    # the empty groups have no position in the sorted data
+    sizes = ends - starts
+    offsets = np.cumsum(sizes) - sizes
+    keys = list(grouper.result_index)
+
+    result_values = []
+    mutated = False
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for first in range(0, ngroups, batch_size):
+            last = min(first + batch_size, ngroups)
+            lo = offsets[first]
+            hi = offsets[last - 1] + sizes[last - 1]
+            futures.append(
+                pool.submit(
+                    _apply_batch,
+                    f,
+                    sdata.iloc[lo:hi],
+                    keys[first:last],
+                    offsets[first:last] - lo,
+                    offsets[first:last] + sizes[first:last] - lo,
+                )
+            )
+        try:
+            for future in futures:
+                values, batch_mutated = future.result()
+                result_values.extend(values)
+                mutated = mutated or batch_mutated
+        except BaseException:
+            # as in the serial path, the first error stops the computation
+            pool.shutdown(cancel_futures=True)
+            raise
+    return result_values, mutated
@@ -7,7 +7,10 @@ from datetime import timedelta
 import numpy as np
 
 from pandas._libs.tslibs import BaseOffset
-from pandas._libs.window.indexers import calculate_variable_window_bounds
+from pandas._libs.window.indexers import (
+    calculate_grouped_variable_window_bounds,
+    calculate_variable_window_bounds,
+)
 from pandas.util._decorators import Appender
 
 from pandas.core.dtypes.common import ensure_platform_int
@@ -455,6 +458,18 @@ class GroupbyIndexer(BaseIndexer):
         closed: str | None = None,
         step: int | None = None,
     ) -> tuple[np.ndarray, np.ndarray]:
+        if (
+            self.window_indexer
+            in (FixedWindowIndexer, VariableWindowIndexer, ExpandingIndexer)
+            and not self.indexer_kwargs
+            and step is None
+            and (
+                self.window_indexer is not VariableWindowIndexer
+                or self.index_array is not None
+            )
+        ):
+            return self._get_grouped_window_bounds(center, closed)
+
         # 1) For each group, get the indices that belong to the group
         # 2) Use the indices to calculate the start & end bounds of the window
         # 3) Append the window bounds in group order
@@ -499,6 +514,53 @@ class GroupbyIndexer(BaseIndexer):
         end = np.concatenate(end_arrays)
         return start, end
 
+    def _get_grouped_window_bounds(
+        self, center: bool | None, closed: str | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the bounds of the builtin indexers for all groups at once, as
+        the window bounds of each group would be, offset by the position of the
+        group in the values.
+        """
+        indices = list(self.groupby_indices.values())
+        sizes = np.fromiter(map(len, indices), dtype=np.int64, count=len(indices))
+        num_values = int(sizes.sum())
+        if num_values == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        offsets = np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+        if self.window_indexer is VariableWindowIndexer:
+            assert self.index_array is not None  # for mypy
+            index_array = self.index_array.take(
+                ensure_platform_int(np.concatenate(indices))
+            )
+            return calculate_grouped_variable_window_bounds(
+                sizes,
+                self.window_size,
+                center,  # type: ignore[arg-type]
+                closed,
+                index_array,
+            )
+        elif self.window_indexer is ExpandingIndexer:
+            return offsets, np.arange(1, num_values + 1, dtype=np.int64)
+
+        # as in FixedWindowIndexer, with the positions within each group
+        if center or self.window_size == 0:
+            offset = (self.window_size - 1) // 2
+        else:
+            offset = 0
+        group_sizes = np.repeat(sizes, sizes)
+        end = np.arange(1 + offset, num_values + 1 + offset, dtype=np.int64) - offsets
+        start = end - self.window_size
+        if closed in ["left", "both"]:
+            start -= 1
+        if closed in ["left", "neither"]:
+            end -= 1
+
+        end = np.clip(end, 0, group_sizes) + offsets
+        start = np.clip(start, 0, group_sizes) + offsets
+        return start, end
+
 
 class ExponentialMovingWindowIndexer(BaseIndexer):
     """Calculate ewm window bounds (the entire window)"""
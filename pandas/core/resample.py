@@ -1460,6 +1460,9 @@ class Resampler(BaseGroupBy, PandasObject):
         Parameters
         ----------
         q : float or array-like, default 0.5 (50% quantile)
+        **kwargs
+            Passed to :meth:`DataFrameGroupBy.quantile`, e.g. ``interpolation``
+            or ``method="ddsketch"`` to approximate the quantiles of large bins.
 
         Returns
         -------
@@ -16,7 +16,10 @@ from pandas.core.dtypes.generic import (
 )
 
 if TYPE_CHECKING:
-    from pandas._typing import AxisInt
+    from pandas._typing import (
+        AxisInt,
+        npt,
+    )
 
     from pandas.core.generic import NDFrame
 
@@ -153,3 +156,99 @@ def sample(
     return random_state.choice(obj_len, size=size, replace=replace, p=weights).astype(
         np.intp, copy=False
     )
+
+
+def group_sample(
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    size: int | None,
+    frac: float | None,
+    replace: bool,
+    weights: np.ndarray | None,
+    random_state: np.random.RandomState | np.random.Generator,
+) -> npt.NDArray[np.intp]:
+    """
+    Randomly sample indices of each group at once.
+
+    Without replacement, a random key is drawn for each row and the rows with
+    the smallest keys of each group are sampled. With weights, the keys are
+    exponential random variables divided by the weights, so that the rows are
+    sampled with probabilities proportional to the weights. With replacement,
+    the draws of each group are mapped to its rows by their cumulative weights.
+
+    Parameters
+    ----------
+    ids : np.ndarray[np.intp]
+        Group of each row, -1 for the rows not to sample.
+    ngroups : int
+        Number of groups.
+    size : int or None
+        The number of rows to choose of each group, or None to use `frac`.
+    frac : float or None
+        The fraction of the rows to choose of each group.
+    replace : bool
+        Allow or disallow sampling of the same row more than once.
+    weights : np.ndarray[np.float64] or None
+        If None, equal probability weighting, otherwise weights according
+        to the vector normalized within each group
+    random_state: np.random.RandomState or np.random.Generator
+        State used for the random sampling
+
+    Returns
+    -------
+    np.ndarray[np.intp]
+        The sampled indices, ordered by group.
+    """
+    valid = ids >= 0
+    group_sizes = np.bincount(ids[valid], minlength=ngroups)
+    if size is not None:
+        sample_sizes = np.full(ngroups, size, dtype=np.intp)
+    else:
+        assert frac is not None
+        sample_sizes = np.rint(frac * group_sizes).astype(np.intp)
+
+    if weights is not None:
+        weight_sums = np.bincount(ids[valid], weights=weights[valid], minlength=ngroups)
+        if (weight_sums == 0).any():
+            raise ValueError("Invalid weights: weights sum to zero")
+
+    (positions,) = np.nonzero(valid)
+    if not replace:
+        if weights is None:
+            if (sample_sizes > group_sizes).any():
+                raise ValueError(
+                    "Cannot take a larger sample than population when 'replace=False'"
+                )
+            keys = random_state.random(len(positions))
+        else:
+            nonzero = np.bincount(
+                ids[valid], weights=weights[valid] > 0, minlength=ngroups
+            )
+            if (sample_sizes > nonzero).any():
+                raise ValueError("Fewer non-zero entries in p than size")
+            with np.errstate(divide="ignore"):
+                keys = random_state.exponential(size=len(positions)) / weights[valid]
+        positions = positions[np.lexsort((keys, ids[valid]))]
+        starts = np.cumsum(group_sizes) - group_sizes
+        ranks = np.arange(len(positions)) - np.repeat(starts, group_sizes)
+        return positions[ranks < np.repeat(sample_sizes, group_sizes)]
+
+    if ((group_sizes == 0) & (sample_sizes > 0)).any():
+        raise ValueError("Cannot take a sample from an empty group")
+    positions = positions[np.argsort(ids[valid], kind="stable")]
+    ends = np.cumsum(group_sizes)
+    starts = ends - group_sizes
+    draws = np.repeat(np.arange(ngroups), sample_sizes)
+    uniform = random_state.random(len(draws))
+    if weights is None:
+        offsets = (uniform * group_sizes[draws]).astype(np.intp)
+        offsets = np.minimum(offsets, group_sizes[draws] - 1)
+        return positions[starts[draws] + offsets]
+
+    # the weights normalized within each group, cumulated over all groups
+    cumulative = np.cumsum(weights[positions] / weight_sums[ids[positions]])
+    lower = np.concatenate([[0.0], cumulative])[starts]
+    upper = cumulative[np.maximum(ends - 1, 0)]
+    targets = lower[draws] + uniform * (upper - lower)[draws]
+    targets = np.minimum(targets, np.nextafter(upper[draws], -np.inf))
+    return positions[np.searchsorted(cumulative, targets, side="right")]
@@ -1957,17 +1957,23 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         by=None,
         level: IndexLabel | None = None,
         as_index: bool = True,
-        sort: bool = True,
+        sort: bool | lib.NoDefault = lib.no_default,
         group_keys: bool = True,
-        observed: bool = False,
-        dropna: bool = True,
+        observed: bool | Literal["sparse"] | lib.NoDefault = lib.no_default,
+        dropna: bool | lib.NoDefault = lib.no_default,
     ) -> SeriesGroupBy:
         from pandas.core.groupby.generic import SeriesGroupBy
+        from pandas.core.groupby.grouper import GroupByPlan
 
         if level is None and by is None:
             raise TypeError("You have to supply one of 'by' and 'level'")
         if not as_index:
             raise TypeError("as_index=False only valid with DataFrame")
+        if not isinstance(by, GroupByPlan):
+            # a plan checks the options passed against its own
+            sort = True if sort is lib.no_default else sort
+            observed = False if observed is lib.no_default else observed
+            dropna = True if dropna is lib.no_default else dropna
 
         return SeriesGroupBy(
             obj=self,
@@ -150,15 +150,23 @@ group_keys : bool, default True
 
        ``group_keys`` now defaults to ``True``.
 
-observed : bool, default True
+observed : bool or "sparse", default True
     This only applies if any of the groupers are Categoricals.
     If True: only show observed values for categorical groupers.
     If False: show all values for categorical groupers.
+    If "sparse": only show observed values for categorical groupers, while
+    the levels of the result index hold all the categories, so that the
+    unobserved values can be restored with ``reindex_unobserved``, see
+    :ref:`groupby.observed_sparse`.
 
     .. versionchanged:: 3.0.0
 
         The default value is now ``True``.
 
+    .. versionadded:: 3.0.0
+
+        ``observed="sparse"``.
+
 dropna : bool, default True
     If True, and if group keys contain NA values, NA values together
     with row/column will be dropped.
@@ -339,8 +347,15 @@ _shared_docs["compression_options"] = """compression : str or dict, default 'inf
     a reproducible gzip archive:
     ``compression={'method': 'gzip', 'compresslevel': 1, 'mtime': 1}``.
 
+    The key ``'threads'`` sets the number of worker threads (``-1`` for one
+    per CPU) used to compress 'gzip', 'bz2' and 'xz' output in independent
+    blocks, or passed on to ``zstandard.ZstdCompressor``.
+
     .. versionadded:: 1.5.0
-        Added support for `.tar` files."""
+        Added support for `.tar` files.
+
+    .. versionadded:: 3.0.0
+        Added the ``'threads'`` key."""
 
 _shared_docs["decompression_options"] = """compression : str or dict, default 'infer'
     For on-the-fly decompression of on-disk data. If 'infer' and '%s' is
@@ -358,9 +373,14 @@ _shared_docs["decompression_options"] = """compression : str or dict, default 'i
     As an example, the following could be passed for Zstandard decompression using a
     custom compression dictionary:
     ``compression={'method': 'zstd', 'dict_data': my_compression_dict}``.
+    The key ``'threads'`` set to more than one decompresses the data on a
+    worker thread ahead of the parser.
 
     .. versionadded:: 1.5.0
-        Added support for `.tar` files."""
+        Added support for `.tar` files.
+
+    .. versionadded:: 3.0.0
+        Added the ``'threads'`` key."""
 
 _shared_docs["replace"] = """
     Replace values given in `to_replace` with `value`.
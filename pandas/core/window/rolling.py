@@ -2908,13 +2908,23 @@ class RollingGroupby(BaseWindowGroupby, Rolling):
         # GH 46061
         if self._on.hasnans:
             self._raise_monotonic_error("values must not have NaT")
-        for group_indices in self._grouper.indices.values():
-            group_on = self._on.take(group_indices)
-            if not (
-                group_on.is_monotonic_increasing or group_on.is_monotonic_decreasing
-            ):
-                on = "index" if self.on is None else self.on
-                raise ValueError(
-                    f"Each group within {on} must be monotonic. "
-                    f"Sort the values in {on} first."
-                )
+        group_indices = list(self._grouper.indices.values())
+        if not group_indices:
+            return
+        on_values = self._index_array
+        assert on_values is not None  # for mypy
+        sizes = np.fromiter(map(len, group_indices), dtype=np.intp)
+        ids = np.repeat(np.arange(len(sizes)), sizes)
+        # the differences of consecutive values of the same group
+        diffs = np.diff(on_values.take(np.concatenate(group_indices)))
+        diff_ids = ids[1:]
+        same_group = diff_ids == ids[:-1]
+        ngroups = len(sizes)
+        increases = np.bincount(diff_ids[same_group & (diffs > 0)], minlength=ngroups)
+        decreases = np.bincount(diff_ids[same_group & (diffs < 0)], minlength=ngroups)
+        if ((increases > 0) & (decreases > 0)).any():
+            on = "index" if self.on is None else self.on
+            raise ValueError(
+                f"Each group within {on} must be monotonic. "
+                f"Sort the values in {on} first."
+            )
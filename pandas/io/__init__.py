@@ -5,9 +5,10 @@ if TYPE_CHECKING:
     # import modules that have public classes/functions
     from pandas.io import (
         formats,
+        instrumentation,
         json,
         stata,
     )
 
     # mark only those modules as public
-    __all__ = ["formats", "json", "stata"]
+    __all__ = ["formats", "instrumentation", "json", "stata"]
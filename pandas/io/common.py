@@ -7,12 +7,20 @@ from abc import (
     abstractmethod,
 )
 import codecs
-from collections import defaultdict
+from collections import (
+    defaultdict,
+    deque,
+)
 from collections.abc import (
     Hashable,
     Mapping,
     Sequence,
 )
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+import contextvars
 import dataclasses
 import functools
 import gzip
@@ -23,12 +31,15 @@ from io import (
     StringIO,
     TextIOBase,
     TextIOWrapper,
+    UnsupportedOperation,
 )
 import mmap
 import os
 from pathlib import Path
+import queue
 import re
 import tarfile
+import threading
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -69,14 +80,23 @@ from pandas.core.dtypes.generic import ABCMultiIndex
 
 from pandas.core.shared_docs import _shared_docs
 
+from pandas.io.instrumentation import (
+    io_stage,
+    is_recording,
+)
+
 _VALID_URLS = set(uses_relative + uses_netloc + uses_params)
 _VALID_URLS.discard("")
 _RFC_3986_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+\-+.]*://")
 
 BaseBufferT = TypeVar("BaseBufferT", bound=BaseBuffer)
 
+# size of the blocks compressed or decompressed on worker threads
+_COMPRESSION_BLOCK_SIZE = 1 << 20
+
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from types import TracebackType
 
     from pandas._typing import (
@@ -695,6 +715,9 @@ def get_handle(
            Passing compression options as keys in dict is
            supported for compression modes 'gzip', 'bz2', 'zstd' and 'zip'.
 
+           The key 'threads' sets the number of worker threads of the
+           codec, see _get_compression_threads.
+
         .. versionchanged:: 1.4.0 Zstandard support.
 
     memory_map : bool, default False
@@ -750,6 +773,23 @@ def get_handle(
     if "r" not in mode and is_path:
         check_parent_directory(str(handle))
 
+    recording = is_recording()
+    if recording and isinstance(handle, str) and compression != "tar":
+        # open the file to instrument the (compressed) bytes read or written
+        ioargs.mode = ioargs.mode.replace("t", "")
+        handle = open(handle, ioargs.mode.replace("b", "") + "b")
+        handles.append(handle)
+        handle = _InstrumentedBuffer(
+            handle,  # type: ignore[arg-type]
+            "read" if "r" in ioargs.mode else "write",
+        )
+        handles.append(handle)
+
+    threads = _get_compression_threads(compression_args)
+    if compression == "zstd" and threads > 1 and "r" not in ioargs.mode:
+        # zstandard compresses on worker threads itself
+        compression_args["threads"] = threads
+
     if compression:
         if compression != "zstd":
             # compression libraries do not like an explicit text-mode
@@ -759,8 +799,26 @@ def get_handle(
             # compression libraries to use binary mode.
             ioargs.mode += "b"
 
+        if threads > 1 and "r" not in ioargs.mode and compression != "zstd":
+            if compression not in ("gzip", "bz2", "xz"):
+                raise ValueError(
+                    f"threads is not supported when writing {compression} files"
+                )
+            # Compress blocks of the output on worker threads
+            if "b" not in ioargs.mode:
+                ioargs.mode += "b"
+            if isinstance(handle, str):
+                handle = open(handle, ioargs.mode)
+                handles.append(handle)
+            handle = _ThreadedCompressionWriter(
+                handle,  # type: ignore[arg-type]
+                compression,
+                threads,
+                compression_args,
+            )
+
         # GZ Compression
-        if compression == "gzip":
+        elif compression == "gzip":
             if isinstance(handle, str):
                 # error: Incompatible types in assignment (expression has type
                 # "GzipFile", variable has type "Union[str, BaseBuffer]")
@@ -876,6 +934,18 @@ def get_handle(
         assert not isinstance(handle, str)
         handles.append(handle)
 
+        if recording:
+            handle = _InstrumentedBuffer(
+                handle,  # type: ignore[arg-type]
+                "decompress" if "r" in ioargs.mode else "compress",
+            )
+            handles.append(handle)
+
+        if threads > 1 and "r" in ioargs.mode:
+            # Decompress on a worker thread ahead of the parser
+            handle = _ReadAheadReader(handle)  # type: ignore[arg-type]
+            handles.append(handle)
+
     elif isinstance(handle, str):
         # Check whether the filename is to be opened in binary mode.
         # Binary mode does not support 'encoding' and 'newline'.
@@ -948,6 +1018,289 @@ def get_handle(
     )
 
 
+def _get_compression_threads(compression_args: dict[str, Any]) -> int:
+    """
+    Pop and validate the number of threads from the compression options.
+
+    With more than one thread, gzip, bz2 and xz output is compressed in
+    independent blocks on a pool of worker threads, zstd output is compressed
+    by the worker threads of zstandard, and compressed input is decompressed on
+    a worker thread ahead of the reader. -1 uses one thread per CPU.
+    """
+    threads = compression_args.pop("threads", 1)
+    if not is_integer(threads) or threads == 0 or threads < -1:
+        raise ValueError("threads must be a positive integer or -1")
+    if threads == -1:
+        threads = os.cpu_count() or 1
+    return threads
+
+
+def _get_block_compressor(
+    method: str, compression_args: dict[str, Any]
+) -> Callable[[bytes], bytes]:
+    """
+    Get a function compressing a block into a complete gzip, bz2 or xz stream.
+
+    Concatenated streams are valid files of these formats.
+    """
+    compress: Callable[..., bytes]
+    if method == "gzip":
+        compress = gzip.compress
+    elif method == "bz2":
+        import bz2
+
+        compress = bz2.compress
+    else:
+        import lzma
+
+        compress = lzma.compress
+    return functools.partial(compress, **compression_args)
+
+
+class _ThreadedCompressionWriter(BufferedIOBase):
+    """
+    Compress the output in independent blocks on a pool of worker threads.
+
+    The codecs release the GIL, so the blocks are compressed while the caller
+    keeps formatting. Compressed blocks are written in order.
+    """
+
+    def __init__(
+        self,
+        handle: WriteBuffer[bytes],
+        method: str,
+        threads: int,
+        compression_args: dict[str, Any],
+    ) -> None:
+        self.handle = handle
+        self._compress = _get_block_compressor(method, compression_args)
+        # raise for invalid options before writing anything
+        self._compress(b"")
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._max_pending = 2 * threads
+        self._pending: deque[Future[bytes]] = deque()
+        self._buffer = bytearray()
+        self._empty = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self._buffer += data
+        while len(self._buffer) >= _COMPRESSION_BLOCK_SIZE:
+            self._submit(bytes(self._buffer[:_COMPRESSION_BLOCK_SIZE]))
+            del self._buffer[:_COMPRESSION_BLOCK_SIZE]
+        return memoryview(data).nbytes
+
+    def _submit(self, block: bytes) -> None:
+        self._empty = False
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) > self._max_pending or (
+            self._pending and self._pending[0].done()
+        ):
+            self.handle.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer or self._empty:
+                # an empty output is still a valid (empty) stream
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self.handle.write(self._pending.popleft().result())
+            if hasattr(self.handle, "flush"):
+                self.handle.flush()
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            super().close()
+
+
+class _ReadAheadReader(BufferedIOBase):
+    """
+    Read (and decompress) the blocks of a handle on a worker thread, ahead of
+    the caller.
+
+    Seeking is only supported within the current block, e.g. to rewind after
+    peeking at the first bytes.
+    """
+
+    def __init__(self, handle: ReadBuffer[bytes], max_blocks: int = 4) -> None:
+        self.handle = handle
+        self._queue: queue.Queue[bytes | BaseException] = queue.Queue(max_blocks)
+        self._block = memoryview(b"")
+        self._block_start = 0
+        self._position = 0
+        self._eof = False
+        self._stop = threading.Event()
+        # run with the context of the caller to instrument the reads
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._read_blocks,),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _read_blocks(self) -> None:
+        while not self._stop.is_set():
+            item: bytes | BaseException
+            try:
+                item = self.handle.read(_COMPRESSION_BLOCK_SIZE)
+            except BaseException as err:  # re-raised by the reader
+                item = err
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            if not isinstance(item, bytes) or not item:
+                return
+
+    def _next_block(self) -> bool:
+        if self._eof:
+            return False
+        item = self._queue.get()
+        if isinstance(item, BaseException):
+            self._eof = True
+            raise item
+        if not item:
+            self._eof = True
+            return False
+        self._block_start += len(self._block)
+        self._block = memoryview(item)
+        self._position = 0
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def read1(self, size: int | None = -1) -> bytes:
+        if self._position == len(self._block) and not self._next_block():
+            return b""
+        end = len(self._block)
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        result = self._block[self._position : end].tobytes()
+        self._position = end
+        return result
+
+    def read(self, size: int | None = -1) -> bytes:
+        chunks = []
+        while size is None or size < 0 or size > 0:
+            chunk = self.read1(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if size is not None and size >= 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        view = memoryview(buffer).cast("B")
+        data = self.read(view.nbytes)
+        view[: len(data)] = data
+        return len(data)
+
+    def tell(self) -> int:
+        return self._block_start + self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.tell()
+        elif whence != os.SEEK_SET:
+            raise UnsupportedOperation("can only seek within the current block")
+        if not self._block_start <= offset <= self._block_start + len(self._block):
+            raise UnsupportedOperation("can only seek within the current block")
+        self._position = offset - self._block_start
+        return offset
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._stop.set()
+        # unblock the worker thread waiting on a full queue
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        super().close()
+
+
+class _InstrumentedBuffer(BufferedIOBase):
+    """
+    Record the bytes read or written through a binary buffer as a stage of
+    :func:`pandas.io.instrumentation.record_io`.
+    """
+
+    def __init__(self, buffer: BaseBuffer, stage: str) -> None:
+        self.buffer = buffer
+        self.stage = stage
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.buffer, name)
+
+    def read(self, size: int | None = -1) -> bytes:
+        with io_stage(self.stage) as stage:
+            data = self.buffer.read(size)  # type: ignore[attr-defined]
+            stage.record(nbytes=len(data))
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        with io_stage(self.stage) as stage:
+            if hasattr(self.buffer, "read1"):
+                data = self.buffer.read1(size)
+            else:
+                data = self.buffer.read(size)  # type: ignore[attr-defined]
+            stage.record(nbytes=len(data))
+        return data
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        with io_stage(self.stage) as stage:
+            nbytes = self.buffer.readinto(buffer)  # type: ignore[attr-defined]
+            stage.record(nbytes=nbytes or 0)
+        return nbytes
+
+    def readline(self, size: int | None = -1) -> bytes:
+        with io_stage(self.stage) as stage:
+            data = self.buffer.readline(size)  # type: ignore[attr-defined]
+            stage.record(nbytes=len(data))
+        return data
+
+    def write(self, data) -> int:  # type: ignore[override]
+        with io_stage(self.stage) as stage:
+            nbytes = self.buffer.write(data)  # type: ignore[attr-defined]
+            stage.record(nbytes=memoryview(data).nbytes)
+        return nbytes
+
+    def flush(self) -> None:
+        if not self.closed and hasattr(self.buffer, "flush"):
+            with io_stage(self.stage):
+                self.buffer.flush()
+
+    def readable(self) -> bool:
+        return getattr(self.buffer, "readable", lambda: True)()
+
+    def writable(self) -> bool:
+        return getattr(self.buffer, "writable", lambda: True)()
+
+    def seekable(self) -> bool:
+        return getattr(self.buffer, "seekable", lambda: True)()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.buffer.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.buffer.tell()
+
+    def fileno(self) -> int:
+        return self.buffer.fileno()  # type: ignore[attr-defined]
+
+
 # error: Definition of "__enter__" in base class "IOBase" is incompatible
 # with definition in base class "BinaryIO"
 class _BufferedWriter(BytesIO, ABC):  # type: ignore[misc]
@@ -4,11 +4,15 @@ from collections.abc import (
     Callable,
     Hashable,
     Iterable,
+    Iterator,
     Mapping,
     Sequence,
 )
+from concurrent.futures import ProcessPoolExecutor
 import datetime
 from functools import partial
+from io import BytesIO
+from itertools import chain
 import os
 from textwrap import fill
 from typing import (
@@ -281,12 +285,29 @@ dtype_backend : {{'numpy_nullable', 'pyarrow'}}
 
 engine_kwargs : dict, optional
     Arbitrary keyword arguments passed to excel engine.
+chunksize : int, optional
+    Return an iterator of DataFrames with ``chunksize`` rows each instead of
+    a single DataFrame. Only supported when reading a single sheet. The
+    ``openpyxl`` and ``calamine`` engines stream the rows of the sheet, so
+    that it is never fully materialized, while other engines read the sheet
+    before splitting it into chunks. A MultiIndex header is not supported.
+
+    .. versionadded:: 3.0.0
+
+max_workers : int, optional
+    Parse the requested sheets concurrently in up to ``max_workers``
+    processes when more than one sheet is read. Processes are used since
+    all engines hold the GIL while parsing. Each process loads the workbook
+    once, so the other arguments, e.g. ``converters``, must be picklable.
+
+    .. versionadded:: 3.0.0
 
 Returns
 -------
-DataFrame or dict of DataFrames
+DataFrame, dict of DataFrames or iterator of DataFrames
     DataFrame from the passed in Excel file. See notes in sheet_name
     argument for more information on when a dict of DataFrames is returned.
+    An iterator of DataFrames is returned if ``chunksize`` is passed.
 
 See Also
 --------
@@ -392,6 +413,8 @@ def read_excel(
     skipfooter: int = ...,
     storage_options: StorageOptions = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    chunksize: None = ...,
+    max_workers: int | None = ...,
 ) -> DataFrame: ...
 
 
@@ -429,9 +452,50 @@ def read_excel(
     skipfooter: int = ...,
     storage_options: StorageOptions = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    chunksize: None = ...,
+    max_workers: int | None = ...,
 ) -> dict[IntStrT, DataFrame]: ...
 
 
+@overload
+def read_excel(
+    io,
+    # chunksize is an int -> Iterator[DataFrame]
+    sheet_name: str | int = ...,
+    *,
+    header: int | Sequence[int] | None = ...,
+    names: SequenceNotStr[Hashable] | range | None = ...,
+    index_col: int | str | Sequence[int] | None = ...,
+    usecols: int
+    | str
+    | Sequence[int]
+    | Sequence[str]
+    | Callable[[HashableT], bool]
+    | None = ...,
+    dtype: DtypeArg | None = ...,
+    engine: Literal["xlrd", "openpyxl", "odf", "pyxlsb", "calamine"] | None = ...,
+    converters: dict[str, Callable] | dict[int, Callable] | None = ...,
+    true_values: Iterable[Hashable] | None = ...,
+    false_values: Iterable[Hashable] | None = ...,
+    skiprows: Sequence[int] | int | Callable[[int], object] | None = ...,
+    nrows: int | None = ...,
+    na_values=...,
+    keep_default_na: bool = ...,
+    na_filter: bool = ...,
+    verbose: bool = ...,
+    parse_dates: list | dict | bool = ...,
+    date_format: dict[Hashable, str] | str | None = ...,
+    thousands: str | None = ...,
+    decimal: str = ...,
+    comment: str | None = ...,
+    skipfooter: int = ...,
+    storage_options: StorageOptions = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    chunksize: int,
+    max_workers: int | None = ...,
+) -> Iterator[DataFrame]: ...
+
+
 @doc(storage_options=_shared_docs["storage_options"])
 @Appender(_read_excel_doc)
 def read_excel(
@@ -467,7 +531,9 @@ def read_excel(
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
     engine_kwargs: dict | None = None,
-) -> DataFrame | dict[IntStrT, DataFrame]:
+    chunksize: int | None = None,
+    max_workers: int | None = None,
+) -> DataFrame | dict[IntStrT, DataFrame] | Iterator[DataFrame]:
     check_dtype_backend(dtype_backend)
     should_close = False
     if engine_kwargs is None:
@@ -511,7 +577,13 @@ def read_excel(
             comment=comment,
             skipfooter=skipfooter,
             dtype_backend=dtype_backend,
+            chunksize=chunksize,
+            max_workers=max_workers,
         )
+        if chunksize is not None and should_close:
+            # the file is closed once all chunks have been read
+            data = _close_after_chunks(data, io)
+            should_close = False
     finally:
         # make sure to close opened file handles
         if should_close:
@@ -519,6 +591,31 @@ def read_excel(
     return data
 
 
+def _close_after_chunks(
+    chunks: Iterator[DataFrame], excel_file: ExcelFile
+) -> Iterator[DataFrame]:
+    try:
+        yield from chunks
+    finally:
+        excel_file.close()
+
+
+# The reader of each worker process, set by _init_sheet_worker
+_sheet_worker_reader: BaseExcelReader | None = None
+
+
+def _init_sheet_worker(
+    reader_class: type[BaseExcelReader], content: bytes, engine_kwargs: dict
+) -> None:
+    global _sheet_worker_reader
+    _sheet_worker_reader = reader_class(BytesIO(content), engine_kwargs=engine_kwargs)
+
+
+def _parse_sheet_in_worker(sheet_name: str | int, kwds: dict) -> DataFrame:
+    assert _sheet_worker_reader is not None
+    return _sheet_worker_reader.parse(sheet_name=sheet_name, **kwds)
+
+
 _WorkbookT = TypeVar("_WorkbookT")
 
 
@@ -533,6 +630,7 @@ class BaseExcelReader(Generic[_WorkbookT]):
     ) -> None:
         if engine_kwargs is None:
             engine_kwargs = {}
+        self._engine_kwargs = engine_kwargs
 
         self.handles = IOHandles(
             handle=filepath_or_buffer, compression={"method": None}
@@ -590,6 +688,26 @@ class BaseExcelReader(Generic[_WorkbookT]):
     def get_sheet_data(self, sheet, rows: int | None = None):
         raise NotImplementedError
 
+    def get_sheet_rows(self, sheet, rows: int | None = None) -> Iterator[list]:
+        """
+        Iterate over the rows of a sheet.
+
+        Engines that can read a sheet lazily override this method. By default
+        the whole sheet is read with ``get_sheet_data``.
+        """
+        return iter(self.get_sheet_data(sheet, rows))
+
+    def _get_content(self) -> bytes | None:
+        """
+        Return the raw content of the workbook, or None if it was created from
+        a workbook object.
+        """
+        handle = self.handles.handle
+        if not hasattr(handle, "read"):
+            return None
+        handle.seek(0)
+        return handle.read()
+
     def raise_if_bad_sheet_by_index(self, index: int) -> None:
         n_sheets = len(self.sheet_names)
         if index >= n_sheets:
@@ -715,10 +833,14 @@ class BaseExcelReader(Generic[_WorkbookT]):
         comment: str | None = None,
         skipfooter: int = 0,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        chunksize: int | None = None,
+        max_workers: int | None = None,
         **kwds,
     ):
         validate_header_arg(header)
         validate_integer("nrows", nrows)
+        validate_integer("chunksize", chunksize, 1)
+        validate_integer("max_workers", max_workers, 1)
 
         ret_dict = False
 
@@ -738,6 +860,43 @@ class BaseExcelReader(Generic[_WorkbookT]):
         # handle same-type duplicates.
         sheets = cast(Union[list[int], list[str]], list(dict.fromkeys(sheets).keys()))
 
+        if chunksize is not None:
+            if ret_dict:
+                raise ValueError("chunksize is only supported when reading one sheet")
+            if is_list_like(header) and len(header) > 1:  # type: ignore[arg-type]
+                raise NotImplementedError(
+                    "chunksize is not supported with a MultiIndex header"
+                )
+
+        content = None
+        if max_workers is not None and max_workers > 1 and len(sheets) > 1:
+            content = self._get_content()
+        if content is not None:
+            return self._parse_sheets_in_processes(
+                sheets,
+                content,
+                max_workers,  # type: ignore[arg-type]
+                verbose=verbose,
+                header=header,
+                names=names,
+                index_col=index_col,
+                usecols=usecols,
+                dtype=dtype,
+                true_values=true_values,
+                false_values=false_values,
+                skiprows=skiprows,
+                nrows=nrows,
+                na_values=na_values,
+                parse_dates=parse_dates,
+                date_format=date_format,
+                thousands=thousands,
+                decimal=decimal,
+                comment=comment,
+                skipfooter=skipfooter,
+                dtype_backend=dtype_backend,
+                **kwds,
+            )
+
         output = {}
 
         last_sheetname = None
@@ -752,13 +911,23 @@ class BaseExcelReader(Generic[_WorkbookT]):
                 sheet = self.get_sheet_by_index(asheetname)
 
             file_rows_needed = self._calc_rows(header, index_col, skiprows, nrows)
-            data = self.get_sheet_data(sheet, file_rows_needed)
+            data: list | Iterator[list]
+            if chunksize is None:
+                data = self.get_sheet_data(sheet, file_rows_needed)
+            else:
+                data = self.get_sheet_rows(sheet, file_rows_needed)
             if hasattr(sheet, "close"):
                 # pyxlsb opens two TemporaryFiles
                 sheet.close()
             usecols = maybe_convert_usecols(usecols)
 
-            if not data:
+            if chunksize is not None:
+                first_row = next(data, None)  # type: ignore[call-overload]
+                if first_row is None:
+                    output[asheetname] = iter([DataFrame()])
+                    continue
+                data = chain([first_row], data)
+            elif not data:
                 output[asheetname] = DataFrame()
                 continue
 
@@ -783,6 +952,7 @@ class BaseExcelReader(Generic[_WorkbookT]):
                 comment=comment,
                 skipfooter=skipfooter,
                 dtype_backend=dtype_backend,
+                chunksize=chunksize,
                 **kwds,
             )
 
@@ -794,9 +964,36 @@ class BaseExcelReader(Generic[_WorkbookT]):
         else:
             return output[last_sheetname]
 
+    def _parse_sheets_in_processes(
+        self,
+        sheets: list[int] | list[str],
+        content: bytes,
+        max_workers: int,
+        verbose: bool = False,
+        **kwds,
+    ) -> dict:
+        """
+        Parse sheets concurrently, each worker process loading the workbook once.
+        """
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(sheets)),
+            initializer=_init_sheet_worker,
+            initargs=(type(self), content, self._engine_kwargs),
+        ) as executor:
+            futures = {}
+            for asheetname in sheets:
+                if verbose:
+                    print(f"Reading sheet {asheetname}")
+                futures[asheetname] = executor.submit(
+                    _parse_sheet_in_worker, asheetname, kwds
+                )
+            return {
+                asheetname: future.result() for asheetname, future in futures.items()
+            }
+
     def _parse_sheet(
         self,
-        data: list,
+        data: list | Iterator[list],
         output: dict,
         asheetname: str | int | None = None,
         header: int | Sequence[int] | None = 0,
@@ -816,6 +1013,7 @@ class BaseExcelReader(Generic[_WorkbookT]):
         comment: str | None = None,
         skipfooter: int = 0,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        chunksize: int | None = None,
         **kwds,
     ):
         is_list_header = False
@@ -891,9 +1089,14 @@ class BaseExcelReader(Generic[_WorkbookT]):
             if has_index_names:
                 offset += 1
 
+            if not isinstance(data, list):
+                # Forward fill lazily when reading in chunks
+                data = _forward_fill_index_rows(
+                    data, offset, cast(Sequence[int], index_col)
+                )
             # Check if we have an empty dataset
             # before trying to collect data.
-            if offset < len(data):
+            elif offset < len(data):
                 assert isinstance(index_col, Sequence)
 
                 for col in index_col:
@@ -928,10 +1131,14 @@ class BaseExcelReader(Generic[_WorkbookT]):
                 skipfooter=skipfooter,
                 usecols=usecols,
                 dtype_backend=dtype_backend,
+                chunksize=chunksize,
                 **kwds,
             )
 
-            output[asheetname] = parser.read(nrows=nrows)
+            if chunksize is not None:
+                output[asheetname] = parser
+            else:
+                output[asheetname] = parser.read(nrows=nrows)
 
             if header_names:
                 output[asheetname].columns = output[asheetname].columns.set_names(
@@ -949,6 +1156,23 @@ class BaseExcelReader(Generic[_WorkbookT]):
         return output
 
 
+def _forward_fill_index_rows(
+    rows: Iterator[list], offset: int, index_col: Sequence[int]
+) -> Iterator[list]:
+    """
+    Forward fill the MultiIndex columns of rows following the first offset rows.
+    """
+    last: dict[int, Any] = {}
+    for i, row in enumerate(rows):
+        if i > offset:
+            for col in index_col:
+                if row[col] == "" or row[col] is None:
+                    row[col] = last[col]
+        if i >= offset:
+            last = {col: row[col] for col in index_col}
+        yield row
+
+
 @doc(storage_options=_shared_docs["storage_options"])
 class ExcelWriter(Generic[_WorkbookT]):
     """
@@ -1230,6 +1454,53 @@ class ExcelWriter(Generic[_WorkbookT]):
         """
         raise NotImplementedError
 
+    def _write_rows(
+        self,
+        cells,
+        rows,
+        first_row: int,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Write formatted header cells and rows of values into an excel sheet.
+
+        Engines can override this to write the rows in bulk, without creating
+        a cell object for each value. By default the rows are converted to
+        cells and written with ``_write_cells``.
+
+        Parameters
+        ----------
+        cells : list of ExcelCell
+            cells of the formatted header, sorted by row and column
+        rows : iterator of list
+            formatted values of each row of data
+        first_row : int
+            row of the first row of data, relative to startrow
+        sheet_name : str, default None
+            Name of Excel sheet, if None, then use self.cur_sheet
+        startrow : upper left cell row to dump data frame
+        startcol : upper left cell column to dump data frame
+        freeze_panes: int tuple of length 2
+            contains the bottom-most row and right-most column to freeze
+        """
+        from pandas.io.formats.excel import ExcelCell
+
+        body = (
+            ExcelCell(first_row + i, j, val)
+            for i, row in enumerate(rows)
+            for j, val in enumerate(row)
+        )
+        self._write_cells(
+            chain(cells, body),
+            sheet_name,
+            startrow=startrow,
+            startcol=startcol,
+            freeze_panes=freeze_panes,
+        )
+
     def _save(self) -> None:
         """
         Save workbook to disk.
@@ -1631,8 +1902,12 @@ class ExcelFile:
         comment: str | None = None,
         skipfooter: int = 0,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        chunksize: int | None = None,
+        max_workers: int | None = None,
         **kwds,
-    ) -> DataFrame | dict[str, DataFrame] | dict[int, DataFrame]:
+    ) -> (
+        DataFrame | dict[str, DataFrame] | dict[int, DataFrame] | Iterator[DataFrame]
+    ):
         """
         Parse specified sheet(s) into a DataFrame.
 
@@ -1740,12 +2015,25 @@ class ExcelFile:
               :class:`ArrowDtype` :class:`DataFrame`
 
             .. versionadded:: 2.0
+        chunksize : int, optional
+            Return an iterator of DataFrames with ``chunksize`` rows each
+            instead of a single DataFrame. Only supported when reading a
+            single sheet. The ``openpyxl`` and ``calamine`` engines stream the
+            rows of the sheet.
+
+            .. versionadded:: 3.0.0
+        max_workers : int, optional
+            Parse the requested sheets concurrently in up to ``max_workers``
+            processes when more than one sheet is read. The other arguments
+            must be picklable.
+
+            .. versionadded:: 3.0.0
         **kwds : dict, optional
             Arbitrary keyword arguments passed to excel engine.
 
         Returns
         -------
-        DataFrame or dict of DataFrames
+        DataFrame, dict of DataFrames or iterator of DataFrames
             DataFrame from the passed in Excel file.
 
         See Also
@@ -1779,6 +2067,8 @@ class ExcelFile:
             comment=comment,
             skipfooter=skipfooter,
             dtype_backend=dtype_backend,
+            chunksize=chunksize,
+            max_workers=max_workers,
             **kwds,
         )
 
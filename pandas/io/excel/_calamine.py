@@ -6,6 +6,7 @@ from datetime import (
     time,
     timedelta,
 )
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +22,8 @@ from pandas.core.shared_docs import _shared_docs
 from pandas.io.excel._base import BaseExcelReader
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from python_calamine import (
         CalamineSheet,
         CalamineWorkbook,
@@ -97,28 +100,46 @@ class CalamineReader(BaseExcelReader["CalamineWorkbook"]):
         self.raise_if_bad_sheet_by_index(index)
         return self.book.get_sheet_by_index(index)
 
-    def get_sheet_data(
-        self, sheet: CalamineSheet, file_rows_needed: int | None = None
-    ) -> list[list[Scalar | NaTType | time]]:
-        def _convert_cell(value: _CellValue) -> Scalar | NaTType | time:
-            if isinstance(value, float):
-                val = int(value)
-                if val == value:
-                    return val
-                else:
-                    return value
-            elif isinstance(value, date):
-                return pd.Timestamp(value)
-            elif isinstance(value, timedelta):
-                return pd.Timedelta(value)
-            elif isinstance(value, time):
+    @staticmethod
+    def _convert_cell(value: _CellValue) -> Scalar | NaTType | time:
+        if isinstance(value, float):
+            val = int(value)
+            if val == value:
+                return val
+            else:
                 return value
-
+        elif isinstance(value, date):
+            return pd.Timestamp(value)
+        elif isinstance(value, timedelta):
+            return pd.Timedelta(value)
+        elif isinstance(value, time):
             return value
 
+        return value
+
+    def get_sheet_data(
+        self, sheet: CalamineSheet, file_rows_needed: int | None = None
+    ) -> list[list[Scalar | NaTType | time]]:
         rows: list[list[_CellValue]] = sheet.to_python(
             skip_empty_area=False, nrows=file_rows_needed
         )
-        data = [[_convert_cell(cell) for cell in row] for row in rows]
+        data = [[self._convert_cell(cell) for cell in row] for row in rows]
 
         return data
+
+    def get_sheet_rows(
+        self, sheet: CalamineSheet, file_rows_needed: int | None = None
+    ) -> Iterator[list[Scalar | NaTType | time]]:
+        if not hasattr(sheet, "iter_rows"):
+            # older versions of python-calamine
+            return iter(self.get_sheet_data(sheet, file_rows_needed))
+        return self._iter_sheet_rows(sheet, file_rows_needed)
+
+    def _iter_sheet_rows(
+        self, sheet: CalamineSheet, file_rows_needed: int | None
+    ) -> Iterator[list[Scalar | NaTType | time]]:
+        # iter_rows includes the leading empty rows but not the leading empty
+        # columns, which to_python(skip_empty_area=False) does include
+        empty_cells = [""] * (sheet.start[1] if sheet.start is not None else 0)
+        for row in islice(sheet.iter_rows(), file_rows_needed):
+            yield empty_cells + [self._convert_cell(cell) for cell in row]
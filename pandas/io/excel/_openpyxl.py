@@ -24,6 +24,8 @@ from pandas.io.excel._util import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from openpyxl import Workbook
     from openpyxl.descriptors.serialisable import Serialisable
     from openpyxl.styles import Fill
@@ -449,34 +451,27 @@ class OpenpyxlWriter(ExcelWriter):
         freeze_panes: tuple[int, int] | None = None,
     ) -> None:
         # Write the frame cells using openpyxl.
-        sheet_name = self._get_sheet_name(sheet_name)
+        if self.book.write_only:
+            # Cells of write-only sheets have to be appended row by row
+            cells = sorted(cells, key=lambda cell: (cell.row, cell.col))
+            first_row = max((cell.row for cell in cells), default=-1) + 1
+            self._append_rows(
+                cells, iter([]), first_row, sheet_name, startrow, startcol, freeze_panes
+            )
+            return
 
-        _style_cache: dict[str, dict[str, Serialisable]] = {}
+        wks = self._get_worksheet(sheet_name)
+        self._write_sheet_cells(wks, cells, startrow, startcol, freeze_panes)
 
-        if sheet_name in self.sheets and self._if_sheet_exists != "new":
-            if "r+" in self._mode:
-                if self._if_sheet_exists == "replace":
-                    old_wks = self.sheets[sheet_name]
-                    target_index = self.book.index(old_wks)
-                    del self.book[sheet_name]
-                    wks = self.book.create_sheet(sheet_name, target_index)
-                elif self._if_sheet_exists == "error":
-                    raise ValueError(
-                        f"Sheet '{sheet_name}' already exists and "
-                        f"if_sheet_exists is set to 'error'."
-                    )
-                elif self._if_sheet_exists == "overlay":
-                    wks = self.sheets[sheet_name]
-                else:
-                    raise ValueError(
-                        f"'{self._if_sheet_exists}' is not valid for if_sheet_exists. "
-                        "Valid options are 'error', 'new', 'replace' and 'overlay'."
-                    )
-            else:
-                wks = self.sheets[sheet_name]
-        else:
-            wks = self.book.create_sheet()
-            wks.title = sheet_name
+    def _write_sheet_cells(
+        self,
+        wks,
+        cells,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        _style_cache: dict[str, dict[str, Serialisable]] = {}
 
         if validate_freeze_panes(freeze_panes):
             freeze_panes = cast(tuple[int, int], freeze_panes)
@@ -492,14 +487,7 @@ class OpenpyxlWriter(ExcelWriter):
             if fmt:
                 xcell.number_format = fmt
 
-            style_kwargs: dict[str, Serialisable] | None = {}
-            if cell.style:
-                key = str(cell.style)
-                style_kwargs = _style_cache.get(key)
-                if style_kwargs is None:
-                    style_kwargs = self._convert_to_style_kwargs(cell.style)
-                    _style_cache[key] = style_kwargs
-
+            style_kwargs = self._get_style_kwargs(cell.style, _style_cache)
             if style_kwargs:
                 for k, v in style_kwargs.items():
                     setattr(xcell, k, v)
@@ -530,6 +518,157 @@ class OpenpyxlWriter(ExcelWriter):
                             for k, v in style_kwargs.items():
                                 setattr(xcell, k, v)
 
+    def _write_rows(
+        self,
+        cells,
+        rows,
+        first_row: int,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        if self.book.write_only:
+            self._append_rows(
+                cells, rows, first_row, sheet_name, startrow, startcol, freeze_panes
+            )
+            return
+
+        # Write the header cells, then the values without styles
+        wks = self._get_worksheet(sheet_name)
+        self._write_sheet_cells(wks, cells, startrow, startcol, freeze_panes)
+
+        for i, row in enumerate(rows, start=startrow + first_row + 1):
+            for j, value in enumerate(row, start=startcol + 1):
+                val, fmt = self._value_with_fmt(value)
+                xcell = wks.cell(row=i, column=j, value=val)
+                if fmt:
+                    xcell.number_format = fmt
+
+    def _append_rows(
+        self,
+        cells,
+        rows,
+        first_row: int,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Append the header cells and rows of values to a write-only sheet.
+
+        Write-only sheets are written row by row and keep little in memory,
+        see ``engine_kwargs={"write_only": True}``.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        from openpyxl.worksheet.cell_range import CellRange
+
+        wks = self._get_worksheet(sheet_name)
+
+        _style_cache: dict[str, dict[str, Serialisable]] = {}
+
+        if validate_freeze_panes(freeze_panes):
+            freeze_panes = cast(tuple[int, int], freeze_panes)
+            wks.freeze_panes = (
+                f"{get_column_letter(freeze_panes[1] + 1)}{freeze_panes[0] + 1}"
+            )
+
+        header: list[list] = [[None] * startcol for _ in range(first_row)]
+        for cell in cells:
+            row = header[cell.row]
+            row.extend([None] * (startcol + cell.col + 1 - len(row)))
+
+            val, fmt = self._value_with_fmt(cell.val)
+            xcell = WriteOnlyCell(wks, value=val)
+            if fmt:
+                xcell.number_format = fmt
+            style_kwargs = self._get_style_kwargs(cell.style, _style_cache)
+            if style_kwargs:
+                for k, v in style_kwargs.items():
+                    setattr(xcell, k, v)
+            row[startcol + cell.col] = xcell
+
+            if cell.mergestart is not None and cell.mergeend is not None:
+                wks.merged_cells.add(
+                    CellRange(
+                        min_row=startrow + cell.row + 1,
+                        min_col=startcol + cell.col + 1,
+                        max_row=startrow + cell.mergestart + 1,
+                        max_col=startcol + cell.mergeend + 1,
+                    )
+                )
+
+        for _ in range(startrow):
+            wks.append([])
+        for row in header:
+            wks.append(row)
+
+        padding = [None] * startcol
+        for values in rows:
+            row = padding.copy()
+            for value in values:
+                val, fmt = self._value_with_fmt(value)
+                if fmt:
+                    xcell = WriteOnlyCell(wks, value=val)
+                    xcell.number_format = fmt
+                    val = xcell
+                row.append(val)
+            wks.append(row)
+
+    def _get_worksheet(self, sheet_name: str | None):
+        """
+        Get or create the sheet to write to, following ``if_sheet_exists``.
+        """
+        sheet_name = self._get_sheet_name(sheet_name)
+
+        if sheet_name in self.sheets and self.book.write_only:
+            raise ValueError(
+                f"Sheet '{sheet_name}' already exists and cannot be written "
+                "to again with write_only=True."
+            )
+        if sheet_name in self.sheets and self._if_sheet_exists != "new":
+            if "r+" in self._mode:
+                if self._if_sheet_exists == "replace":
+                    old_wks = self.sheets[sheet_name]
+                    target_index = self.book.index(old_wks)
+                    del self.book[sheet_name]
+                    wks = self.book.create_sheet(sheet_name, target_index)
+                elif self._if_sheet_exists == "error":
+                    raise ValueError(
+                        f"Sheet '{sheet_name}' already exists and "
+                        f"if_sheet_exists is set to 'error'."
+                    )
+                elif self._if_sheet_exists == "overlay":
+                    wks = self.sheets[sheet_name]
+                else:
+                    raise ValueError(
+                        f"'{self._if_sheet_exists}' is not valid for if_sheet_exists. "
+                        "Valid options are 'error', 'new', 'replace' and 'overlay'."
+                    )
+            else:
+                wks = self.sheets[sheet_name]
+        else:
+            wks = self.book.create_sheet()
+            wks.title = sheet_name
+        return wks
+
+    def _get_style_kwargs(
+        self, style: dict | None, cache: dict[str, dict[str, Serialisable]]
+    ) -> dict[str, Serialisable] | None:
+        """
+        Convert a cell style to openpyxl style kwargs, cached by style key.
+        """
+        if not style:
+            return {}
+        key = str(style)
+        style_kwargs = cache.get(key)
+        if style_kwargs is None:
+            style_kwargs = self._convert_to_style_kwargs(style)
+            cache[key] = style_kwargs
+        return style_kwargs
+
 
 class OpenpyxlReader(BaseExcelReader["Workbook"]):
     @doc(storage_options=_shared_docs["storage_options"])
@@ -638,3 +777,37 @@ class OpenpyxlReader(BaseExcelReader["Workbook"]):
                 ]
 
         return data
+
+    def get_sheet_rows(
+        self, sheet, file_rows_needed: int | None = None
+    ) -> Iterator[list[Scalar]]:
+        if self.book.read_only:
+            sheet.reset_dimensions()
+
+        # The rows are padded to the width of the widest row as in
+        # get_sheet_data, found by a first pass over the values of the cells
+        width = 0
+        for row_number, row in enumerate(sheet.rows):
+            if file_rows_needed is not None and row_number >= file_rows_needed:
+                break
+            for column_number, cell in enumerate(row, start=1):
+                if cell.value is not None and cell.value != "":
+                    width = max(width, column_number)
+
+        # Empty rows are held back until a row with data follows, so that
+        # trailing empty rows are trimmed as in get_sheet_data
+        empty_rows = 0
+        for row_number, row in enumerate(sheet.rows):
+            if file_rows_needed is not None and row_number >= file_rows_needed:
+                break
+            converted_row = [self._convert_cell(cell) for cell in row]
+            while converted_row and converted_row[-1] == "":
+                # trim trailing empty elements
+                converted_row.pop()
+            if not converted_row:
+                empty_rows += 1
+                continue
+            for _ in range(empty_rows):
+                yield [""] * width
+            empty_rows = 0
+            yield converted_row + [""] * (width - len(converted_row))
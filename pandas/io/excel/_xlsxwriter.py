@@ -218,6 +218,9 @@ class XlsxWriter(ExcelWriter):
             self._handles.handle.close()
             raise
 
+        # Formats are shared by the sheets of the book, cache them by style key
+        self._style_cache: dict[str, Any] = {"null": None}
+
     @property
     def book(self):
         """
@@ -253,23 +256,16 @@ class XlsxWriter(ExcelWriter):
         if wks is None:
             wks = self.book.add_worksheet(sheet_name)
 
-        style_dict = {"null": None}
-
         if validate_freeze_panes(freeze_panes):
             wks.freeze_panes(*(freeze_panes))
 
+        if self.book.constant_memory:
+            # Rows are flushed as soon as a later row is written
+            cells = sorted(cells, key=lambda cell: (cell.row, cell.col))
+
         for cell in cells:
             val, fmt = self._value_with_fmt(cell.val)
-
-            stylekey = json.dumps(cell.style)
-            if fmt:
-                stylekey += fmt
-
-            if stylekey in style_dict:
-                style = style_dict[stylekey]
-            else:
-                style = self.book.add_format(_XlsxStyler.convert(cell.style, fmt))
-                style_dict[stylekey] = style
+            style = self._get_style(cell.style, fmt)
 
             if cell.mergestart is not None and cell.mergeend is not None:
                 wks.merge_range(
@@ -282,3 +278,40 @@ class XlsxWriter(ExcelWriter):
                 )
             else:
                 wks.write(startrow + cell.row, startcol + cell.col, val, style)
+
+    def _write_rows(
+        self,
+        cells,
+        rows,
+        first_row: int,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        # Write the header cells, then the rows of values in order, which
+        # also allows writing with the constant_memory option of xlsxwriter.
+        self._write_cells(cells, sheet_name, startrow, startcol, freeze_panes)
+        wks = self.book.get_worksheet_by_name(self._get_sheet_name(sheet_name))
+
+        for i, row in enumerate(rows, start=startrow + first_row):
+            for j, value in enumerate(row, start=startcol):
+                val, fmt = self._value_with_fmt(value)
+                if fmt is None:
+                    wks.write(i, j, val)
+                else:
+                    wks.write(i, j, val, self._get_style(None, fmt))
+
+    def _get_style(self, style: dict[str, Any] | None, fmt: str | None):
+        """
+        Get the xlsxwriter format of a cell style and number format, cached.
+        """
+        stylekey = json.dumps(style)
+        if fmt:
+            stylekey += fmt
+
+        if stylekey not in self._style_cache:
+            self._style_cache[stylekey] = self.book.add_format(
+                _XlsxStyler.convert(style, fmt)
+            )
+        return self._style_cache[stylekey]
@@ -35,6 +35,7 @@ from pandas.core.dtypes.missing import notna
 from pandas.core.indexes.api import Index
 
 from pandas.io.common import get_handle
+from pandas.io.instrumentation import io_stage
 
 if TYPE_CHECKING:
     from pandas._typing import (
@@ -313,22 +314,24 @@ class CSVFormatter:
             self._save_chunk(start_i, end_i)
 
     def _save_chunk(self, start_i: int, end_i: int) -> None:
-        # create the data for a chunk
-        slicer = slice(start_i, end_i)
-        df = self.obj.iloc[slicer]
-
-        res = df._get_values_for_csv(**self._number_format)
-        data = list(res._iter_column_arrays())
-
-        ix = (
-            self.data_index[slicer]._get_values_for_csv(**self._number_format)
-            if self.nlevels != 0
-            else np.empty(end_i - start_i)
-        )
-        libwriters.write_csv_rows(
-            data,
-            ix,
-            self.nlevels,
-            self.cols,
-            self.writer,
-        )
+        with io_stage("serialize") as stage:
+            # create the data for a chunk
+            slicer = slice(start_i, end_i)
+            df = self.obj.iloc[slicer]
+
+            res = df._get_values_for_csv(**self._number_format)
+            data = list(res._iter_column_arrays())
+
+            ix = (
+                self.data_index[slicer]._get_values_for_csv(**self._number_format)
+                if self.nlevels != 0
+                else np.empty(end_i - start_i)
+            )
+            libwriters.write_csv_rows(
+                data,
+                ix,
+                self.nlevels,
+                self.cols,
+                self.writer,
+            )
+            stage.record(rows=end_i - start_i)
@@ -8,6 +8,7 @@ from collections.abc import (
     Callable,
     Hashable,
     Iterable,
+    Iterator,
     Mapping,
     Sequence,
 )
@@ -47,6 +48,7 @@ from pandas.io.formats.css import (
     CSSResolver,
     CSSWarning,
 )
+from pandas.io.formats.csvs import _DEFAULT_CHUNKSIZE_CELLS
 from pandas.io.formats.format import get_level_lengths
 from pandas.io.formats.printing import pprint_thing
 
@@ -59,7 +61,10 @@ if TYPE_CHECKING:
         WriteExcelBuffer,
     )
 
-    from pandas import ExcelWriter
+    from pandas import (
+        ExcelWriter,
+        Series,
+    )
 
 
 class ExcelCell:
@@ -889,6 +894,90 @@ class ExcelFormatter:
             cell.val = self._format_value(cell.val)
             yield cell
 
+    @property
+    def _can_write_rows(self) -> bool:
+        """
+        Whether the body can be written as rows of values rather than cells.
+
+        This is the case unless the frame is styled or the index is written
+        as merged hierarchical cells.
+        """
+        return self.styler is None and not (
+            self.index
+            and isinstance(self.df.index, MultiIndex)
+            and self.merge_cells is True
+        )
+
+    def get_formatted_rows(self) -> tuple[list[ExcelCell], int, Iterator[list]]:
+        """
+        Format the header as cells and the index and body as rows of values.
+
+        Returns
+        -------
+        cells : list of ExcelCell
+            The formatted header cells, sorted by row and column.
+        first_row : int
+            The row of the first row of values.
+        rows : iterator of list
+            The formatted values of each row, starting with the index.
+        """
+        # The header and index labels do not depend on the rows of the frame
+        df = self.df
+        self.df = df.iloc[:0]
+        try:
+            cells = sorted(self.get_formatted_cells(), key=lambda c: (c.row, c.col))
+        finally:
+            self.df = df
+
+        return cells, self.rowcounter, self._iter_formatted_rows(df)
+
+    def _iter_formatted_rows(self, df: DataFrame) -> Iterator[list]:
+        """
+        Format the index and body of the frame in blocks of rows.
+
+        Only the values of one block of rows are held as Python objects at once,
+        so that the writers streaming the rows keep their memory bounded.
+        """
+        chunksize = (_DEFAULT_CHUNKSIZE_CELLS // (len(self.columns) or 1)) or 1
+        for start in range(0, len(df), chunksize):
+            block = df.iloc[start : start + chunksize]
+            columns: list[Index | Series] = []
+            if self.index:
+                index = block.index
+                if isinstance(index, PeriodIndex):
+                    index = index.to_timestamp()
+                if isinstance(index, MultiIndex):
+                    columns.extend(
+                        index.get_level_values(i) for i in range(index.nlevels)
+                    )
+                else:
+                    columns.append(index)
+            columns.extend(block.iloc[:, i] for i in range(len(self.columns)))
+            formatted = [self._format_values(values) for values in columns]
+            yield from map(list, zip(*formatted))
+
+    def _format_values(self, values: Index | Series) -> list:
+        """
+        Equivalent of _format_value for all the values of a column.
+
+        _format_value is only called on the values it may change, i.e. the
+        missing values, and the infinite values or all the values of a float
+        column.
+        """
+        if not (isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufmM"):
+            return [self._format_value(val) for val in values]
+
+        result = values.tolist()
+        if values.dtype.kind != "f":
+            to_format = np.flatnonzero(missing.isna(values))
+        elif self.float_format is None:
+            to_format = np.flatnonzero(~np.isfinite(values.to_numpy()))
+        else:
+            to_format = range(len(result))
+        for i in to_format:
+            result[i] = self._format_value(result[i])
+        return result
+
     @doc(storage_options=_shared_docs["storage_options"])
     def write(
         self,
@@ -935,7 +1024,11 @@ class ExcelFormatter:
         if engine_kwargs is None:
             engine_kwargs = {}
 
-        formatted_cells = self.get_formatted_cells()
+        if self._can_write_rows:
+            # Write rows of values without creating a cell for each value,
+            # the header is formatted first to raise before creating a file
+            cells, first_row, rows = self.get_formatted_rows()
+
         if isinstance(writer, ExcelWriter):
             need_save = False
         else:
@@ -948,13 +1041,24 @@ class ExcelFormatter:
             need_save = True
 
         try:
-            writer._write_cells(
-                formatted_cells,
-                sheet_name,
-                startrow=startrow,
-                startcol=startcol,
-                freeze_panes=freeze_panes,
-            )
+            if self._can_write_rows:
+                writer._write_rows(
+                    cells,
+                    rows,
+                    first_row,
+                    sheet_name,
+                    startrow=startrow,
+                    startcol=startcol,
+                    freeze_panes=freeze_panes,
+                )
+            else:
+                writer._write_cells(
+                    self.get_formatted_cells(),
+                    sheet_name,
+                    startrow=startrow,
+                    startcol=startcol,
+                    freeze_panes=freeze_panes,
+                )
         finally:
             # make sure to close opened file handles
             if need_save:
@@ -0,0 +1,284 @@
+"""
+Opt-in instrumentation of the stages of the readers and writers.
+
+The readers and writers wrap each of their stages in :func:`io_stage`. Unless
+:func:`record_io` is active in the current context, :func:`io_stage` returns a
+shared no-op object, so that the instrumentation costs a single context
+variable lookup per stage.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import dataclasses
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterator,
+    )
+    from types import TracebackType
+
+    from pandas import DataFrame
+
+__all__ = ["IOStats", "StageStats", "record_io"]
+
+
+@dataclasses.dataclass
+class StageStats:
+    """
+    Statistics of a stage of a reader or writer.
+
+    The times of a stage exclude the times of the stages nested in it, e.g.
+    the time spent reading the file while tokenizing, so that the times of all
+    stages add up to the total time.
+
+    Attributes
+    ----------
+    calls : int
+        Number of times the stage was entered.
+    wall_time : float
+        Wall clock time spent in the stage, in seconds.
+    cpu_time : float
+        CPU time of the thread running the stage, in seconds.
+    nbytes : int
+        Number of bytes read or written by the stage.
+    rows : int
+        Number of rows produced or consumed by the stage.
+    """
+
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    nbytes: int = 0
+    rows: int = 0
+
+    def _add(self, other: StageStats) -> None:
+        self.calls += other.calls
+        self.wall_time += other.wall_time
+        self.cpu_time += other.cpu_time
+        self.nbytes += other.nbytes
+        self.rows += other.rows
+
+
+class IOStats:
+    """
+    Statistics of the stages of the readers and writers, by stage name.
+
+    Returned by :func:`record_io`. The stages currently recorded are
+
+    * ``read`` / ``write``: reading or writing the (compressed) file, or
+      inserting rows into a SQL table
+    * ``decompress`` / ``compress``: (de)compressing the file
+    * ``tokenize``: splitting text into fields (C parser)
+    * ``convert``: type inference, NA handling and dtype conversion
+    * ``parse``: parsing not covered by a more specific stage, e.g. the
+      python and pyarrow CSV engines, or JSON decoding
+    * ``serialize``: formatting the values of writers
+    * ``query`` / ``fetch``: executing a SQL query and fetching its rows
+    * ``consolidate``: assembling the resulting DataFrame
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.stages!r})"
+
+    def __getitem__(self, stage: str) -> StageStats:
+        return self.stages[stage]
+
+    def _add(self, stage: str, stats: StageStats) -> None:
+        with self._lock:
+            if stage not in self.stages:
+                self.stages[stage] = StageStats()
+            self.stages[stage]._add(stats)
+
+    @property
+    def wall_time(self) -> float:
+        """Total wall clock time of all stages, in seconds."""
+        return sum(stats.wall_time for stats in self.stages.values())
+
+    @property
+    def cpu_time(self) -> float:
+        """Total CPU time of all stages, in seconds."""
+        return sum(stats.cpu_time for stats in self.stages.values())
+
+    def to_frame(self) -> DataFrame:
+        """
+        Return the statistics as a DataFrame with one row per stage.
+
+        Returns
+        -------
+        DataFrame
+            The columns are the attributes of :class:`StageStats`.
+        """
+        from pandas import DataFrame
+
+        return DataFrame(
+            [dataclasses.astuple(stats) for stats in self.stages.values()],
+            index=list(self.stages),
+            columns=[field.name for field in dataclasses.fields(StageStats)],
+        )
+
+
+class _Recorder:
+    def __init__(
+        self, stats: IOStats, callback: Callable[[str, StageStats], Any] | None
+    ) -> None:
+        self.stats = stats
+        self.callback = callback
+        # the stages entered by each thread
+        self.local = threading.local()
+
+
+class _Stage:
+    """An instrumented stage, created and entered for each call of the stage."""
+
+    __slots__ = ("recorder", "name", "stats", "_wall", "_cpu", "_children")
+
+    def __init__(self, recorder: _Recorder, name: str) -> None:
+        self.recorder = recorder
+        self.name = name
+        self.stats = StageStats(calls=1)
+
+    def record(self, *, nbytes: int = 0, rows: int = 0) -> None:
+        """Add to the bytes and rows processed by the stage."""
+        self.stats.nbytes += nbytes
+        self.stats.rows += rows
+
+    def __enter__(self) -> _Stage:
+        stack = getattr(self.recorder.local, "stack", None)
+        if stack is None:
+            stack = self.recorder.local.stack = []
+        stack.append(self)
+        # wall and CPU time of the nested stages
+        self._children = [0.0, 0.0]
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        stack = self.recorder.local.stack
+        stack.pop()
+        if stack:
+            stack[-1]._children[0] += wall
+            stack[-1]._children[1] += cpu
+        self.stats.wall_time = wall - self._children[0]
+        self.stats.cpu_time = cpu - self._children[1]
+        self.recorder.stats._add(self.name, self.stats)
+        if self.recorder.callback is not None:
+            self.recorder.callback(self.name, self.stats)
+
+
+class _NoStage:
+    """Stand-in for :class:`_Stage` when nothing is recorded."""
+
+    __slots__ = ()
+
+    def record(self, *, nbytes: int = 0, rows: int = 0) -> None:
+        pass
+
+    def __enter__(self) -> _NoStage:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+
+_NO_STAGE = _NoStage()
+
+_recorder: ContextVar[_Recorder | None] = ContextVar("_recorder", default=None)
+
+
+def io_stage(name: str) -> _Stage | _NoStage:
+    """
+    Return a context manager instrumenting a stage of a reader or writer.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage, see :class:`IOStats`.
+
+    Examples
+    --------
+    >>> with io_stage("parse") as stage:
+    ...     stage.record(rows=3)
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        return _NO_STAGE
+    return _Stage(recorder, name)
+
+
+def is_recording() -> bool:
+    """Whether :func:`record_io` is active in the current context."""
+    return _recorder.get() is not None
+
+
+@contextmanager
+def record_io(
+    callback: Callable[[str, StageStats], Any] | None = None,
+) -> Iterator[IOStats]:
+    """
+    Record the bytes, rows, and wall and CPU time of each stage of the readers
+    and writers called in the block.
+
+    Supported are the CSV readers and writers, the JSON, parquet and SQL
+    readers and writers, and any reader or writer (de)compressing a file.
+
+    .. versionadded:: 3.0.0
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called with the name and the :class:`StageStats` of each call of a
+        stage when it ends, e.g. to forward the statistics to a tracing or
+        metrics system.
+
+    Yields
+    ------
+    IOStats
+        The statistics accumulated by stage, updated while the block runs.
+
+    See Also
+    --------
+    read_csv : Read a comma-separated values (csv) file into DataFrame.
+    DataFrame.to_csv : Write object to a comma-separated values (csv) file.
+
+    Notes
+    -----
+    Recording is enabled for the current thread (and for the worker threads of
+    the readers and writers it calls) through a :class:`contextvars.ContextVar`.
+    The times of a stage exclude the times of the stages nested in it.
+
+    Examples
+    --------
+    >>> from io import StringIO
+    >>> from pandas.io.instrumentation import record_io
+    >>> with record_io() as stats:
+    ...     df = pd.read_csv(StringIO("a,b\\n1,2\\n3,4"))
+    >>> stats["consolidate"].rows
+    2
+    """
+    stats = IOStats()
+    token = _recorder.set(_Recorder(stats, callback))
+    try:
+        yield stats
+    finally:
+        _recorder.reset(token)
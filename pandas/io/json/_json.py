@@ -55,6 +55,7 @@ from pandas.io.common import (
     is_potential_multi_index,
     stringify_path,
 )
+from pandas.io.instrumentation import io_stage
 from pandas.io.json._normalize import convert_to_line_delimits
 from pandas.io.json._table_schema import (
     build_table_schema,
@@ -189,20 +190,22 @@ def to_json(
     else:
         raise NotImplementedError("'obj' should be a Series or a DataFrame")
 
-    s = writer(
-        obj,
-        orient=orient,
-        date_format=date_format,
-        double_precision=double_precision,
-        ensure_ascii=force_ascii,
-        date_unit=date_unit,
-        default_handler=default_handler,
-        index=index,
-        indent=indent,
-    ).write()
+    with io_stage("serialize") as stage:
+        s = writer(
+            obj,
+            orient=orient,
+            date_format=date_format,
+            double_precision=double_precision,
+            ensure_ascii=force_ascii,
+            date_unit=date_unit,
+            default_handler=default_handler,
+            index=index,
+            indent=indent,
+        ).write()
 
-    if lines:
-        s = convert_to_line_delimits(s)
+        if lines:
+            s = convert_to_line_delimits(s)
+        stage.record(rows=len(obj))
 
     if path_or_buf is not None:
         # apply compression and byte/text conversion
@@ -1123,11 +1126,14 @@ class Parser:
 
     @final
     def parse(self) -> DataFrame | Series:
-        obj = self._parse()
-
-        if self.convert_axes:
-            obj = self._convert_axes(obj)
-        obj = self._try_convert_types(obj)
+        with io_stage("parse"):
+            obj = self._parse()
+
+        with io_stage("convert") as stage:
+            if self.convert_axes:
+                obj = self._convert_axes(obj)
+            obj = self._try_convert_types(obj)
+            stage.record(rows=len(obj))
         return obj
 
     def _parse(self) -> DataFrame | Series:
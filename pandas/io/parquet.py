@@ -38,6 +38,7 @@ from pandas.io.common import (
     is_url,
     stringify_path,
 )
+from pandas.io.instrumentation import io_stage
 
 if TYPE_CHECKING:
     from pandas._typing import (
@@ -188,7 +189,9 @@ class PyArrowImpl(BaseImpl):
         if index is not None:
             from_pandas_kwargs["preserve_index"] = index
 
-        table = self.api.Table.from_pandas(df, **from_pandas_kwargs)
+        with io_stage("convert") as stage:
+            table = self.api.Table.from_pandas(df, **from_pandas_kwargs)
+            stage.record(rows=len(df))
 
         if df.attrs:
             df_metadata = {"PANDAS_ATTRS": json.dumps(df.attrs)}
@@ -214,25 +217,27 @@ class PyArrowImpl(BaseImpl):
                 path_or_handle = path_or_handle.name
 
         try:
-            if partition_cols is not None:
-                # writes to multiple files under the given path
-                self.api.parquet.write_to_dataset(
-                    table,
-                    path_or_handle,
-                    compression=compression,
-                    partition_cols=partition_cols,
-                    filesystem=filesystem,
-                    **kwargs,
-                )
-            else:
-                # write to single output file
-                self.api.parquet.write_table(
-                    table,
-                    path_or_handle,
-                    compression=compression,
-                    filesystem=filesystem,
-                    **kwargs,
-                )
+            with io_stage("serialize") as stage:
+                if partition_cols is not None:
+                    # writes to multiple files under the given path
+                    self.api.parquet.write_to_dataset(
+                        table,
+                        path_or_handle,
+                        compression=compression,
+                        partition_cols=partition_cols,
+                        filesystem=filesystem,
+                        **kwargs,
+                    )
+                else:
+                    # write to single output file
+                    self.api.parquet.write_table(
+                        table,
+                        path_or_handle,
+                        compression=compression,
+                        filesystem=filesystem,
+                        **kwargs,
+                    )
+                stage.record(rows=table.num_rows)
         finally:
             if handles is not None:
                 handles.close()
@@ -267,20 +272,23 @@ class PyArrowImpl(BaseImpl):
             mode="rb",
         )
         try:
-            pa_table = self.api.parquet.read_table(
-                path_or_handle,
-                columns=columns,
-                filesystem=filesystem,
-                filters=filters,
-                **kwargs,
-            )
-            with catch_warnings():
+            with io_stage("parse") as stage:
+                pa_table = self.api.parquet.read_table(
+                    path_or_handle,
+                    columns=columns,
+                    filesystem=filesystem,
+                    filters=filters,
+                    **kwargs,
+                )
+                stage.record(rows=pa_table.num_rows)
+            with catch_warnings(), io_stage("convert") as stage:
                 filterwarnings(
                     "ignore",
                     "make_block is deprecated",
                     DeprecationWarning,
                 )
                 result = pa_table.to_pandas(**to_pandas_kwargs)
+                stage.record(rows=len(result))
 
             if pa_table.schema.metadata:
                 if b"PANDAS_ATTRS" in pa_table.schema.metadata:
@@ -344,7 +352,7 @@ class FastParquetImpl(BaseImpl):
                 "storage_options passed with file object or non-fsspec file path"
             )
 
-        with catch_warnings(record=True):
+        with catch_warnings(record=True), io_stage("serialize") as stage:
             self.api.write(
                 path,
                 df,
@@ -353,6 +361,7 @@ class FastParquetImpl(BaseImpl):
                 partition_on=partition_cols,
                 **kwargs,
             )
+            stage.record(rows=len(df))
 
     def read(
         self,
@@ -392,16 +401,18 @@ class FastParquetImpl(BaseImpl):
             path = handles.handle
 
         try:
-            parquet_file = self.api.ParquetFile(path, **parquet_kwargs)
-            with catch_warnings():
+            with catch_warnings(), io_stage("parse") as stage:
+                parquet_file = self.api.ParquetFile(path, **parquet_kwargs)
                 filterwarnings(
                     "ignore",
                     "make_block is deprecated",
                     DeprecationWarning,
                 )
-                return parquet_file.to_pandas(
+                result = parquet_file.to_pandas(
                     columns=columns, filters=filters, **kwargs
                 )
+                stage.record(rows=len(result))
+            return result
         finally:
             if handles is not None:
                 handles.close()
@@ -27,6 +27,7 @@ from pandas.io.common import (
     dedup_names,
     is_potential_multi_index,
 )
+from pandas.io.instrumentation import io_stage
 from pandas.io.parsers.base_parser import (
     ParserBase,
     ParserError,
@@ -235,8 +236,9 @@ class CParserWrapper(ParserBase):
         try:
             if self.low_memory:
                 chunks = self._reader.read_low_memory(nrows)
-                # destructive to chunks
-                data = _concatenate_chunks(chunks, self.names)  # type: ignore[has-type]
+                with io_stage("consolidate"):
+                    # destructive to chunks
+                    data = _concatenate_chunks(chunks, self.names)  # type: ignore[has-type]
 
             else:
                 data = self._reader.read(nrows)
@@ -140,8 +140,10 @@ class PythonParser(ParserBase):
         if isinstance(f, list):
             # read_excel: f is a nested list, can contain non-str
             self.data = f
+        elif not hasattr(f, "readline"):
+            # read_excel with chunksize: f is an iterator of rows
+            self.data = f
         else:
-            assert hasattr(f, "readline")
             # yields list of str
             self.data = self._make_reader(f)
 
@@ -55,6 +55,7 @@ from pandas.io.common import (
     stringify_path,
     validate_header_arg,
 )
+from pandas.io.instrumentation import io_stage
 from pandas.io.parsers.arrow_parser_wrapper import ArrowParserWrapper
 from pandas.io.parsers.base_parser import (
     ParserBase,
@@ -1433,7 +1434,12 @@ class TextFileReader(abc.Iterator):
             raise ValueError(
                 f"Unknown engine: {engine} (valid options are {mapping.keys()})"
             )
-        if not isinstance(f, list):
+        # read_excel passes rows as a nested list or, with chunksize, as an
+        # iterator of rows
+        is_rows = isinstance(f, list) or (
+            isinstance(f, abc.Iterator) and not hasattr(f, "read")
+        )
+        if not is_rows:
             # open file here
             is_text = True
             mode = "r"
@@ -1480,22 +1486,25 @@ class TextFileReader(abc.Iterator):
     def read(self, nrows: int | None = None) -> DataFrame:
         if self.engine == "pyarrow":
             try:
-                # error: "ParserBase" has no attribute "read"
-                df = self._engine.read()  # type: ignore[attr-defined]
+                with io_stage("parse") as stage:
+                    # error: "ParserBase" has no attribute "read"
+                    df = self._engine.read()  # type: ignore[attr-defined]
+                    stage.record(rows=len(df))
             except Exception:
                 self.close()
                 raise
         else:
             nrows = validate_integer("nrows", nrows)
             try:
-                # error: "ParserBase" has no attribute "read"
-                (
-                    index,
-                    columns,
-                    col_dict,
-                ) = self._engine.read(  # type: ignore[attr-defined]
-                    nrows
-                )
+                with io_stage("parse"):
+                    # error: "ParserBase" has no attribute "read"
+                    (
+                        index,
+                        columns,
+                        col_dict,
+                    ) = self._engine.read(  # type: ignore[attr-defined]
+                        nrows
+                    )
             except Exception:
                 self.close()
                 raise
@@ -1538,12 +1547,14 @@ class TextFileReader(abc.Iterator):
             else:
                 new_col_dict = col_dict
 
-            df = DataFrame(
-                new_col_dict,
-                columns=columns,
-                index=index,
-                copy=False,
-            )
+            with io_stage("consolidate") as stage:
+                df = DataFrame(
+                    new_col_dict,
+                    columns=columns,
+                    index=index,
+                    copy=False,
+                )
+                stage.record(rows=new_rows)
 
             self._currow += new_rows
         return df
@@ -1580,7 +1591,7 @@ def TextParser(*args, **kwds) -> TextFileReader:
 
     Parameters
     ----------
-    data : file-like object or list
+    data : file-like object, list or iterator of rows
     delimiter : separator character to use
     dialect : str or csv.Dialect instance, optional
         Ignored if delimiter is longer than 1 character
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import mmap
 import pickle
+import struct
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -25,11 +27,20 @@ if TYPE_CHECKING:
         WriteBuffer,
     )
 
+    from pandas.io.common import IOHandles
+
     from pandas import (
         DataFrame,
         Series,
     )
 
+# Files written with out_of_band=True start with the magic bytes, followed by
+# the number of buffers, the (offset, size) of the pickle stream and of each
+# buffer, the pickle stream and the buffers aligned to _BUFFER_ALIGNMENT.
+# Pickle streams of protocol 2 and above start with b"\x80" instead.
+_OUT_OF_BAND_MAGIC = b"PDOOB\x00\x01\x00"
+_BUFFER_ALIGNMENT = 64
+
 
 @doc(
     storage_options=_shared_docs["storage_options"],
@@ -41,6 +52,7 @@ def to_pickle(
     compression: CompressionOptions = "infer",
     protocol: int = pickle.HIGHEST_PROTOCOL,
     storage_options: StorageOptions | None = None,
+    out_of_band: bool = False,
 ) -> None:
     """
     Pickle (serialize) object to file.
@@ -70,6 +82,16 @@ def to_pickle(
 
         .. [1] https://docs.python.org/3/library/pickle.html
 
+    out_of_band : bool, default False
+        Write the data buffers of the object, such as the arrays of the blocks
+        of a DataFrame, out-of-band after the pickle stream instead of inline,
+        aligned in the same file. Requires ``protocol`` 5 or higher. Such
+        files can be read with :func:`read_pickle`, and with
+        ``memory_map=True`` the arrays are backed by the mapped file without
+        copying them.
+
+        .. versionadded:: 3.0.0
+
     See Also
     --------
     read_pickle : Load pickled pandas object (or any object) from file.
@@ -102,6 +124,8 @@ def to_pickle(
     """
     if protocol < 0:
         protocol = pickle.HIGHEST_PROTOCOL
+    if out_of_band and protocol < 5:
+        raise ValueError("out_of_band requires protocol 5 or higher")
 
     with get_handle(
         filepath_or_buffer,
@@ -110,8 +134,83 @@ def to_pickle(
         is_text=False,
         storage_options=storage_options,
     ) as handles:
-        # letting pickle write directly to the buffer is more memory-efficient
-        pickle.dump(obj, handles.handle, protocol=protocol)
+        if out_of_band:
+            _dump_out_of_band(obj, handles, protocol)
+        else:
+            # letting pickle write directly to the buffer is more memory-efficient
+            pickle.dump(obj, handles.handle, protocol=protocol)
+
+
+def _dump_out_of_band(obj: Any, handles: IOHandles, protocol: int) -> None:
+    """
+    Write obj with its buffers out-of-band, see _OUT_OF_BAND_MAGIC.
+    """
+    buffers: list[memoryview] = []
+    payload = pickle.dumps(
+        obj, protocol=protocol, buffer_callback=lambda buf: buffers.append(buf.raw())
+    )
+
+    chunks = [memoryview(payload), *buffers]
+    offsets = []
+    position = len(_OUT_OF_BAND_MAGIC) + 8 + 16 * len(chunks)
+    for chunk in chunks:
+        offsets.append(position)
+        position += chunk.nbytes
+        position += -position % _BUFFER_ALIGNMENT
+
+    handle = handles.handle
+    handle.write(_OUT_OF_BAND_MAGIC)
+    handle.write(struct.pack("<Q", len(buffers)))
+    for offset, chunk in zip(offsets, chunks):
+        handle.write(struct.pack("<QQ", offset, chunk.nbytes))
+    position = offsets[0]
+    for offset, chunk in zip(offsets, chunks):
+        handle.write(b"\x00" * (offset - position))
+        handle.write(chunk)
+        position = offset + chunk.nbytes
+
+
+def _load_out_of_band(handles: IOHandles, memory_map: bool) -> Any:
+    """
+    Read an object written with out_of_band=True, the magic bytes excluded.
+
+    If memory_map, the buffers are slices of a private (copy-on-write) map
+    of the file, so that arrays are backed by the file without copying it
+    and writing to them does not modify the file.
+    """
+    handle = handles.handle
+    start = len(_OUT_OF_BAND_MAGIC)
+    (nbuffers,) = struct.unpack("<Q", handle.read(8))
+    table = handle.read(16 * (nbuffers + 1))
+    layout = list(struct.iter_unpack("<QQ", table))
+    start += 8 + len(table)
+
+    data: mmap.mmap | bytearray
+    if memory_map and handles.compression["method"] is None:
+        try:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+            start = 0
+        except (AttributeError, OSError, ValueError):
+            # not a local file, e.g. a BytesIO
+            memory_map = False
+    if not memory_map or handles.compression["method"] is not None:
+        end = max(offset + size for offset, size in layout)
+        data = bytearray(end - start)
+        view = memoryview(data)
+        read = 0
+        while read < len(data):
+            nread = handle.readinto(view[read:])
+            if not nread:
+                raise ValueError("The out-of-band pickle file is truncated")
+            read += nread
+
+    view = memoryview(data)
+    payload, *buffers = (
+        view[offset - start : offset - start + size] for offset, size in layout
+    )
+    with warnings.catch_warnings(record=True):
+        warnings.simplefilter("ignore", Warning)
+        return pickle.loads(payload, buffers=buffers)
 
 
 @doc(
@@ -122,6 +221,7 @@ def read_pickle(
     filepath_or_buffer: FilePath | ReadPickleBuffer,
     compression: CompressionOptions = "infer",
     storage_options: StorageOptions | None = None,
+    memory_map: bool = False,
 ) -> DataFrame | Series:
     """
     Load pickled pandas object (or any object) from file and return unpickled object.
@@ -144,6 +244,15 @@ def read_pickle(
 
     {storage_options}
 
+    memory_map : bool, default False
+        If the file was written with ``out_of_band=True`` and is a local,
+        uncompressed file, map it onto memory and back the arrays of the
+        object by the mapped file instead of reading and copying them. The
+        file is mapped copy-on-write: modifying the object never modifies
+        the file.
+
+        .. versionadded:: 3.0.0
+
     Returns
     -------
     object
@@ -194,6 +303,10 @@ def read_pickle(
         is_text=False,
         storage_options=storage_options,
     ) as handles:
+        if handles.handle.read(len(_OUT_OF_BAND_MAGIC)) == _OUT_OF_BAND_MAGIC:
+            return _load_out_of_band(handles, memory_map)
+        handles.handle.seek(0)
+
         # 1) try standard library Pickle
         # 2) try pickle_compat (older pandas version) to handle subclass changes
         try:
@@ -5,16 +5,22 @@ to disk
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 import copy
 from datetime import (
     date,
     tzinfo,
 )
+from io import StringIO
 import itertools
+import keyword
 import os
 import re
 from textwrap import dedent
+import threading
+import tokenize
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -47,6 +53,7 @@ from pandas.errors import (
     IncompatibilityWarning,
     PerformanceWarning,
     PossibleDataLossError,
+    UndefinedVariableError,
 )
 from pandas.util._decorators import cache_readonly
 from pandas.util._exceptions import find_stack_level
@@ -212,6 +219,12 @@ format_doc: Final = """
     default format writing format, if None, then
     put will default to 'fixed' and append will default to 'table'
 """
+selection_cache_size_doc: Final = """
+: int
+    number of parsed where clauses and their resulting coordinates to keep per
+    HDFStore. Repeated selects with the same where, start and stop on an
+    unchanged table then read by coordinates directly. 0 disables the cache
+"""
 
 with config.config_prefix("io.hdf"):
     config.register_option("dropna_table", False, dropna_doc, validator=config.is_bool)
@@ -221,6 +234,12 @@ with config.config_prefix("io.hdf"):
         format_doc,
         validator=config.is_one_of_factory(["fixed", "table", None]),
     )
+    config.register_option(
+        "selection_cache_size",
+        0,
+        selection_cache_size_doc,
+        validator=config.is_nonnegative_int,
+    )
 
 # oh the troubles to reduce import time
 _table_mod = None
@@ -574,6 +593,12 @@ class HDFStore:
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        # PyTables is not thread-safe; serialize the reads of the background
+        # threads (prefetch / parallel) with the writes, removals and closing
+        # of the store
+        self._lock = threading.RLock()
+        # (key, where, start, stop, nrows, mtime) -> Selection
+        self._selection_cache: OrderedDict[tuple, Selection] = OrderedDict()
         self.open(mode=mode, **kwargs)
 
     def __fspath__(self) -> str:
@@ -727,6 +752,7 @@ class HDFStore:
         # close and reopen the handle
         if self.is_open:
             self.close()
+        self._selection_cache.clear()
 
         if self._complevel and self._complevel > 0:
             self._filters = _tables().Filters(
@@ -746,9 +772,11 @@ class HDFStore:
         """
         Close the PyTables file handle
         """
-        if self._handle is not None:
-            self._handle.close()
-        self._handle = None
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+            self._handle = None
+            self._selection_cache.clear()
 
     @property
     def is_open(self) -> bool:
@@ -826,6 +854,7 @@ class HDFStore:
         iterator: bool = False,
         chunksize: int | None = None,
         auto_close: bool = False,
+        prefetch: bool = False,
     ):
         """
         Retrieve pandas object stored in file, optionally based on where criteria.
@@ -856,6 +885,14 @@ class HDFStore:
             Number or rows to include in iteration, return an iterator.
         auto_close : bool or False
             Should automatically close the store when finished.
+        prefetch : bool, default False
+            When iterating, read and convert the next chunk on a background
+            thread while the current chunk is being processed. Only used
+            together with ``iterator`` or ``chunksize``. Writing to, removing
+            from or closing the store during the iteration waits for the chunk
+            being read.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -911,6 +948,7 @@ class HDFStore:
             iterator=iterator,
             chunksize=chunksize,
             auto_close=auto_close,
+            prefetch=prefetch,
         )
 
         return it.get_result()
@@ -998,6 +1036,8 @@ class HDFStore:
         iterator: bool = False,
         chunksize: int | None = None,
         auto_close: bool = False,
+        prefetch: bool = False,
+        parallel: bool = False,
     ):
         """
         Retrieve pandas objects from multiple tables.
@@ -1022,6 +1062,19 @@ class HDFStore:
         chunksize : nrows to include in iteration, return an iterator
         auto_close : bool, default False
             Should automatically close the store when finished.
+        prefetch : bool, default False
+            When iterating, read the next chunk on a background thread while
+            the current chunk is being processed. Writing to, removing from or
+            closing the store during the iteration waits for the chunk being
+            read.
+
+            .. versionadded:: 3.0.0
+        parallel : bool, default False
+            Read and convert the tables on a pool of threads, one per table.
+            Access to the underlying file is serialized, so the speedup comes
+            from overlapping the conversion of the data to pandas objects.
+
+            .. versionadded:: 3.0.0
 
         Raises
         ------
@@ -1043,6 +1096,7 @@ class HDFStore:
                 iterator=iterator,
                 chunksize=chunksize,
                 auto_close=auto_close,
+                prefetch=prefetch,
             )
 
         if not isinstance(keys, (list, tuple)):
@@ -1084,10 +1138,14 @@ class HDFStore:
         def func(_start, _stop, _where):
             # retrieve the objs, _where is always passed as a set of
             # coordinates here
-            objs = [
-                t.read(where=_where, columns=columns, start=_start, stop=_stop)
-                for t in tbls
-            ]
+            def read(t: Table) -> DataFrame:
+                return t.read(where=_where, columns=columns, start=_start, stop=_stop)
+
+            if parallel:
+                with ThreadPoolExecutor(max_workers=len(_tbls)) as executor:
+                    objs = list(executor.map(read, _tbls))
+            else:
+                objs = [read(t) for t in _tbls]
 
             # concat and return
             return concat(objs, axis=axis, verify_integrity=False)._consolidate()
@@ -1104,6 +1162,7 @@ class HDFStore:
             iterator=iterator,
             chunksize=chunksize,
             auto_close=auto_close,
+            prefetch=prefetch,
         )
 
         return it.get_result(coordinates=True)
@@ -1228,38 +1287,42 @@ class HDFStore:
 
         """
         where = _ensure_term(where, scope_level=1)
-        try:
-            s = self.get_storer(key)
-        except KeyError:
-            # the key is not a valid store, re-raising KeyError
-            raise
-        except AssertionError:
-            # surface any assertion errors for e.g. debugging
-            raise
-        except Exception as err:
-            # In tests we get here with ClosedFileError, TypeError, and
-            #  _table_mod.NoSuchNodeError.  TODO: Catch only these?
-
-            if where is not None:
-                raise ValueError(
-                    "trying to remove a node with a non-None where clause!"
-                ) from err
+        with self._lock:
+            self._selection_cache.clear()
+            try:
+                s = self.get_storer(key)
+            except KeyError:
+                # the key is not a valid store, re-raising KeyError
+                raise
+            except AssertionError:
+                # surface any assertion errors for e.g. debugging
+                raise
+            except Exception as err:
+                # In tests we get here with ClosedFileError, TypeError, and
+                #  _table_mod.NoSuchNodeError.  TODO: Catch only these?
+
+                if where is not None:
+                    raise ValueError(
+                        "trying to remove a node with a non-None where clause!"
+                    ) from err
 
-            # we are actually trying to remove a node (with children)
-            node = self.get_node(key)
-            if node is not None:
-                node._f_remove(recursive=True)
-                return None
+                # we are actually trying to remove a node (with children)
+                node = self.get_node(key)
+                if node is not None:
+                    node._f_remove(recursive=True)
+                    return None
 
-        # remove the node
-        if com.all_none(where, start, stop):
-            s.group._f_remove(recursive=True)
-            return None
+            # remove the node
+            if com.all_none(where, start, stop):
+                s.group._f_remove(recursive=True)
+                return None
 
-        # delete from the table
-        if not s.is_table:
-            raise ValueError("can only remove with where on objects written as tables")
-        return s.delete(where=where, start=start, stop=stop)
+            # delete from the table
+            if not s.is_table:
+                raise ValueError(
+                    "can only remove with where on objects written as tables"
+                )
+            return s.delete(where=where, start=start, stop=stop)
 
     def append(
         self,
@@ -1911,41 +1974,45 @@ class HDFStore:
         if getattr(value, "empty", None) and (format == "table" or append):
             return
 
-        group = self._identify_group(key, append)
+        with self._lock:
+            self._selection_cache.clear()
+            group = self._identify_group(key, append)
 
-        s = self._create_storer(group, format, value, encoding=encoding, errors=errors)
-        if append:
-            # raise if we are trying to append to a Fixed format,
-            #       or a table that exists (and we are putting)
-            if not s.is_table or (s.is_table and format == "fixed" and s.is_exists):
-                raise ValueError("Can only append to Tables")
-            if not s.is_exists:
+            s = self._create_storer(
+                group, format, value, encoding=encoding, errors=errors
+            )
+            if append:
+                # raise if we are trying to append to a Fixed format,
+                #       or a table that exists (and we are putting)
+                if not s.is_table or (s.is_table and format == "fixed" and s.is_exists):
+                    raise ValueError("Can only append to Tables")
+                if not s.is_exists:
+                    s.set_object_info()
+            else:
                 s.set_object_info()
-        else:
-            s.set_object_info()
 
-        if not s.is_table and complib:
-            raise ValueError("Compression not supported on Fixed format stores")
+            if not s.is_table and complib:
+                raise ValueError("Compression not supported on Fixed format stores")
 
-        # write the object
-        s.write(
-            obj=value,
-            axes=axes,
-            append=append,
-            complib=complib,
-            complevel=complevel,
-            fletcher32=fletcher32,
-            min_itemsize=min_itemsize,
-            chunksize=chunksize,
-            expectedrows=expectedrows,
-            dropna=dropna,
-            nan_rep=nan_rep,
-            data_columns=data_columns,
-            track_times=track_times,
-        )
+            # write the object
+            s.write(
+                obj=value,
+                axes=axes,
+                append=append,
+                complib=complib,
+                complevel=complevel,
+                fletcher32=fletcher32,
+                min_itemsize=min_itemsize,
+                chunksize=chunksize,
+                expectedrows=expectedrows,
+                dropna=dropna,
+                nan_rep=nan_rep,
+                data_columns=data_columns,
+                track_times=track_times,
+            )
 
-        if isinstance(s, Table) and index:
-            s.create_index(columns=index)
+            if isinstance(s, Table) and index:
+                s.create_index(columns=index)
 
     def _read_group(self, group: Node):
         s = self._create_storer(group)
@@ -2010,6 +2077,9 @@ class TableIterator:
     chunksize : the passed chunking value (default is 100000)
     auto_close : bool, default False
         Whether to automatically close the store at the end of iteration.
+    prefetch : bool, default False
+        Whether to read the next chunk on a background thread while the
+        current chunk is consumed.
     """
 
     chunksize: int | None
@@ -2028,6 +2098,7 @@ class TableIterator:
         iterator: bool = False,
         chunksize: int | None = None,
         auto_close: bool = False,
+        prefetch: bool = False,
     ) -> None:
         self.store = store
         self.s = s
@@ -2057,16 +2128,24 @@ class TableIterator:
             self.chunksize = None
 
         self.auto_close = auto_close
+        self.prefetch = prefetch
 
-    def __iter__(self) -> Iterator:
-        # iterate
+    def _chunks(self) -> Iterator[Index]:
         current = self.start
-        if self.coordinates is None:
-            raise ValueError("Cannot iterate until get_result is called.")
         while current < self.stop:
             stop = min(current + self.chunksize, self.stop)
-            value = self.func(None, None, self.coordinates[current:stop])
+            yield self.coordinates[current:stop]
             current = stop
+
+    def __iter__(self) -> Iterator:
+        # iterate
+        if self.coordinates is None:
+            raise ValueError("Cannot iterate until get_result is called.")
+        if self.prefetch:
+            values = self._iter_prefetch()
+        else:
+            values = (self.func(None, None, coords) for coords in self._chunks())
+        for value in values:
             if value is None or not len(value):
                 continue
 
@@ -2074,6 +2153,20 @@ class TableIterator:
 
         self.close()
 
+    def _iter_prefetch(self) -> Iterator:
+        # keep exactly one read in flight on a worker thread; the reads take
+        # the store lock, as do the writes, removals and closing of the store
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = (
+                executor.submit(self.func, None, None, coords)
+                for coords in self._chunks()
+            )
+            pending = next(futures, None)
+            while pending is not None:
+                upcoming = next(futures, None)
+                yield pending.result()
+                pending = upcoming
+
     def close(self) -> None:
         if self.auto_close:
             self.store.close()
@@ -2884,10 +2977,11 @@ class Fixed:
         infer the axes of my storer
         return a boolean indicating if we have a valid storer or not
         """
-        s = self.storable
-        if s is None:
-            return False
-        self.get_attrs()
+        with self.parent._lock:
+            s = self.storable
+            if s is None:
+                return False
+            self.get_attrs()
         return True
 
     def read(
@@ -3602,6 +3696,42 @@ class Table(Fixed):
 
         return dict(d1 + d2 + d3)
 
+    def _selection(
+        self, where=None, start: int | None = None, stop: int | None = None
+    ) -> Selection:
+        """
+        Return the Selection for where/start/stop, reusing a cached one when
+        the ``io.hdf.selection_cache_size`` option is enabled.
+        """
+        maxsize = get_option("io.hdf.selection_cache_size")
+        key = None
+        if maxsize:
+            where_key = _where_cache_key(where, self.queryables())
+            if where_key is not None:
+                try:
+                    mtime = os.stat(self.parent._path).st_mtime_ns
+                except OSError:
+                    mtime = None
+                if mtime is not None:
+                    key = (self.pathname, where_key, start, stop, self.nrows, mtime)
+
+        if key is None:
+            return Selection(self, where=where, start=start, stop=stop)
+
+        cache = self.parent._selection_cache
+        with self.parent._lock:
+            selection = cache.get(key)
+            if selection is not None:
+                cache.move_to_end(key)
+                return selection
+
+            selection = Selection(self, where=where, start=start, stop=stop)
+            selection.cache_coordinates()
+            cache[key] = selection
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        return selection
+
     def index_cols(self) -> list[tuple[Any, Any]]:
         """return a list of my index cols"""
         # Note: each `i.cname` below is assured to be a str.
@@ -3876,7 +4006,7 @@ class Table(Fixed):
         List[Tuple[index_values, column_values]]
         """
         # create the selection
-        selection = Selection(self, where=where, start=start, stop=stop)
+        selection = self._selection(where=where, start=start, stop=stop)
         values = selection.select()
 
         results = []
@@ -4337,7 +4467,7 @@ class Table(Fixed):
             return False
 
         # create the selection
-        selection = Selection(self, where=where, start=start, stop=stop)
+        selection = self._selection(where=where, start=start, stop=stop)
         coords = selection.select_coords()
         if selection.filter is not None:
             for field, op, filt in selection.filter.format():
@@ -4750,7 +4880,7 @@ class AppendableFrameTable(AppendableTable):
         else:
             df = concat(frames, axis=1)
 
-        selection = Selection(self, where=where, start=start, stop=stop)
+        selection = self._selection(where=where, start=start, stop=stop)
         # apply the selection filters & axis orderings
         df = self.process_axes(df, selection=selection, columns=columns)
         return df
@@ -5329,6 +5459,71 @@ def _get_data_and_dtype_name(data: ArrayLike):
     return data, dtype_name
 
 
+def _expr_names(expr: str) -> set[str] | None:
+    """
+    Return the variable names referenced in a where expression, or None if it
+    cannot be tokenized.
+    """
+    names = set()
+    prev = None
+    try:
+        for tok in tokenize.generate_tokens(StringIO(expr).readline):
+            if (
+                tok.type == tokenize.NAME
+                and not keyword.iskeyword(tok.string)
+                and not (prev is not None and prev.string == ".")
+            ):
+                names.add(tok.string)
+            prev = tok
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    return names
+
+
+def _where_cache_key(where, queryables: dict[str, Any]) -> tuple | None:
+    """
+    Return a hashable key for a where clause, or None if it cannot be cached.
+
+    Names that are not queryables are resolved in the scope captured by the
+    term; the clause is only cacheable when they all resolve to hashable
+    scalars or callables (e.g. ``Timestamp``), so a changed local variable
+    produces a different key.
+    """
+    if where is None:
+        return None
+
+    key = []
+    for term in where if isinstance(where, list) else [where]:
+        if isinstance(term, PyTablesExpr) and isinstance(term.expr, str):
+            expr, env = term.expr, term.env
+        elif isinstance(term, str):
+            expr, env = term, None
+        else:
+            # coordinates or an otherwise unhashable where
+            return None
+
+        names = _expr_names(expr)
+        if names is None:
+            return None
+        resolved = []
+        for name in sorted(names - set(queryables)):
+            if env is None:
+                return None
+            try:
+                value = env.resolve(name, is_local=False)
+            except UndefinedVariableError:
+                return None
+            if not (lib.is_scalar(value) or callable(value)):
+                return None
+            try:
+                hash(value)
+            except TypeError:
+                return None
+            resolved.append((name, value))
+        key.append((expr, tuple(resolved)))
+    return tuple(key)
+
+
 class Selection:
     """
     Carries out a selection operation on a tables.Table object.
@@ -5419,13 +5614,22 @@ class Selection:
         """
         generate the selection
         """
+        with self.table.parent._lock:
+            if self.condition is not None:
+                return self.table.table.read_where(
+                    self.condition.format(), start=self.start, stop=self.stop
+                )
+            elif self.coordinates is not None:
+                return self.table.table.read_coordinates(self.coordinates)
+            return self.table.table.read(start=self.start, stop=self.stop)
+
+    def cache_coordinates(self) -> None:
+        """
+        Evaluate the condition once; later selects read by coordinates.
+        """
         if self.condition is not None:
-            return self.table.table.read_where(
-                self.condition.format(), start=self.start, stop=self.stop
-            )
-        elif self.coordinates is not None:
-            return self.table.table.read_coordinates(self.coordinates)
-        return self.table.table.read(start=self.start, stop=self.stop)
+            self.coordinates = self.select_coords()
+            self.condition = None
 
     def select_coords(self):
         """
@@ -144,6 +144,9 @@ class SAS7BDATReader(SASReader):
     convert_header_text : bool, defaults to True
         If False, header text, including column names, are left as raw
         bytes.
+    nthreads : int, defaults to None
+        Number of threads used to decompress RLE/RDC compressed rows. If
+        None or 1, rows are decompressed on the calling thread.
     """
 
     _int_length: int
@@ -160,7 +163,13 @@ class SAS7BDATReader(SASReader):
         convert_text: bool = True,
         convert_header_text: bool = True,
         compression: CompressionOptions = "infer",
+        nthreads: int | None = None,
     ) -> None:
+        if nthreads is None:
+            nthreads = 1
+        elif not isinstance(nthreads, int) or nthreads < 1:
+            raise ValueError("nthreads must be a positive integer when set.")
+
         self.index = index
         self.convert_dates = convert_dates
         self.blank_missing = blank_missing
@@ -168,6 +177,7 @@ class SAS7BDATReader(SASReader):
         self.encoding = encoding
         self.convert_text = convert_text
         self.convert_header_text = convert_header_text
+        self.nthreads = nthreads
 
         self.default_encoding = "latin-1"
         self.compression = b""
@@ -67,6 +67,7 @@ def read_sas(
     chunksize: int = ...,
     iterator: bool = ...,
     compression: CompressionOptions = ...,
+    nthreads: int | None = ...,
 ) -> SASReader: ...
 
 
@@ -80,6 +81,7 @@ def read_sas(
     chunksize: None = ...,
     iterator: bool = ...,
     compression: CompressionOptions = ...,
+    nthreads: int | None = ...,
 ) -> DataFrame | SASReader: ...
 
 
@@ -93,6 +95,7 @@ def read_sas(
     chunksize: int | None = None,
     iterator: bool = False,
     compression: CompressionOptions = "infer",
+    nthreads: int | None = None,
 ) -> DataFrame | SASReader:
     """
     Read SAS files stored as either XPORT or SAS7BDAT format files.
@@ -117,6 +120,11 @@ def read_sas(
     iterator : bool, defaults to False
         If True, returns an iterator for reading the file incrementally.
     {decompression_options}
+    nthreads : int, optional
+        Number of threads used to decompress compressed SAS7BDAT files. Not
+        supported for XPORT files.
+
+        .. versionadded:: 3.0.0
 
     Returns
     -------
@@ -158,6 +166,9 @@ def read_sas(
     if format.lower() == "xport":
         from pandas.io.sas.sas_xport import XportReader
 
+        if nthreads is not None:
+            raise ValueError("nthreads is only supported for SAS7BDAT files")
+
         reader = XportReader(
             filepath_or_buffer,
             index=index,
@@ -174,6 +185,7 @@ def read_sas(
             encoding=encoding,
             chunksize=chunksize,
             compression=compression,
+            nthreads=nthreads,
         )
     else:
         raise ValueError("unknown SAS format")
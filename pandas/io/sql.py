@@ -64,6 +64,8 @@ from pandas.core.common import maybe_make_list
 from pandas.core.internals.construction import convert_object_array
 from pandas.core.tools.datetimes import to_datetime
 
+from pandas.io.instrumentation import io_stage
+
 if TYPE_CHECKING:
     from collections.abc import (
         Callable,
@@ -195,19 +197,31 @@ def _wrap_result(
     dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
 ) -> DataFrame:
     """Wrap result set of a SQLAlchemy query in a DataFrame."""
-    frame = _convert_arrays_to_dataframe(data, columns, coerce_float, dtype_backend)
+    with io_stage("convert") as stage:
+        frame = _convert_arrays_to_dataframe(
+            data, columns, coerce_float, dtype_backend
+        )
 
-    if dtype:
-        frame = frame.astype(dtype)
+        if dtype:
+            frame = frame.astype(dtype)
 
-    frame = _parse_date_columns(frame, parse_dates)
+        frame = _parse_date_columns(frame, parse_dates)
 
-    if index_col is not None:
-        frame = frame.set_index(index_col)
+        if index_col is not None:
+            frame = frame.set_index(index_col)
+        stage.record(rows=len(frame))
 
     return frame
 
 
+def _fetch(fetch: Callable, *args: Any) -> list:
+    """Fetch rows of a result set, instrumented as the fetch stage."""
+    with io_stage("fetch") as stage:
+        data = fetch(*args)
+        stage.record(rows=len(data))
+    return data
+
+
 def _wrap_result_adbc(
     df: DataFrame,
     *,
@@ -1101,7 +1115,9 @@ class SQLTable(PandasObject):
                     break
 
                 chunk_iter = zip(*(arr[start_i:end_i] for arr in data_list))
-                num_inserted = exec_insert(conn, keys, chunk_iter)
+                with io_stage("write") as stage:
+                    num_inserted = exec_insert(conn, keys, chunk_iter)
+                    stage.record(rows=end_i - start_i)
                 # GH 46891
                 if num_inserted is not None:
                     if total_inserted is None:
@@ -1124,7 +1140,7 @@ class SQLTable(PandasObject):
         has_read_data = False
         with exit_stack:
             while True:
-                data = result.fetchmany(chunksize)
+                data = _fetch(result.fetchmany, chunksize)
                 if not data:
                     if not has_read_data:
                         yield DataFrame.from_records(
@@ -1133,16 +1149,18 @@ class SQLTable(PandasObject):
                     break
 
                 has_read_data = True
-                self.frame = _convert_arrays_to_dataframe(
-                    data, columns, coerce_float, dtype_backend
-                )
+                with io_stage("convert") as stage:
+                    self.frame = _convert_arrays_to_dataframe(
+                        data, columns, coerce_float, dtype_backend
+                    )
 
-                self._harmonize_columns(
-                    parse_dates=parse_dates, dtype_backend=dtype_backend
-                )
+                    self._harmonize_columns(
+                        parse_dates=parse_dates, dtype_backend=dtype_backend
+                    )
 
-                if self.index is not None:
-                    self.frame.set_index(self.index, inplace=True)
+                    if self.index is not None:
+                        self.frame.set_index(self.index, inplace=True)
+                    stage.record(rows=len(self.frame))
 
                 yield self.frame
 
@@ -1179,17 +1197,19 @@ class SQLTable(PandasObject):
                 dtype_backend=dtype_backend,
             )
         else:
-            data = result.fetchall()
-            self.frame = _convert_arrays_to_dataframe(
-                data, column_names, coerce_float, dtype_backend
-            )
+            data = _fetch(result.fetchall)
+            with io_stage("convert") as stage:
+                self.frame = _convert_arrays_to_dataframe(
+                    data, column_names, coerce_float, dtype_backend
+                )
 
-            self._harmonize_columns(
-                parse_dates=parse_dates, dtype_backend=dtype_backend
-            )
+                self._harmonize_columns(
+                    parse_dates=parse_dates, dtype_backend=dtype_backend
+                )
 
-            if self.index is not None:
-                self.frame.set_index(self.index, inplace=True)
+                if self.index is not None:
+                    self.frame.set_index(self.index, inplace=True)
+                stage.record(rows=len(self.frame))
 
             return self.frame
 
@@ -1640,9 +1660,10 @@ class SQLDatabase(PandasSQL):
     def execute(self, sql: str | Select | TextClause, params=None):
         """Simple passthrough to SQLAlchemy connectable"""
         args = [] if params is None else [params]
-        if isinstance(sql, str):
-            return self.con.exec_driver_sql(sql, *args)
-        return self.con.execute(sql, *args)
+        with io_stage("query"):
+            if isinstance(sql, str):
+                return self.con.exec_driver_sql(sql, *args)
+            return self.con.execute(sql, *args)
 
     def read_table(
         self,
@@ -1737,7 +1758,7 @@ class SQLDatabase(PandasSQL):
         has_read_data = False
         with exit_stack:
             while True:
-                data = result.fetchmany(chunksize)
+                data = _fetch(result.fetchmany, chunksize)
                 if not data:
                     if not has_read_data:
                         yield _wrap_result(
@@ -1836,7 +1857,7 @@ class SQLDatabase(PandasSQL):
                 dtype_backend=dtype_backend,
             )
         else:
-            data = result.fetchall()
+            data = _fetch(result.fetchall)
             frame = _wrap_result(
                 data,
                 columns,
@@ -2101,7 +2122,8 @@ class ADBCDatabase(PandasSQL):
         args = [] if params is None else [params]
         cur = self.con.cursor()
         try:
-            cur.execute(sql, *args)
+            with io_stage("query"):
+                cur.execute(sql, *args)
             return cur
         except Exception as exc:
             try:
@@ -2658,7 +2680,8 @@ class SQLiteDatabase(PandasSQL):
         args = [] if params is None else [params]
         cur = self.con.cursor()
         try:
-            cur.execute(sql, *args)
+            with io_stage("query"):
+                cur.execute(sql, *args)
             return cur
         except Exception as exc:
             try:
@@ -2686,7 +2709,7 @@ class SQLiteDatabase(PandasSQL):
         """Return generator through chunked result set"""
         has_read_data = False
         while True:
-            data = cursor.fetchmany(chunksize)
+            data = _fetch(cursor.fetchmany, chunksize)
             if type(data) == tuple:
                 data = list(data)
             if not data:
@@ -2752,9 +2775,11 @@ class SQLiteDatabase(PandasSQL):
             return frame
 
     def _fetchall_as_list(self, cur):
-        result = cur.fetchall()
-        if not isinstance(result, list):
-            result = list(result)
+        with io_stage("fetch") as stage:
+            result = cur.fetchall()
+            if not isinstance(result, list):
+                result = list(result)
+            stage.record(rows=len(result))
         return result
 
     def to_sql(
@@ -18,9 +18,12 @@ from datetime import (
     timedelta,
 )
 from io import BytesIO
+import mmap
 import os
+import shutil
 import struct
 import sys
+import tempfile
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -63,6 +66,7 @@ from pandas import (
     isna,
     to_datetime,
 )
+from pandas.core import algorithms
 from pandas.core.frame import DataFrame
 from pandas.core.indexes.base import Index
 from pandas.core.indexes.range import RangeIndex
@@ -75,6 +79,7 @@ if TYPE_CHECKING:
     from collections.abc import (
         Callable,
         Hashable,
+        Iterable,
         Sequence,
     )
     from types import TracebackType
@@ -129,6 +134,14 @@ _iterator_params = """\
 iterator : bool, default False
     Return StataReader object."""
 
+_memory_map_params = """\
+memory_map : bool, default False
+    If a local, uncompressed file is given, map it directly onto memory and
+    decode the observations through a structured view of the mapped records
+    instead of copying them into an intermediate buffer first.
+
+    .. versionadded:: 3.0.0"""
+
 _reader_notes = """\
 Notes
 -----
@@ -156,6 +169,7 @@ filepath_or_buffer : str, path object or file-like object
 {_statafile_processing_params2}
 {_chunksize_params}
 {_iterator_params}
+{_memory_map_params}
 {_shared_docs["decompression_options"] % "filepath_or_buffer"}
 {_shared_docs["storage_options"]}
 
@@ -222,6 +236,7 @@ path_or_buf : path (string), buffer or path object
 {_statafile_processing_params1}
 {_statafile_processing_params2}
 {_chunksize_params}
+{_memory_map_params}
 {_shared_docs["decompression_options"]}
 {_shared_docs["storage_options"]}
 
@@ -1106,6 +1121,7 @@ class StataReader(StataParser, abc.Iterator):
         columns: Sequence[str] | None = None,
         order_categoricals: bool = True,
         chunksize: int | None = None,
+        memory_map: bool = False,
         compression: CompressionOptions = "infer",
         storage_options: StorageOptions | None = None,
     ) -> None:
@@ -1123,6 +1139,7 @@ class StataReader(StataParser, abc.Iterator):
         self._original_path_or_buf = path_or_buf
         self._compression = compression
         self._storage_options = storage_options
+        self._memory_map = memory_map
         self._encoding = ""
         self._chunksize = chunksize
         self._using_iterator = False
@@ -1134,9 +1151,11 @@ class StataReader(StataParser, abc.Iterator):
 
         # State variables for the file
         self._close_file: Callable[[], None] | None = None
+        self._mmap: mmap.mmap | None = None
         self._column_selector_set = False
         self._value_label_dict: dict[str, dict[int, str]] = {}
         self._value_labels_read = False
+        self._strls_read = False
         self._dtype: np.dtype | None = None
         self._lines_read = 0
 
@@ -1166,11 +1185,16 @@ class StataReader(StataParser, abc.Iterator):
             storage_options=self._storage_options,
             is_text=False,
             compression=self._compression,
+            memory_map=self._memory_map,
         )
         if hasattr(handles.handle, "seekable") and handles.handle.seekable():
             # If the handle is directly seekable, use it without an extra copy.
             self._path_or_buf = handles.handle
             self._close_file = handles.close
+            buffer = getattr(handles.handle, "buffer", None)
+            if isinstance(buffer, mmap.mmap):
+                # Uncompressed and memory mapped, records are viewed in place
+                self._mmap = buffer
         else:
             # Copy to memory, and ensure no encoding.
             with handles:
@@ -1534,6 +1558,13 @@ the string values returned are correct."""
             )
             return s.decode("latin-1")
 
+    def _decode_array(self, values: np.ndarray) -> list[str]:
+        # decode each distinct value once; columns of fixed width strings
+        # are typically highly repetitive
+        codes, uniques = algorithms.factorize(values)
+        decoded = np.array([self._decode(s) for s in uniques], dtype=object)
+        return decoded.take(codes).tolist()
+
     def _read_new_value_labels(self) -> None:
         """Reads value labels with variable length strings (108 and later format)"""
         if self._format_version >= 117:
@@ -1619,9 +1650,12 @@ the string values returned are correct."""
         self._value_labels_read = True
 
     def _read_strls(self) -> None:
+        # Only the location of each strL is recorded here, the values are
+        # read and decoded on first use in _insert_strls
         self._path_or_buf.seek(self._seek_strls)
         # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
         self.GSO = {"0": ""}
+        self._strl_locations: dict[str, tuple[int, int, int]] = {}
         while True:
             if self._path_or_buf.read(3) != b"GSO":
                 break
@@ -1639,14 +1673,24 @@ the string values returned are correct."""
                 v_o = struct.unpack(f"{self._byteorder}Q", buf)[0]
             typ = self._read_uint8()
             length = self._read_uint32()
-            va = self._path_or_buf.read(length)
-            if typ == 130:
-                decoded_va = va[0:-1].decode(self._encoding)
-            else:
-                # Stata says typ 129 can be binary, so use str
-                decoded_va = str(va)
-                # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
-            self.GSO[str(v_o)] = decoded_va
+            # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
+            self._strl_locations[str(v_o)] = (typ, self._path_or_buf.tell(), length)
+            self._path_or_buf.seek(length, os.SEEK_CUR)
+        self._strls_read = True
+
+    def _get_strl(self, key: str) -> str:
+        if key in self.GSO:
+            return self.GSO[key]
+        typ, position, length = self._strl_locations[key]
+        self._path_or_buf.seek(position)
+        va = self._path_or_buf.read(length)
+        if typ == 130:
+            decoded_va = va[0:-1].decode(self._encoding)
+        else:
+            # Stata says typ 129 can be binary, so use str
+            decoded_va = str(va)
+        self.GSO[key] = decoded_va
+        return decoded_va
 
     def __next__(self) -> DataFrame:
         self._using_iterator = True
@@ -1716,7 +1760,7 @@ the string values returned are correct."""
                 data = self._do_select_columns(data, columns)
             return data
 
-        if (self._format_version >= 117) and (not self._value_labels_read):
+        if (self._format_version >= 117) and (not self._strls_read):
             self._read_strls()
 
         # Read data
@@ -1732,11 +1776,20 @@ the string values returned are correct."""
                 self._read_value_labels()
             raise StopIteration
         offset = self._lines_read * dtype.itemsize
-        self._path_or_buf.seek(self._data_location + offset)
         read_lines = min(nrows, self._nobs - self._lines_read)
-        raw_data = np.frombuffer(
-            self._path_or_buf.read(read_len), dtype=dtype, count=read_lines
-        )
+        if self._mmap is not None:
+            # structured view of the mapped records, no intermediate copy
+            raw_data = np.frombuffer(
+                self._mmap,
+                dtype=dtype,
+                count=read_lines,
+                offset=self._data_location + offset,
+            )
+        else:
+            self._path_or_buf.seek(self._data_location + offset)
+            raw_data = np.frombuffer(
+                self._path_or_buf.read(read_len), dtype=dtype, count=read_lines
+            )
 
         self._lines_read += read_lines
 
@@ -1752,6 +1805,8 @@ the string values returned are correct."""
         else:
             data = DataFrame.from_records(raw_data)
             data.columns = Index(self._varlist)
+        # release the view so that the mapping can be closed
+        del raw_data
 
         # If index is not specified, use actual row number rather than
         # restarting at 0 for each chunk.
@@ -1764,9 +1819,9 @@ the string values returned are correct."""
             data = self._do_select_columns(data, columns)
 
         # Decode strings
-        for col, typ in zip(data, self._typlist):
+        for i, typ in enumerate(self._typlist):
             if isinstance(typ, int):
-                data[col] = data[col].apply(self._decode)
+                data.isetitem(i, self._decode_array(data.iloc[:, i]._values))
 
         data = self._insert_strls(data)
 
@@ -1854,17 +1909,20 @@ the string values returned are correct."""
             if convert_missing:  # Replacement follows Stata notation
                 missing_loc = np.nonzero(np.asarray(missing))[0]
                 umissing, umissing_loc = np.unique(series[missing], return_inverse=True)
-                replacement = Series(series, dtype=object)
+                missing_values = np.empty(len(umissing), dtype=object)
                 for j, um in enumerate(umissing):
                     if self._format_version <= 111:
-                        missing_value = StataMissingValue(
+                        missing_values[j] = StataMissingValue(
                             float(self.MISSING_VALUES[fmt])
                         )
                     else:
-                        missing_value = StataMissingValue(um)
+                        missing_values[j] = StataMissingValue(um)
 
-                    loc = missing_loc[umissing_loc == j]
-                    replacement.iloc[loc] = missing_value
+                replacement_values = np.array(svals, dtype=object)
+                replacement_values[missing_loc] = missing_values[umissing_loc]
+                replacement = Series(
+                    replacement_values, index=series.index, dtype=object, copy=False
+                )
             else:  # All replacements are identical
                 dtype = series.dtype
                 if dtype not in (np.float32, np.float64):
@@ -1885,8 +1943,11 @@ the string values returned are correct."""
         for i, typ in enumerate(self._typlist):
             if typ != "Q":
                 continue
+            # resolve each distinct key once
+            codes, keys = algorithms.factorize(data.iloc[:, i]._values)
             # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
-            data.isetitem(i, [self.GSO[str(k)] for k in data.iloc[:, i]])
+            strls = np.array([self._get_strl(str(k)) for k in keys], dtype=object)
+            data.isetitem(i, strls.take(codes).tolist())
         return data
 
     def _do_select_columns(self, data: DataFrame, columns: Sequence[str]) -> DataFrame:
@@ -2109,6 +2170,7 @@ def read_stata(
     order_categoricals: bool = True,
     chunksize: int | None = None,
     iterator: bool = False,
+    memory_map: bool = False,
     compression: CompressionOptions = "infer",
     storage_options: StorageOptions | None = None,
 ) -> DataFrame | StataReader:
@@ -2122,6 +2184,7 @@ def read_stata(
         columns=columns,
         order_categoricals=order_categoricals,
         chunksize=chunksize,
+        memory_map=memory_map,
         storage_options=storage_options,
         compression=compression,
     )
@@ -2385,6 +2448,7 @@ class StataWriter(StataParser):
         self._compression = compression
         self._output_file: IO[bytes] | None = None
         self._converted_names: dict[Hashable, str] = {}
+        self._categories: dict[Hashable, Index] = {}
         # attach nobs, nvars, data, varlist, typlist
         self._prepare_pandas(data)
         self.storage_options = storage_options
@@ -2457,6 +2521,7 @@ class StataWriter(StataParser):
             if col_is_cat:
                 svl = StataValueLabel(data[col], encoding=self._encoding)
                 self._value_labels.append(svl)
+                self._categories[col] = data[col].cat.categories
                 dtype = data[col].cat.codes.dtype
                 if dtype == np.int64:
                     raise ValueError(
@@ -2781,21 +2846,27 @@ supported types."""
                 self._write_map()
                 self._close()
             except Exception as exc:
-                self.handles.close()
-                if isinstance(self._fname, (str, os.PathLike)) and os.path.isfile(
-                    self._fname
-                ):
-                    try:
-                        os.unlink(self._fname)
-                    except OSError:
-                        warnings.warn(
-                            f"This save was not successful but {self._fname} could not "
-                            "be deleted. This file is not valid.",
-                            ResourceWarning,
-                            stacklevel=find_stack_level(),
-                        )
+                self._remove_failed_output()
                 raise exc
 
+    def _remove_failed_output(self) -> None:
+        """
+        Close the handles and delete the partially written file, if any.
+        """
+        self.handles.close()
+        if isinstance(self._fname, (str, os.PathLike)) and os.path.isfile(
+            self._fname
+        ):
+            try:
+                os.unlink(self._fname)
+            except OSError:
+                warnings.warn(
+                    f"This save was not successful but {self._fname} could not "
+                    "be deleted. This file is not valid.",
+                    ResourceWarning,
+                    stacklevel=find_stack_level(),
+                )
+
     def _close(self) -> None:
         """
         Close the file if it was created by the writer.
@@ -2805,9 +2876,13 @@ supported types."""
         """
         # write compression
         if self._output_file is not None:
-            assert isinstance(self.handles.handle, BytesIO)
             bio, self.handles.handle = self.handles.handle, self._output_file
-            self.handles.handle.write(bio.getvalue())
+            if isinstance(bio, BytesIO):
+                self.handles.handle.write(bio.getvalue())
+            else:
+                # spooled to a temporary file by write_chunks
+                bio.seek(0)
+                shutil.copyfileobj(bio, self.handles.handle)
 
     def _write_map(self) -> None:
         """No-op, future compatibility"""
@@ -2946,8 +3021,9 @@ supported types."""
         """No-op, future compatibility"""
         return data
 
-    def _prepare_data(self) -> np.rec.recarray:
-        data = self.data
+    def _prepare_data(self, data: DataFrame | None = None) -> np.rec.recarray:
+        if data is None:
+            data = self.data
         typlist = self.typlist
         convert_dates = self._convert_dates
         # 1. Convert dates
@@ -3117,10 +3193,19 @@ class StataStrLWriter:
             # v, o will be swapped when applying byteorder
             return o + self._o_offet * v
 
-    def generate_table(self) -> tuple[dict[str, tuple[int, int]], DataFrame]:
+    def generate_table(
+        self, start: int = 0
+    ) -> tuple[dict[str, tuple[int, int]], DataFrame]:
         """
         Generates the GSO lookup table for the DataFrame
 
+        Parameters
+        ----------
+        start : int, default 0
+            Observation number of the first row of the DataFrame. Used when
+            the data is written in chunks, in which case the lookup table is
+            shared across calls and ``df`` is replaced by each new chunk.
+
         Returns
         -------
         gso_table : dict
@@ -3160,7 +3245,7 @@ class StataStrLWriter:
                 key = gso_table.get(val, None)
                 if key is None:
                     # Stata prefers human numbers
-                    key = (v + 1, o + 1)
+                    key = (v + 1, start + o + 1)
                     gso_table[val] = key
                 keys[o, j] = self._convert_key(key)
         for i, col in enumerate(self.columns):
@@ -3359,6 +3444,9 @@ class StataWriter117(StataWriter):
         )
         self._map: dict[str, int] = {}
         self._strl_blob = b""
+        self._strl_writer: StataStrLWriter | None = None
+        self._strl_start = 0
+        self._nobs_offset = 0
 
     @staticmethod
     def _tag(val: str | bytes, tag: str) -> bytes:
@@ -3372,6 +3460,194 @@ class StataWriter117(StataWriter):
         assert self.handles.handle is not None
         self._map[tag] = self.handles.handle.tell()
 
+    def write_chunks(self, chunks: Iterable[DataFrame]) -> None:
+        """
+        Export the DataFrame followed by an iterator of chunks to Stata dta format.
+
+        The DataFrame used to create the writer declares the schema of the
+        file: the variable names and types, the width of fixed-length string
+        variables, the categories of categorical columns and the value labels.
+        Its rows are written first and the rows of each chunk are appended as
+        they arrive, so that only a single chunk is held in memory at a time.
+        The number of observations in the header and the map of block
+        offsets are patched once the last chunk has been written.
+
+        .. versionadded:: 3.0.0
+
+        Parameters
+        ----------
+        chunks : iterable of DataFrame
+            DataFrames with the same columns as the schema. Each column is
+            cast to the type declared by the schema.
+
+        Raises
+        ------
+        ValueError
+            * If the columns of a chunk differ from the schema
+            * If a column cannot be cast to the declared type without loss,
+              for example if strings are longer than the declared width or
+              a categorical has different categories
+
+        See Also
+        --------
+        StataWriter117.write_file : Export a single DataFrame.
+
+        Notes
+        -----
+        The strL lookup table holds each distinct strL once and is kept in
+        memory until all chunks have been written. When compression is used
+        the uncompressed file is spooled to a temporary file.
+
+        Examples
+        --------
+        >>> chunks = pd.read_csv("large.csv", chunksize=100_000)  # doctest: +SKIP
+        >>> writer = pd.io.stata.StataWriter117(
+        ...     "large.dta", next(chunks), write_index=False
+        ... )  # doctest: +SKIP
+        >>> writer.write_chunks(chunks)  # doctest: +SKIP
+        """
+        with get_handle(
+            self._fname,
+            "wb",
+            compression=self._compression,
+            is_text=False,
+            storage_options=self.storage_options,
+        ) as self.handles:
+            if self.handles.compression["method"] is not None:
+                # Seeking is required to patch the header, so the data is
+                # spooled to disk and compressed when closing
+                self._output_file, self.handles.handle = (
+                    self.handles.handle,
+                    tempfile.TemporaryFile(),
+                )
+                self.handles.created_handles.append(self.handles.handle)
+
+            try:
+                self._write_header(
+                    data_label=self._data_label, time_stamp=self._time_stamp
+                )
+                self._write_map()
+                self._write_variable_types()
+                self._write_varnames()
+                self._write_sortlist()
+                self._write_formats()
+                self._write_value_label_names()
+                self._write_variable_labels()
+                self._write_expansion_fields()
+                self._write_characteristics()
+                self._update_map("data")
+                self._write_bytes(b"<data>")
+                dtypes = self.data.dtypes
+                records = self._prepare_data()
+                nobs = len(records)
+                self._write_bytes(records.tobytes())
+                for chunk in chunks:
+                    self._strl_start = nobs
+                    chunk_records = self._prepare_data(
+                        self._prepare_chunk(chunk, dtypes)
+                    )
+                    if chunk_records.dtype != records.dtype:
+                        raise ValueError(
+                            "The types of the chunk do not match the types "
+                            "declared by data."
+                        )
+                    nobs += len(chunk_records)
+                    self._write_bytes(chunk_records.tobytes())
+                self._write_bytes(b"</data>")
+                self._write_strls()
+                self._write_value_labels()
+                self._write_file_close_tag()
+                self._write_map()
+                self._update_nobs(nobs)
+                self._close()
+            except Exception as exc:
+                self._remove_failed_output()
+                raise exc
+
+    def _prepare_chunk(self, chunk: DataFrame, dtypes: Series) -> DataFrame:
+        """
+        Check a chunk against the schema and cast it to the declared types
+        """
+        data = chunk.copy()
+        if self._write_index:
+            temp = data.reset_index()
+            if isinstance(temp, DataFrame):
+                data = temp
+
+        columns = [self._converted_names.get(col, col) for col in data.columns]
+        if columns != self.varlist:
+            raise ValueError(
+                "The columns of each chunk must match the columns of data."
+            )
+        data.columns = Index(columns)
+        data = _cast_to_stata_types(data)
+
+        get_base_missing_value = StataMissingValue.get_base_missing_value
+        for i, col in enumerate(data):
+            column = data[col]
+            typ = self.typlist[i]
+            if i in self._convert_dates:
+                continue
+            elif col in self._categories:
+                if not isinstance(
+                    column.dtype, CategoricalDtype
+                ) or not column.cat.categories.equals(self._categories[col]):
+                    raise ValueError(
+                        f"The categories of {col} must match the categories "
+                        "declared by data."
+                    )
+                values = column.cat.codes._values.astype(dtypes[col])
+                values[column.cat.codes._values == -1] = get_base_missing_value(
+                    dtypes[col]
+                )
+                data[col] = values
+            elif typ == 32768:
+                # strLs are converted by _convert_strls
+                continue
+            elif typ <= self._max_string_length:
+                if infer_dtype(column, skipna=True) not in ("string", "empty"):
+                    raise ValueError(
+                        f"Column `{col}` cannot be exported. Only string-like "
+                        "object arrays can be written to a string variable."
+                    )
+                encoded = column.str.encode(self._encoding)
+                if max_len_string_array(ensure_object(encoded._values)) > typ:
+                    raise ValueError(
+                        f"Strings in {col} are longer than the width of {typ} "
+                        "declared by data."
+                    )
+                data[col] = encoded
+            elif column.dtype != dtypes[col]:
+                dtype = dtypes[col]
+                if dtype.kind == "i" and column.dtype.kind == "i":
+                    fmt = {1: "b", 2: "h", 4: "l"}[dtype.itemsize]
+                    nmin, nmax = self.VALID_RANGE[fmt]
+                    lossless = column.empty or (
+                        column.min() >= nmin and column.max() <= nmax
+                    )
+                else:
+                    lossless = np.can_cast(column.dtype, dtype)
+                if not lossless:
+                    raise ValueError(
+                        f"Column {col} with type {column.dtype} cannot be "
+                        f"written as the type {dtype} declared by data."
+                    )
+                data[col] = column.astype(dtype)
+
+        return self._replace_nans(data)
+
+    def _update_nobs(self, nobs: int) -> None:
+        """Overwrite the number of observations written in the header"""
+        nobs_size = "I" if self._dta_version == 117 else "Q"
+        if nobs >= 2 ** (8 * struct.calcsize(nobs_size)):
+            raise ValueError(
+                f"dta {self._dta_version} files cannot contain more than "
+                f"{2 ** (8 * struct.calcsize(nobs_size)) - 1} observations."
+            )
+        self.nobs = nobs
+        self.handles.handle.seek(self._nobs_offset)
+        self._write_bytes(struct.pack(self._byteorder + nobs_size, nobs))
+
     def _write_header(
         self,
         data_label: str | None = None,
@@ -3379,6 +3655,7 @@ class StataWriter117(StataWriter):
     ) -> None:
         """Write the file header"""
         byteorder = self._byteorder
+        header_start = self.handles.handle.tell() + len(b"<stata_dta><header>")
         self._write_bytes(bytes("<stata_dta>", "utf-8"))
         bio = BytesIO()
         # ds_format - 117
@@ -3390,6 +3667,8 @@ class StataWriter117(StataWriter):
         bio.write(self._tag(struct.pack(byteorder + nvar_type, self.nvar), "K"))
         # 117 uses 4 bytes, 118 uses 8
         nobs_size = "I" if self._dta_version == 117 else "Q"
+        # Location of N, which is patched once all chunks have been written
+        self._nobs_offset = header_start + bio.tell() + len(b"<N>")
         bio.write(self._tag(struct.pack(byteorder + nobs_size, self.nobs), "N"))
         # data label 81 bytes, char, null terminated
         label = data_label[:80] if data_label is not None else ""
@@ -3550,6 +3829,10 @@ class StataWriter117(StataWriter):
 
     def _write_strls(self) -> None:
         self._update_map("strls")
+        if self._strl_writer is not None:
+            self._strl_blob = self._strl_writer.generate_blob(
+                self._strl_writer._gso_table
+            )
         self._write_bytes(self._tag(self._strl_blob, "strls"))
 
     def _write_expansion_fields(self) -> None:
@@ -3592,12 +3875,16 @@ class StataWriter117(StataWriter):
         ]
 
         if convert_cols:
-            ssw = StataStrLWriter(
-                data, convert_cols, version=self._dta_version, byteorder=self._byteorder
-            )
-            tab, new_data = ssw.generate_table()
-            data = new_data
-            self._strl_blob = ssw.generate_blob(tab)
+            # The writer, and so the GSO table, is shared by all chunks
+            if self._strl_writer is None:
+                self._strl_writer = StataStrLWriter(
+                    data,
+                    convert_cols,
+                    version=self._dta_version,
+                    byteorder=self._byteorder,
+                )
+            self._strl_writer.df = data
+            _, data = self._strl_writer.generate_table(start=self._strl_start)
         return data
 
     def _set_formats_and_types(self, dtypes: Series) -> None:
@@ -5,6 +5,10 @@
 from __future__ import annotations
 
 import io
+from itertools import (
+    chain,
+    islice,
+)
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
@@ -20,7 +24,12 @@ from pandas.errors import (
 from pandas.util._decorators import doc
 from pandas.util._validators import check_dtype_backend
 
-from pandas.core.dtypes.common import is_list_like
+from pandas.core.dtypes.common import (
+    is_integer,
+    is_list_like,
+)
+
+from pandas.core.indexes.range import RangeIndex
 
 from pandas.core.shared_docs import _shared_docs
 
@@ -36,6 +45,8 @@ from pandas.io.parsers import TextParser
 if TYPE_CHECKING:
     from collections.abc import (
         Callable,
+        Hashable,
+        Iterator,
         Sequence,
     )
     from xml.etree.ElementTree import Element
@@ -47,6 +58,7 @@ if TYPE_CHECKING:
         ConvertersArg,
         DtypeArg,
         DtypeBackend,
+        DtypeObj,
         FilePath,
         ParseDatesArg,
         ReadBuffer,
@@ -54,7 +66,10 @@ if TYPE_CHECKING:
         XMLParsers,
     )
 
-    from pandas import DataFrame
+    from pandas import (
+        DataFrame,
+        Series,
+    )
 
 
 @doc(
@@ -125,6 +140,12 @@ class _XMLFrameParser:
 
     {storage_options}
 
+    chunksize : int, optional
+        Number of rows of each chunk returned by :func:`parse_chunks`
+        when iterparsing.
+
+        .. versionadded:: 3.0.0
+
     See also
     --------
     pandas.io.xml._EtreeFrameParser
@@ -134,6 +155,7 @@ class _XMLFrameParser:
     -----
     To subclass this class effectively you must override the following methods:`
         * :func:`parse_data`
+        * :func:`parse_chunks`
         * :func:`_parse_nodes`
         * :func:`_iterparse_nodes`
         * :func:`_parse_doc`
@@ -161,6 +183,7 @@ class _XMLFrameParser:
         iterparse: dict[str, list[str]] | None,
         compression: CompressionOptions,
         storage_options: StorageOptions,
+        chunksize: int | None = None,
     ) -> None:
         self.path_or_buffer = path_or_buffer
         self.xpath = xpath
@@ -176,6 +199,7 @@ class _XMLFrameParser:
         self.iterparse = iterparse
         self.compression: CompressionOptions = compression
         self.storage_options = storage_options
+        self.chunksize = chunksize
 
     def parse_data(self) -> list[dict[str, str | None]]:
         """
@@ -187,6 +211,16 @@ class _XMLFrameParser:
 
         raise AbstractMethodError(self)
 
+    def parse_chunks(self) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Iterparse xml data in chunks of ``chunksize`` rows.
+
+        This method will validate names and return the chunks of
+        rows of the iterparse nodes.
+        """
+
+        raise AbstractMethodError(self)
+
     def _parse_nodes(self, elems: list[Any]) -> list[dict[str, str | None]]:
         """
         Parse xml nodes.
@@ -296,8 +330,74 @@ class _XMLFrameParser:
         will have optional keys filled with None values.
         """
 
-        dicts: list[dict[str, str | None]] = []
+        dicts = list(self._iterparse_rows(iterparse))
+
+        if dicts == []:
+            raise ParserError("No result from selected items in iterparse.")
+
+        keys = list(dict.fromkeys([k for d in dicts for k in d.keys()]))
+        dicts = [{k: d[k] if k in d.keys() else None for k in keys} for d in dicts]
+
+        if self.names:
+            dicts = [dict(zip(self.names, d.values())) for d in dicts]
+
+        return dicts
+
+    def _iterparse_chunks(
+        self, iterparse: Callable
+    ) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Iterparse xml nodes in chunks of ``chunksize`` rows.
+
+        Rows are parsed like :func:`_iterparse_nodes`, but every chunk has
+        the same keys: the keys of the first chunk in order of appearance,
+        followed by the items of ``iterparse`` it is missing.
+
+        Raises
+        ------
+        ParserError
+            * If no data is returned from selected items in ``iterparse``.
+        """
+        assert self.chunksize is not None and self.iterparse is not None
+
+        rows = self._iterparse_rows(iterparse)
+        keys: list[str] | None = None
+        while True:
+            dicts = list(islice(rows, self.chunksize))
+            if not dicts:
+                if keys is None:
+                    raise ParserError("No result from selected items in iterparse.")
+                return
+
+            if keys is None:
+                row_node = next(iter(self.iterparse.keys()))
+                items = self.names or self.iterparse[row_node]
+                keys = list(
+                    dict.fromkeys([k for d in dicts for k in d.keys()] + list(items))
+                )
+            dicts = [{k: d.get(k) for k in keys} for d in dicts]
+
+            if self.names:
+                dicts = [dict(zip(self.names, d.values())) for d in dicts]
+
+            yield dicts
+
+    def _iterparse_rows(self, iterparse: Callable) -> Iterator[dict[str, str | None]]:
+        """
+        Iterparse the rows of ``iterparse`` as dicts, clearing the parsed
+        elements as soon as they are consumed.
+
+        Raises
+        ------
+        TypeError
+            * If ``iterparse`` is not a dict or its dict value is not list-like.
+        ParserError
+            * If ``path_or_buffer`` is not a physical file on disk or file-like object.
+        """
+
         row: dict[str, str | None] | None = None
+        # open elements, to drop consumed elements from their parent with etree
+        parents: list[Any] = []
 
         if not isinstance(self.iterparse, dict):
             raise TypeError(
@@ -334,6 +434,7 @@ class _XMLFrameParser:
             curr_elem = elem.tag.split("}")[1] if "}" in elem.tag else elem.tag
 
             if event == "start":
+                parents.append(elem)
                 if curr_elem == row_node:
                     row = {}
 
@@ -357,26 +458,19 @@ class _XMLFrameParser:
 
             if event == "end":
                 if curr_elem == row_node and row is not None:
-                    dicts.append(row)
+                    yield row
                     row = None
 
                 elem.clear()
+                parents.pop()
                 if hasattr(elem, "getprevious"):
                     while (
                         elem.getprevious() is not None and elem.getparent() is not None
                     ):
                         del elem.getparent()[0]
-
-        if dicts == []:
-            raise ParserError("No result from selected items in iterparse.")
-
-        keys = list(dict.fromkeys([k for d in dicts for k in d.keys()]))
-        dicts = [{k: d[k] if k in d.keys() else None for k in keys} for d in dicts]
-
-        if self.names:
-            dicts = [dict(zip(self.names, d.values())) for d in dicts]
-
-        return dicts
+                elif parents:
+                    # etree elements do not know their parent
+                    del parents[-1][:]
 
     def _validate_path(self) -> list[Any]:
         """
@@ -449,6 +543,13 @@ class _EtreeFrameParser(_XMLFrameParser):
 
         return xml_dicts
 
+    def parse_chunks(self) -> Iterator[list[dict[str, str | None]]]:
+        from xml.etree.ElementTree import iterparse
+
+        self._validate_names()
+
+        return self._iterparse_chunks(iterparse)
+
     def _validate_path(self) -> list[Any]:
         """
         Notes
@@ -568,6 +669,13 @@ class _LxmlFrameParser(_XMLFrameParser):
 
         return xml_dicts
 
+    def parse_chunks(self) -> Iterator[list[dict[str, str | None]]]:
+        from lxml.etree import iterparse
+
+        self._validate_names()
+
+        return self._iterparse_chunks(iterparse)
+
     def _validate_path(self) -> list[Any]:
         msg = (
             "xpath does not return any nodes or attributes. "
@@ -734,6 +842,102 @@ def _data_to_frame(data, **kwargs) -> DataFrame:
         ) from err
 
 
+def _chunks_to_frames(
+    chunks: Iterator[list[dict[str, str | None]]],
+    dtype: DtypeArg | None,
+    converters: ConvertersArg | None,
+    parse_dates: ParseDatesArg | None,
+    **kwargs,
+) -> Iterator[DataFrame]:
+    """
+    Convert chunks of parsed data to Data Frames.
+
+    The dtypes of the columns of the first chunk are inferred once and held
+    for the following chunks, except for the columns with a ``dtype``,
+    converter or date parsing set by the user and the columns without any
+    value yet. Integer columns are upcast to float64 from the first chunk
+    with missing values on. Other values of later chunks that cannot be held
+    without loss raise. The index continues from one chunk to the next.
+    """
+
+    held: dict[Hashable, DtypeObj] = {}
+    start = 0
+    for data in chunks:
+        chunk_dtype = dtype
+        if held and (dtype is None or isinstance(dtype, dict)):
+            # values of text columns are kept as is instead of inferred
+            chunk_dtype = {
+                **{col: dt for col, dt in held.items() if dt.kind in "OUT"},
+                **(dtype or {}),
+            }
+        frame = _data_to_frame(
+            data,
+            dtype=chunk_dtype,
+            converters=converters,
+            parse_dates=parse_dates,
+            **kwargs,
+        )
+
+        if start == 0 and (dtype is None or isinstance(dtype, dict)):
+            user_set = {
+                *(dtype or {}),
+                *(converters or {}),
+                *(parse_dates if is_list_like(parse_dates) else []),
+            }
+            held = {
+                col: frame.dtypes.iloc[i]
+                for i, col in enumerate(frame.columns)
+                if col not in user_set
+                and i not in user_set
+                and frame.iloc[:, i].notna().any()
+            }
+        else:
+            for col, held_dtype in held.items():
+                values = frame[col]
+                if (
+                    held_dtype.kind in "iu"
+                    and values.dtype.kind == "f"
+                    and values.isna().any()
+                ):
+                    # missing values upcast an integer column to float64, as
+                    #  when reading the file at once
+                    held_dtype = held[col] = values.dtype
+                if values.dtype != held_dtype:
+                    frame[col] = _hold_dtype(values, held_dtype, start)
+
+        frame.index = RangeIndex(start, start + len(frame))
+        start += len(frame)
+        yield frame
+
+
+def _hold_dtype(values: Series, dtype: DtypeObj, start: int) -> Series:
+    """
+    Cast the values of a chunk to the dtype held from the first chunk.
+
+    Raises
+    ------
+    ValueError
+        * If the values cannot be cast without loss.
+    """
+
+    mask = values.notna()
+    try:
+        result = values.astype(dtype)
+        lossless = bool(
+            (result.notna() == mask).all()
+            and (result[mask].astype(values.dtype) == values[mask]).all()
+        )
+    except (TypeError, ValueError):
+        lossless = False
+    if not lossless:
+        raise ValueError(
+            f"Unable to hold the values of column {values.name} in the chunk "
+            f"starting at row {start} as {dtype}, the dtype inferred from the "
+            "first chunk. Pass dtype to set the dtype of the column."
+        )
+    return result
+
+
 def _parse(
     path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
     xpath: str,
@@ -751,8 +955,9 @@ def _parse(
     compression: CompressionOptions,
     storage_options: StorageOptions,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+    chunksize: int | None = None,
     **kwargs,
-) -> DataFrame:
+) -> DataFrame | Iterator[DataFrame]:
     """
     Call internal parsers.
 
@@ -766,10 +971,17 @@ def _parse(
 
     ValueError
         * If parser is not lxml or etree.
+        * If chunksize is not a positive integer or used without iterparse.
     """
 
     p: _EtreeFrameParser | _LxmlFrameParser
 
+    if chunksize is not None:
+        if not is_integer(chunksize) or chunksize < 1:
+            raise ValueError("chunksize must be an integer >=1")
+        if iterparse is None:
+            raise ValueError("chunksize is only supported with iterparse")
+
     if parser == "lxml":
         lxml = import_optional_dependency("lxml.etree", errors="ignore")
 
@@ -789,6 +1001,7 @@ def _parse(
                 iterparse,
                 compression,
                 storage_options,
+                chunksize,
             )
         else:
             raise ImportError("lxml not found, please install or use the etree parser.")
@@ -809,10 +1022,24 @@ def _parse(
             iterparse,
             compression,
             storage_options,
+            chunksize,
         )
     else:
         raise ValueError("Values for parser can only be lxml or etree.")
 
+    if chunksize is not None:
+        frames = _chunks_to_frames(
+            p.parse_chunks(),
+            dtype=dtype,
+            converters=converters,
+            parse_dates=parse_dates,
+            dtype_backend=dtype_backend,
+            **kwargs,
+        )
+        # parse the first chunk now to raise for invalid input
+        first = next(frames)
+        return chain([first], frames)
+
     data_dicts = p.parse_data()
 
     return _data_to_frame(
@@ -848,7 +1075,8 @@ def read_xml(
     compression: CompressionOptions = "infer",
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
-) -> DataFrame:
+    chunksize: int | None = None,
+) -> DataFrame | Iterator[DataFrame]:
     r"""
     Read XML document into a :class:`~pandas.DataFrame` object.
 
@@ -971,10 +1199,19 @@ def read_xml(
 
         .. versionadded:: 2.0
 
+    chunksize : int, optional
+        Return an iterator of DataFrames of ``chunksize`` rows when used with
+        ``iterparse``, so that the rows of very large XML files do not have to
+        be held in memory at once. The dtypes of the columns are inferred from
+        the first chunk and held for the following chunks, unless set with
+        ``dtype``, ``converters`` or ``parse_dates``.
+
+        .. versionadded:: 3.0.0
+
     Returns
     -------
     df
-        A DataFrame.
+        A DataFrame, or an iterator of DataFrames if ``chunksize`` is given.
 
     See Also
     --------
@@ -1009,9 +1246,9 @@ def read_xml(
     temporarily redesign original document with XSLT (a special purpose
     language) for a flatter version for migration to a DataFrame.
 
-    This function will *always* return a single :class:`DataFrame` or raise
-    exceptions due to issues with XML document, ``xpath``, or other
-    parameters.
+    Unless ``chunksize`` is given, this function will *always* return a single
+    :class:`DataFrame` or raise exceptions due to issues with XML document,
+    ``xpath``, or other parameters.
 
     See the :ref:`read_xml documentation in the IO section of the docs
     <io.read_xml>` for more information in using this method to parse XML
@@ -1137,4 +1374,5 @@ def read_xml(
         compression=compression,
         storage_options=storage_options,
         dtype_backend=dtype_backend,
+        chunksize=chunksize,
     )
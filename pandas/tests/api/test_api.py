@@ -7,6 +7,7 @@ from pandas import api
 import pandas._testing as tm
 from pandas.api import (
     extensions as api_extensions,
+    groupby as api_groupby,
     indexers as api_indexers,
     interchange as api_interchange,
     types as api_types,
@@ -245,6 +246,7 @@ class TestApi(Base):
     allowed_api_dirs = [
         "types",
         "extensions",
+        "groupby",
         "indexers",
         "interchange",
         "typing",
@@ -258,6 +260,7 @@ class TestApi(Base):
         "ExponentialMovingWindow",
         "ExponentialMovingWindowGroupby",
         "FrozenList",
+        "GroupByPlan",
         "JsonReader",
         "NaTType",
         "NAType",
@@ -320,6 +323,7 @@ class TestApi(Base):
         "PeriodDtype",
     ]
     allowed_api_interchange = ["from_dataframe", "DataFrame"]
+    allowed_api_groupby = ["IncrementalAggregator"]
     allowed_api_indexers = [
         "check_array_indexer",
         "BaseIndexer",
@@ -350,6 +354,9 @@ class TestApi(Base):
     def test_api_interchange(self):
         self.check(api_interchange, self.allowed_api_interchange)
 
+    def test_api_groupby(self):
+        self.check(api_groupby, self.allowed_api_groupby)
+
     def test_api_indexers(self):
         self.check(api_indexers, self.allowed_api_indexers)
 
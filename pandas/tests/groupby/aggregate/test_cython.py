@@ -415,3 +415,153 @@ def test_cython_agg_EA_known_dtypes(data, op_name, action, with_na):
 
     result = grouped["col"].aggregate(op_name)
     assert result.dtype == expected_dtype
+
+
+@pytest.mark.parametrize(
+    "op_name",
+    [
+        "sum",
+        "prod",
+        "mean",
+        "median",
+        "var",
+        "std",
+        "sem",
+        "skew",
+        "min",
+        "max",
+        "first",
+        "last",
+        "any",
+        "all",
+        "idxmin",
+        "idxmax",
+        "cumsum",
+        "cummax",
+        "rank",
+    ],
+)
+@pytest.mark.parametrize("dtype", ["float64", "int64", "datetime64[ns]"])
+def test_cython_groupby_threads(op_name, dtype):
+    if dtype == "datetime64[ns]" and op_name in [
+        "sum",
+        "prod",
+        "var",
+        "sem",
+        "skew",
+        "any",
+        "all",
+        "cumsum",
+    ]:
+        pytest.skip(f"{op_name} is not supported for {dtype}")
+    rng = np.random.default_rng(2)
+    values = rng.integers(0, 1000, size=(20_000, 7)).astype(dtype)
+    df = DataFrame(values)
+    if dtype == "float64":
+        df.iloc[::5, 1] = np.nan
+    keys = rng.integers(0, 50, size=len(df))
+
+    expected = getattr(df.groupby(keys), op_name)()
+    with pd.option_context("compute.groupby_threads", 3):
+        result = getattr(df.groupby(keys), op_name)()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_cython_groupby_thread_pool_replaced():
+    from pandas.core.groupby import ops
+
+    pool = ops._get_thread_pool(2)
+    assert ops._get_thread_pool(2) is pool
+    # changing the number of threads shuts the previous pool down
+    assert ops._get_thread_pool(3) is not pool
+    with pytest.raises(RuntimeError, match="cannot schedule new futures"):
+        pool.submit(int)
+
+
+@pytest.mark.parametrize(
+    "funcs",
+    [
+        ["sum", "mean", "std", "min", "max", "count"],
+        ["var", "count"],
+        ["max", "min"],
+    ],
+)
+@pytest.mark.parametrize(
+    "keys",
+    [
+        np.array([0, 1, 0, 2, 1, 0, 3, 2, 1, 0]),
+        np.array([3.0, 1.0, np.nan, 2.0, 1.0, 3.0, np.nan, 2.0, 1.0, 3.0]),
+        pd.Categorical(list("aabbaabbaa"), categories=list("abc")),
+    ],
+)
+@pytest.mark.parametrize("as_index", [True, False])
+def test_cython_agg_fused(funcs, keys, as_index, monkeypatch):
+    df = DataFrame(
+        {
+            "a": [1.5, np.nan, 3.0, 1e16, 1.0, -1e16, np.nan, 2.0, 7.5, 0.1],
+            "b": [np.nan, np.inf, 1.0, 2.0, np.nan, np.nan, 3.0, -np.inf, 4.0, 1.0],
+            "c": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+        }
+    )
+    gb = df.groupby(keys, as_index=as_index, observed=False)
+    result = gb.agg(funcs)
+    result_ser = gb["a"].agg(funcs)
+
+    # the results of the reductions computed one at a time
+    with monkeypatch.context() as m:
+        m.setattr(type(gb), "_agg_fused", lambda self, funcs: None)
+        expected = gb.agg(funcs)
+        expected_ser = gb["a"].agg(funcs)
+    tm.assert_frame_equal(result, expected, check_exact=True)
+    tm.assert_frame_equal(result_ser, expected_ser, check_exact=True)
+
+
+@pytest.mark.parametrize("op_name", ["sum", "prod", "min", "max", "mean"])
+@pytest.mark.parametrize("dtype", ["int64", "uint8", "bool", "float64"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("sort", [True, False])
+def test_cython_agg_sorted_keys(op_name, dtype, ascending, sort, monkeypatch):
+    # groups of sorted keys are factorized and reduced as contiguous segments
+    rng = np.random.default_rng(2)
+    keys = np.sort(rng.integers(0, 50, size=1000))
+    if not ascending:
+        keys = keys[::-1]
+    if dtype == "float64":
+        values = rng.choice([np.nan, -0.0, 0.0, 1.5, -2.5, np.inf], size=(1000, 2))
+    else:
+        values = rng.integers(0, 3, size=(1000, 2)).astype(dtype)
+    df = DataFrame(values)
+    df["key"] = keys
+    gb = df.groupby("key", sort=sort)
+    # with descending keys, the groups are in descending order only if not sorted
+    assert (gb._grouper.segment_starts is not None) == (ascending or not sort)
+    result = getattr(gb, op_name)()
+    result_min_count = gb.sum(min_count=2)
+
+    with monkeypatch.context() as m:
+        m.setattr(
+            "pandas.core.groupby.grouper._factorize_monotonic",
+            lambda *args, **kwargs: None,
+        )
+        m.setattr(type(gb._grouper), "segment_starts", None)
+        gb = df.groupby("key", sort=sort)
+        expected = getattr(gb, op_name)()
+        expected_min_count = gb.sum(min_count=2)
+    tm.assert_frame_equal(result, expected, check_exact=True)
+    tm.assert_frame_equal(result_min_count, expected_min_count, check_exact=True)
+
+
+def test_cython_agg_sorted_keys_empty_groups():
+    # unobserved categories are not contiguous segments of the values
+    df = DataFrame(
+        {
+            "key": pd.Categorical(["a", "a", "c"], categories=["a", "b", "c"]),
+            "x": [1, 2, 3],
+        }
+    )
+    gb = df.groupby("key", observed=False)
+    assert gb._grouper.segment_starts is None
+    expected = DataFrame(
+        {"x": [3, 0, 3]}, index=pd.CategoricalIndex(["a", "b", "c"], name="key")
+    )
+    tm.assert_frame_equal(gb.sum(), expected)
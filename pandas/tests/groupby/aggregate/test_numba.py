@@ -387,3 +387,54 @@ def test_multilabel_udf_numba_vs_cython():
     result = gb.agg(lambda values, index: values.min(), engine="numba")
     expected = gb.agg(lambda x: x.min(), engine="cython")
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_multi_column_udf(parallel):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "key": rng.choice(list("abcd"), size=50),
+            "price": rng.uniform(10, 20, size=50),
+            "volume": rng.integers(1, 100, size=50).astype(np.float64),
+        }
+    )
+    gb = df.groupby("key")
+
+    def vwap(values, index):
+        return (values[:, 0] * values[:, 1]).sum() / values[:, 1].sum()
+
+    engine_kwargs = {"columnwise": False, "parallel": parallel}
+    result = gb.agg(vwap, engine="numba", engine_kwargs=engine_kwargs)
+    expected = gb.apply(
+        lambda x: (x["price"] * x["volume"]).sum() / x["volume"].sum(),
+        include_groups=False,
+    )
+    tm.assert_series_equal(result, expected)
+
+    def price_stats(values, index):
+        return values[:, 0].min(), values[:, 0].max(), values[:, 1].sum()
+
+    result = gb.agg(price_stats, engine="numba", engine_kwargs=engine_kwargs)
+    expected = DataFrame(
+        {
+            0: gb["price"].min(),
+            1: gb["price"].max(),
+            2: gb["volume"].sum(),
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_multi_column_udf_transform_not_supported():
+    pytest.importorskip("numba")
+    df = DataFrame({"key": ["a", "a", "b"], "data": [1.0, 2.0, 3.0]})
+
+    def func(values, index):
+        return values
+
+    with pytest.raises(NotImplementedError, match="not supported for transform"):
+        df.groupby("key").transform(
+            func, engine="numba", engine_kwargs={"columnwise": False}
+        )
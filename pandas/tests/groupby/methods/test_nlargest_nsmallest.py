@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from pandas import (
+    DataFrame,
     MultiIndex,
     Series,
     date_range,
@@ -112,3 +113,93 @@ def test_nlargest_and_smallest_noop(data, groups, dtype, nselect_method):
     expidx = np.array(groups, dtype=int) if isinstance(groups, list) else groups
     expected = Series(data, index=MultiIndex.from_arrays([expidx, ser.index]), name="a")
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", "all"])
+@pytest.mark.parametrize("dtype", ["float64", "Float64"])
+def test_nlargest_and_smallest_ties_and_na(keep, dtype, nselect_method):
+    ser = Series(
+        [3.0, 1.0, np.nan, 3.0, 2.0, 3.0, np.nan, np.nan, 1.0, np.nan], dtype=dtype
+    )
+    keys = [0, 0, 0, 0, 0, 1, 1, 1, 1, 2]
+    result = getattr(ser.groupby(keys), nselect_method)(2, keep=keep)
+    parts = [
+        getattr(ser[:5], nselect_method)(2, keep=keep),
+        getattr(ser[5:9], nselect_method)(2, keep=keep),
+        getattr(ser[9:], nselect_method)(2, keep=keep),
+    ]
+    expected = Series(
+        np.concatenate([part.array for part in parts]),
+        index=MultiIndex.from_arrays(
+            [
+                np.repeat([0, 1, 2], [len(part) for part in parts]),
+                np.concatenate([part.index for part in parts]),
+            ]
+        ),
+        dtype=dtype,
+    )
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", "all"])
+@pytest.mark.parametrize("n", [5, 6])
+def test_nlargest_and_smallest_ties_small_group(keep, n, nselect_method):
+    # the tied values of the groups with at most n values keep their original
+    #  order, while Series.nlargest orders them as Series.sort_values
+    ser = Series([2.0, 2.0, 1.0, 1.0, 3.0, 0.0], index=[130, 70, 100, 30, 80, 10])
+    keys = [0, 0, 0, 0, 0, 1]
+    result = getattr(ser.groupby(keys), nselect_method)(n, keep=keep)
+    order = [4, 0, 1, 2, 3] if nselect_method == "nlargest" else [2, 3, 0, 1, 4]
+    expected = ser.iloc[order + [5]]
+    expected.index = MultiIndex.from_arrays([keys, expected.index])
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("columns", ["a", ["a", "b"]])
+@pytest.mark.parametrize("keep", ["first", "last", "all"])
+@pytest.mark.parametrize("with_na", [False, True])
+def test_frame_nlargest_and_smallest(columns, keep, with_na, nselect_method):
+    df = DataFrame(
+        {
+            "key": list("xxxxyyyy"),
+            "a": [1, 3, 3, 2, 5, 5, 5, 4],
+            "b": [0.5, 0.1, 0.2, 0.3, 0.4, 0.4, 0.1, 0.9],
+        }
+    )
+    if with_na:
+        df.loc[[1, 5, 7], "b"] = np.nan
+    gb = df.groupby("key")
+    result = getattr(gb, nselect_method)(2, columns, keep=keep)
+    expected = gb.apply(
+        lambda x: getattr(x, nselect_method)(2, columns, keep=keep),
+        include_groups=False,
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", "all"])
+def test_frame_nlargest_and_smallest_tied_na(keep, nselect_method):
+    df = DataFrame(
+        {
+            "key": [0] * 9,
+            "x": [2.0, 3.0, 1.0, 0.0, 4.0, 1.0, 5.0, 6.0, 1.0],
+            "y": [0.0, 1.0, np.nan, 2.0, 0.0, np.nan, 1.0, 2.0, np.nan],
+        }
+    )
+    result = getattr(df.groupby("key"), nselect_method)(1, ["x", "y"], keep=keep)
+    expected = getattr(df, nselect_method)(1, ["x", "y"], keep=keep)
+    expected.index = MultiIndex.from_arrays(
+        [[0] * len(expected), expected.index], names=["key", None]
+    )
+    tm.assert_frame_equal(result, expected.drop(columns="key"))
+
+
+def test_nlargest_and_smallest_raises(nselect_method):
+    df = DataFrame({"key": [1, 1, 2], "a": [1, 2, 3], "b": list("xyz")})
+    gb = df.groupby("key")
+    with pytest.raises(ValueError, match="keep must be either"):
+        getattr(gb["a"], nselect_method)(2, keep="middle")
+    with pytest.raises(TypeError, match="Cannot use method"):
+        getattr(gb["b"], nselect_method)(2)
+    with pytest.raises(TypeError, match="Column 'b' has dtype object"):
+        getattr(gb, nselect_method)(2, ["a", "b"])
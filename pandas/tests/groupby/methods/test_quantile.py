@@ -460,3 +460,74 @@ def test_groupby_quantile_nonmulti_levels_order():
     # We need to check that index levels are not sorted
     expected_levels = pd.core.indexes.frozen.FrozenList([["B", "A"], [0.2, 0.8]])
     tm.assert_equal(result.index.levels, expected_levels)
+
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+@pytest.mark.parametrize("q", [0, 0.1, 0.5, 0.9, 1, [0.25, 0.75]])
+def test_groupby_quantile_ddsketch(relative_accuracy, q):
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "key": rng.integers(0, 5, 1000),
+            "a": rng.lognormal(size=1000),
+            "b": rng.normal(size=1000),
+            "c": rng.integers(-100, 100, 1000),
+        }
+    )
+    df.loc[::9, "a"] = np.nan
+    df.loc[::11, "b"] = 0.0
+    gb = df.groupby("key")
+
+    result = gb.quantile(q, method="ddsketch", relative_accuracy=relative_accuracy)
+    expected = gb.quantile(q, interpolation="lower").astype(np.float64)
+    tm.assert_index_equal(result.index, expected.index)
+    # a value on the edge of a bin is off by exactly the relative accuracy
+    error = (result - expected).abs() / expected.abs()
+    assert (error.fillna(0) <= relative_accuracy * (1 + 1e-9)).all().all()
+
+
+def test_groupby_quantile_ddsketch_empty_and_na_groups():
+    df = DataFrame({"key": ["a", "a", "b", np.nan], "val": [1.0, -np.inf, np.nan, 2.0]})
+    result = df.groupby("key", dropna=False).quantile(
+        [0, 1], method="ddsketch", relative_accuracy=0.001
+    )
+    expected = df.groupby("key", dropna=False).quantile([0, 1])
+    expected["val"] = [-np.inf, 1.0, np.nan, np.nan, 2.0, 2.0]
+    tm.assert_frame_equal(result, expected, check_exact=False, rtol=0.002)
+
+
+def test_groupby_quantile_ddsketch_masked():
+    df = DataFrame(
+        {"key": [1, 1, 2, 2], "val": pd.array([1, None, 3, None], dtype="Int64")}
+    )
+    result = df.groupby("key")["val"].quantile(
+        method="ddsketch", relative_accuracy=0.001
+    )
+    expected = pd.Series(
+        pd.array([1.0, 3.0], dtype="Float64"),
+        index=Index([1, 2], name="key"),
+        name="val",
+    )
+    tm.assert_series_equal(result, expected, check_exact=False, rtol=0.002)
+
+
+def test_resample_quantile_ddsketch():
+    ser = pd.Series(
+        np.arange(1.0, 49.0), index=pd.date_range("2000-01-01", periods=48, freq="h")
+    )
+    result = ser.resample("D").quantile(0.5, method="ddsketch")
+    expected = ser.resample("D").quantile(0.5, interpolation="lower")
+    tm.assert_series_equal(result, expected, check_exact=False, rtol=0.011)
+
+
+def test_groupby_quantile_ddsketch_raises():
+    df = DataFrame({"key": [1, 1], "val": [1.0, 2.0], "s": ["x", "y"]})
+    gb = df.groupby("key")
+    with pytest.raises(ValueError, match="method must be 'exact' or 'ddsketch'"):
+        gb.quantile(method="sketch")
+    with pytest.raises(ValueError, match="relative_accuracy must be between"):
+        gb["val"].quantile(method="ddsketch", relative_accuracy=1)
+    with pytest.raises(ValueError, match="Each 'q' must be between 0 and 1"):
+        gb["val"].quantile(1.5, method="ddsketch")
+    with pytest.raises(TypeError, match="cannot be performed against 'object'"):
+        df.astype({"s": object}).groupby("key")["s"].quantile(method="ddsketch")
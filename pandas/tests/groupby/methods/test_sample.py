@@ -152,3 +152,34 @@ def test_groupby_sample_with_empty_inputs():
     result = groupby_df.sample()
     expected = df
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("replace", [True, False])
+@pytest.mark.parametrize("weights", [None, [1, 2, 0, 3, 1, 1, 0, 2]])
+def test_groupby_sample_reproducible(replace, weights):
+    df = DataFrame({"a": [1, 2, 1, 2, 1, 2, 1, 2], "b": range(8)})
+    gb = df.groupby("a")
+
+    result = gb.sample(n=2, replace=replace, weights=weights, random_state=3)
+    expected = gb.sample(n=2, replace=replace, weights=weights, random_state=3)
+    tm.assert_frame_equal(result, expected)
+    assert list(result["a"]) == [1, 1, 2, 2]
+    if weights is not None:
+        # rows with zero weight are never sampled
+        assert not result.index.isin([2, 6]).any()
+
+
+def test_groupby_sample_larger_than_group_raises():
+    df = DataFrame({"a": [1, 1, 2], "b": [1, 2, 3]})
+
+    msg = "Cannot take a larger sample than population when 'replace=False'"
+    with pytest.raises(ValueError, match=msg):
+        df.groupby("a").sample(n=2)
+
+    msg = "Fewer non-zero entries in p than size"
+    with pytest.raises(ValueError, match=msg):
+        df.groupby("a").sample(n=2, weights=[1, 0, 1])
+
+    msg = "Invalid weights: weights sum to zero"
+    with pytest.raises(ValueError, match=msg):
+        df.groupby("a").sample(n=1, weights=[1, 1, 0], replace=True)
@@ -1219,3 +1219,26 @@ def test_value_counts_sort_categorical(sort, vc_sort, normalize):
     expected = expected.take(taker)
 
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("nvalues", [3, 1000])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_value_counts_matches_size(sort, nvalues, dropna):
+    # few values are counted for all combinations, many by hashing
+    rng = np.random.default_rng(2)
+    values = rng.integers(0, nvalues, 100).astype(float)
+    values[::7] = np.nan
+    df = DataFrame({"a": rng.integers(0, 5, 100), "b": values})
+    gb = df.groupby("a", sort=sort)
+
+    result = gb["b"].value_counts(sort=False, dropna=dropna)
+    expected = df.groupby(["a", "b"], sort=sort, dropna=dropna).size()
+    tm.assert_series_equal(result, expected.rename("count"))
+
+    result = gb["b"].value_counts(normalize=True, dropna=dropna)
+    expected = gb["b"].apply(
+        lambda x: x.value_counts(normalize=True, dropna=dropna)
+    )
+    expected.index.names = ["a", "b"]
+    expected.name = "proportion"
+    tm.assert_series_equal(result.sort_index(), expected.sort_index())
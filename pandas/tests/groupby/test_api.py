@@ -47,10 +47,13 @@ def test_tab_completion(multiindex_dataframe_random_data):
         "median",
         "min",
         "ngroups",
+        "nlargest",
+        "nsmallest",
         "nth",
         "ohlc",
         "plot",
         "prod",
+        "reindex_unobserved",
         "size",
         "std",
         "sum",
@@ -89,6 +92,7 @@ def test_tab_completion(multiindex_dataframe_random_data):
         "rolling",
         "expanding",
         "pipe",
+        "plan",
         "sample",
         "ewm",
         "value_counts",
@@ -172,6 +176,7 @@ def test_frame_consistency(groupby_func):
         exclude_expected = {"numeric_only", "axis"}
     elif groupby_func in ("nunique",):
         exclude_expected = {"axis"}
+        exclude_result = {"method", "precision"}
     elif groupby_func in ("max", "min"):
         exclude_expected = {"axis", "kwargs", "skipna"}
         exclude_result = {"min_count", "engine", "engine_kwargs"}
@@ -191,7 +196,10 @@ def test_frame_consistency(groupby_func):
     elif groupby_func in ("rank",):
         exclude_expected = {"numeric_only"}
     elif groupby_func in ("quantile",):
+        # method is the algorithm of the quantiles of the groups, whereas
+        #  DataFrame.quantile uses it to compute the quantiles by row or table
         exclude_expected = {"method", "axis"}
+        exclude_result = {"method", "relative_accuracy"}
     elif groupby_func in ["corrwith"]:
         exclude_expected = {"min_periods"}
     if groupby_func not in ["pct_change", "size"]:
@@ -253,7 +261,9 @@ def test_series_consistency(request, groupby_func):
     elif groupby_func in ("idxmin", "idxmax"):
         exclude_expected = {"args", "kwargs"}
     elif groupby_func in ("quantile",):
-        exclude_result = {"numeric_only"}
+        exclude_result = {"numeric_only", "method", "relative_accuracy"}
+    elif groupby_func in ("nunique",):
+        exclude_result = {"method", "precision"}
     if groupby_func not in [
         "diff",
         "pct_change",
@@ -2132,3 +2132,105 @@ def test_agg_list(request, as_index, observed, reduction_func, test_series, keys
         expected.columns = keys + [reduction_func]
 
     tm.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "method, fill_value",
+    [
+        ("sum", 0),
+        ("prod", 1),
+        ("min", np.nan),
+        ("max", np.nan),
+        ("mean", np.nan),
+        ("first", np.nan),
+        ("count", 0),
+        ("size", 0),
+        ("nunique", 0),
+    ],
+)
+@pytest.mark.parametrize("sort", [True, False])
+def test_observed_sparse(method, fill_value, sort):
+    df = DataFrame(
+        {
+            "a": Categorical(["x", "x", "y", "x"], categories=["x", "y", "z"]),
+            "b": Categorical(["u", "v", "u", "u"], categories=["u", "v", "w"]),
+            "i": [1, 2, 3, 4],
+            "f": [1.5, np.nan, 3.0, 0.0],
+        }
+    )
+    gb = df.groupby(["a", "b"], observed="sparse", sort=sort)
+    result = getattr(gb, method)()
+
+    # the observed groups only, with the dtypes of observed=True
+    expected = getattr(df.groupby(["a", "b"], observed=True, sort=sort), method)()
+    tm.assert_equal(result, expected)
+    # while the levels hold all the categories
+    for level, key in zip(result.index.levels, ["a", "b"]):
+        tm.assert_index_equal(
+            level,
+            CategoricalIndex(df[key].cat.categories, dtype=df[key].dtype, name=key),
+        )
+
+    # reindex_unobserved restores the unobserved groups of observed=False
+    result = gb.reindex_unobserved(result, fill_value=fill_value)
+    expected = getattr(df.groupby(["a", "b"], observed=False, sort=sort), method)()
+    tm.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+def test_observed_sparse_series(dropna):
+    ser = Series([1.0, 2.0, 3.0, 4.0])
+    keys = [
+        Categorical(["x", "x", "y", np.nan], categories=["x", "y", "z"]),
+        Categorical(["u", "v", "u", "u"], categories=["u", "v", "w"]),
+    ]
+    gb = ser.groupby(keys, observed="sparse", dropna=dropna)
+    result = gb.sum()
+    expected = ser.groupby(keys, observed=True, dropna=dropna).sum()
+    tm.assert_series_equal(result, expected, check_index_type=False)
+    categories = ["x", "y", "z"] if dropna else ["x", "y", "z", np.nan]
+    assert list(result.index.levels[0]) == categories
+
+    result = gb.reindex_unobserved(result, fill_value=0)
+    expected = ser.groupby(keys, observed=False, dropna=dropna).sum()
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("sort", [True, False])
+def test_reindex_unobserved_mixed_keys(sort):
+    df = DataFrame(
+        {
+            "a": Categorical(["y", "x", "y"], categories=["x", "y", "z"]),
+            "b": [2, 1, 1],
+            "c": [1.0, 2.0, 3.0],
+        }
+    )
+    gb = df.groupby(["a", "b"], observed="sparse", sort=sort)
+    result = gb.reindex_unobserved(gb.sum(), fill_value=0)
+    expected = df.groupby(["a", "b"], observed=False, sort=sort).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_reindex_unobserved_single_key():
+    df = DataFrame(
+        {"a": Categorical(["x", "x", "y"], categories=["x", "y", "z"]), "b": [1, 2, 3]}
+    )
+    gb = df.groupby("a", observed=True)
+    result = gb.reindex_unobserved(gb.max())
+    expected = df.groupby("a", observed=False).max()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_reindex_unobserved_as_index_false():
+    df = DataFrame(
+        {"a": Categorical(["x", "x", "y"], categories=["x", "y", "z"]), "b": [1, 2, 3]}
+    )
+    gb = df.groupby("a", as_index=False, observed="sparse")
+    with pytest.raises(ValueError, match="result must be indexed by the groups"):
+        gb.reindex_unobserved(gb.sum())
+
+
+def test_observed_sparse_raises():
+    df = DataFrame({"a": Categorical(["x"]), "b": [1]})
+    with pytest.raises(ValueError, match="observed must be a boolean or 'sparse'"):
+        df.groupby("a", observed="dense")
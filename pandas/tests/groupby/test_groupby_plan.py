@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    DataFrame,
+    Grouper,
+    Series,
+    date_range,
+)
+import pandas._testing as tm
+from pandas.api.typing import GroupByPlan
+
+
+@pytest.fixture
+def df():
+    return DataFrame(
+        {
+            "key1": ["a", "b", None, "b", "a", "c"],
+            "key2": [1, 2, 1, 2, 1, 1],
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "y": [6, 5, 4, 3, 2, 1],
+        }
+    )
+
+
+@pytest.mark.parametrize("keys", ["key1", ["key1", "key2"]])
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("as_index", [True, False])
+def test_plan_matches_groupby(df, keys, sort, dropna, as_index):
+    gb = df.groupby(keys, sort=sort, dropna=dropna, as_index=as_index)
+    plan = gb.plan()
+    assert isinstance(plan, GroupByPlan)
+
+    gb_plan = df.groupby(plan, as_index=as_index)
+    assert gb_plan._grouper is plan._grouper
+    tm.assert_frame_equal(gb_plan.sum(), gb.sum())
+    tm.assert_frame_equal(gb_plan.agg(["min", "max"]), gb.agg(["min", "max"]))
+    tm.assert_frame_equal(gb_plan.transform("mean"), gb.transform("mean"))
+    tm.assert_equal(gb_plan["x"].cumsum(), gb["x"].cumsum())
+    tm.assert_equal(gb_plan.size(), gb.size())
+
+
+def test_plan_other_frame(df):
+    plan = df.groupby("key1").plan()
+    other = DataFrame({"z": np.arange(6.0)}, index=df.index.copy())
+
+    result = other.groupby(plan).sum()
+    expected = other.groupby(df["key1"]).sum()
+    tm.assert_frame_equal(result, expected)
+
+    result = other["z"].groupby(plan).mean()
+    expected = other["z"].groupby(df["key1"]).mean()
+    tm.assert_series_equal(result, expected)
+
+
+def test_plan_other_frame_index_mismatch(df):
+    plan = df.groupby("key1").plan()
+    other = DataFrame({"z": np.arange(6.0)}, index=np.arange(1, 7))
+    msg = "The index of the object does not match the index of the groupby plan"
+    with pytest.raises(ValueError, match=msg):
+        other.groupby(plan)
+
+
+def test_plan_keeps_options(df):
+    plan = df.groupby("key1", sort=False, dropna=False).plan()
+    result = df.groupby(plan).sum()
+    expected = df.groupby("key1", sort=False, dropna=False).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"sort": True}, {"dropna": True}, {"sort": False, "dropna": True}]
+)
+def test_plan_options_mismatch_raises(df, kwargs):
+    plan = df.groupby("key1", sort=False, dropna=False).plan()
+    name = next(name for name, value in kwargs.items() if value)
+    msg = f"{name}=True does not match {name}=False of the groupby plan"
+    with pytest.raises(ValueError, match=msg):
+        df.groupby(plan, **kwargs)
+    with pytest.raises(ValueError, match=msg):
+        df["x"].groupby(plan, **kwargs)
+
+    # passing the options of the plan is allowed
+    result = df.groupby(plan, sort=False, dropna=False).sum()
+    tm.assert_frame_equal(result, df.groupby(plan).sum())
+
+
+def test_plan_array_key_copied(df):
+    key = np.array([1, 1, 2, 2, 1, 2])
+    plan = df.groupby(key).plan()
+    expected = df.groupby(key.copy()).sum()
+    key[:] = 3
+    tm.assert_frame_equal(df.groupby(plan).sum(), expected)
+
+    # the plan is recomputed from the values of the key when it was created
+    df.index = df.index + 1
+    tm.assert_frame_equal(df.groupby(plan).sum(), expected)
+
+
+def test_plan_invalidated_by_setitem(df):
+    plan = df.groupby("key1").plan()
+    grouper = plan._grouper
+
+    df["z"] = 1
+    assert df.groupby(plan)._grouper is grouper
+
+    df.loc[0, "key1"] = "c"
+    result = df.groupby(plan).sum()
+    assert plan._grouper is not grouper
+    expected = df.groupby("key1").sum()
+    tm.assert_frame_equal(result, expected)
+
+    df["key1"] = ["d", "d", "e", "e", "d", "d"]
+    result = df.groupby(plan).sum()
+    expected = df.groupby("key1").sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_plan_invalidated_by_index(df):
+    plan = df.groupby(level=0).plan()
+    df.index = df.index[::-1]
+    result = df.groupby(plan).sum()
+    expected = df.groupby(level=0).sum()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_plan_series():
+    ser = Series([1, 2, 3, 4], index=list("abab"))
+    plan = ser.groupby(level=0).plan()
+    tm.assert_series_equal(ser.groupby(plan).sum(), ser.groupby(level=0).sum())
+    assert plan.ngroups == 2
+
+
+def test_plan_frequency_raises():
+    df = DataFrame({"x": range(4)}, index=date_range("2020", periods=4, freq="h"))
+    gb = df.groupby(Grouper(freq="2h"))
+    with pytest.raises(NotImplementedError, match="frequency"):
+        gb.plan()
+
+
+def test_plan_categorical_observed():
+    df = DataFrame(
+        {
+            "key": pd.Categorical(["a", "a", "b"], categories=["a", "b", "c"]),
+            "x": [1, 2, 3],
+        }
+    )
+    plan = df.groupby("key", observed=False).plan()
+    result = df.groupby(plan).sum()
+    expected = df.groupby("key", observed=False).sum()
+    tm.assert_frame_equal(result, expected)
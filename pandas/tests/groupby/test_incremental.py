@@ -0,0 +1,114 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pandas import (
+    DataFrame,
+    concat,
+)
+import pandas._testing as tm
+from pandas.api.groupby import IncrementalAggregator
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "key1": rng.integers(0, 10, size=500),
+            "key2": rng.choice(["a", "b", None], size=500),
+            "x": rng.standard_normal(500),
+            "y": rng.integers(0, 100, size=500),
+        }
+    )
+    df.loc[::7, "x"] = np.nan
+    return df
+
+
+def chunks(df, size):
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("keys", ["key1", "key2", ["key1", "key2"]])
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize(
+    "aggs",
+    [
+        {"x": ["sum", "mean", "var", "std", "min", "max", "count"], "y": "sum"},
+        {"x": "mean", "y": "max"},
+    ],
+)
+def test_incremental_aggregator(df, keys, dropna, aggs):
+    agg = IncrementalAggregator(keys, aggs, dropna=dropna)
+    for chunk in chunks(df, 70):
+        agg.update(chunk)
+    result = agg.result()
+    expected = df.groupby(keys, dropna=dropna).agg(aggs)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_incremental_aggregator_merge(df):
+    aggs = {"x": ["mean", "var"], "y": ["min", "count"]}
+    parts = [IncrementalAggregator("key1", aggs) for _ in range(3)]
+    for i, chunk in enumerate(chunks(df, 45)):
+        parts[i % 3].update(chunk)
+
+    # e.g. the aggregators of other processes
+    result = parts[0]
+    for other in parts[1:]:
+        result.merge(pickle.loads(pickle.dumps(other)))
+    tm.assert_frame_equal(result.result(), df.groupby("key1").agg(aggs))
+
+
+def test_incremental_aggregator_sort(df):
+    agg = IncrementalAggregator("key1", {"y": "sum"}, sort=False)
+    for chunk in chunks(df, 100):
+        agg.update(chunk)
+    expected = df.groupby("key1", sort=False).agg({"y": "sum"})
+    tm.assert_frame_equal(agg.result(), expected)
+
+
+def test_incremental_aggregator_new_groups():
+    agg = IncrementalAggregator("key", {"x": ["var", "count"]})
+    df1 = DataFrame({"key": [1, 1, 2], "x": [1.0, 3.0, np.nan]})
+    df2 = DataFrame({"key": [2, 3], "x": [4.0, 5.0]})
+    agg.update(df1)
+    agg.update(df2)
+    expected = concat([df1, df2]).groupby("key").agg({"x": ["var", "count"]})
+    tm.assert_frame_equal(agg.result(), expected)
+
+
+@pytest.mark.parametrize("keys", ["key1", ["key1", "key2"]])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_incremental_aggregator_median(df, keys, dropna):
+    aggs = {"x": ["median", "sum"], "y": "median"}
+    parts = [
+        IncrementalAggregator(keys, aggs, dropna=dropna, relative_accuracy=0.02)
+        for _ in range(2)
+    ]
+    for i, chunk in enumerate(chunks(df, 60)):
+        parts[i % 2].update(chunk)
+    parts[0].merge(pickle.loads(pickle.dumps(parts[1])))
+    result = parts[0].result()
+
+    gb = df.groupby(keys, dropna=dropna)
+    expected = gb.agg({"x": ["median", "sum"], "y": "median"})
+    expected[("x", "median")] = gb["x"].quantile(interpolation="lower")
+    expected["y"] = gb["y"].quantile(interpolation="lower").astype(np.float64)
+    tm.assert_frame_equal(result, expected, check_exact=False, rtol=0.021)
+
+
+def test_incremental_aggregator_raises():
+    msg = "'first' is not supported by IncrementalAggregator"
+    with pytest.raises(ValueError, match=msg):
+        IncrementalAggregator("key", {"x": ["sum", "first"]})
+    with pytest.raises(ValueError, match="relative_accuracy must be between"):
+        IncrementalAggregator("key", {"x": "median"}, relative_accuracy=0)
+
+    agg = IncrementalAggregator("key", {"x": "sum"})
+    with pytest.raises(ValueError, match="No chunks have been aggregated"):
+        agg.result()
+    msg = "can only merge aggregators with the same keys, aggs and relative_accuracy"
+    with pytest.raises(ValueError, match=msg):
+        agg.merge(IncrementalAggregator("key", {"x": "mean"}))
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from pandas import (
+    Categorical,
+    DataFrame,
+    Series,
+)
+import pandas._testing as tm
+
+pytestmark = pytest.mark.single_cpu
+
+# the functions are module level functions, so that they can be pickled
+
+
+def demean(group, ddof=1):
+    return (group - group.mean()) / group.std(ddof=ddof)
+
+
+def summarize(group):
+    return Series({"size": len(group), "total": group["x"].sum(), "name": group.name})
+
+
+def first_row(group):
+    return group.iloc[0]
+
+
+def identity(group):
+    return group
+
+
+def fail_on_b(group):
+    if group.name == "b":
+        raise KeyError("b")
+    return group.sum()
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(2)
+    return DataFrame(
+        {
+            "key": rng.choice(list("abcdefg"), size=200),
+            "x": rng.standard_normal(200),
+            "y": rng.integers(0, 10, size=200),
+        }
+    )
+
+
+@pytest.mark.parametrize("func", [demean, summarize, first_row, identity])
+@pytest.mark.parametrize("group_keys", [True, False])
+@pytest.mark.parametrize("batch_size", [None, 3])
+def test_apply_processes(df, func, group_keys, batch_size):
+    gb = df.groupby("key", group_keys=group_keys)[["x", "y"]]
+    engine_kwargs = {"max_workers": 2, "batch_size": batch_size}
+    result = gb.apply(func, engine="processes", engine_kwargs=engine_kwargs)
+    expected = gb.apply(func)
+    tm.assert_equal(result, expected)
+
+
+def test_apply_processes_series_args(df):
+    gb = df.groupby("key")["x"]
+    engine_kwargs = {"max_workers": 2}
+    result = gb.apply(demean, ddof=0, engine="processes", engine_kwargs=engine_kwargs)
+    expected = gb.apply(demean, ddof=0)
+    tm.assert_series_equal(result, expected)
+
+
+def test_apply_processes_empty_groups(df):
+    df["key"] = Categorical(df["key"], categories=list("abcdefgh"))
+    df.loc[df["key"] == "c", "key"] = np.nan
+    gb = df.groupby("key", observed=False)[["x", "y"]]
+    engine_kwargs = {"max_workers": 2, "batch_size": 2}
+    result = gb.apply(summarize, engine="processes", engine_kwargs=engine_kwargs)
+    expected = gb.apply(summarize)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_transform_processes(df):
+    engine_kwargs = {"max_workers": 2, "batch_size": 2}
+    gb = df.groupby("key")
+    result = gb[["x", "y"]].transform(
+        demean, engine="processes", engine_kwargs=engine_kwargs
+    )
+    tm.assert_frame_equal(result, gb[["x", "y"]].transform(demean))
+
+    result = gb["x"].transform(
+        demean, ddof=0, engine="processes", engine_kwargs=engine_kwargs
+    )
+    tm.assert_series_equal(result, gb["x"].transform(demean, ddof=0))
+
+
+@pytest.mark.parametrize("engine", ["python", "c"])
+def test_apply_engine_passed_to_func(df, engine):
+    # only engine="processes" is taken by apply
+    def func(group, engine, engine_kwargs=None):
+        return Series({"engine": engine, "engine_kwargs": engine_kwargs})
+
+    gb = df.groupby("key")
+    result = gb[["x"]].apply(func, engine=engine, engine_kwargs={"a": 1})
+    assert (result["engine"] == engine).all()
+    assert all(kwargs == {"a": 1} for kwargs in result["engine_kwargs"])
+
+    result = gb["x"].apply(func, engine=engine)
+    assert (result.xs("engine", level=1) == engine).all()
+
+
+def test_processes_raises(df):
+    gb = df.groupby("key")[["x", "y"]]
+    with pytest.raises(KeyError, match="b"):
+        gb.apply(fail_on_b, engine="processes", engine_kwargs={"max_workers": 2})
+    with pytest.raises(ValueError, match="only accept 'max_workers' and 'batch_size'"):
+        gb.apply(identity, engine="processes", engine_kwargs={"nopython": True})
+    with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+        gb.apply(identity, engine="processes", engine_kwargs={"batch_size": 0})
+    with pytest.raises(ValueError, match="requires func to be a callable"):
+        gb.transform("cumsum", engine="processes")
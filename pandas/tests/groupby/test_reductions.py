@@ -915,6 +915,51 @@ def test_nunique_transform_with_datetime():
     tm.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.arange(3000, dtype=np.int64) % 1100,
+        np.arange(3000) % 1100 - 0.5,
+        pd.array(np.arange(3000) % 1100, dtype="Int64"),
+        np.array([f"s{i % 1100}" for i in range(3000)], dtype=object),
+        date_range("2000-01-01", periods=1100, freq="h").repeat(3).values[:3000],
+    ],
+)
+def test_nunique_approx(values, dropna):
+    ser = Series(values)
+    ser[::13] = None
+    keys = np.arange(3000) % 3
+    result = ser.groupby(keys).nunique(dropna=dropna, method="approx")
+    expected = ser.groupby(keys).nunique(dropna=dropna)
+    # well within 5 standard errors
+    tm.assert_series_equal(result, expected, check_exact=False, rtol=0.08)
+
+
+def test_nunique_approx_small_counts():
+    df = DataFrame(
+        {
+            "key": ["a", "a", "a", "b", "b", "c", np.nan],
+            "x": [0.0, -0.0, np.nan, 1.0, 2.0, np.nan, 3.0],
+        }
+    )
+    result = df.groupby("key").nunique(method="approx")
+    expected = DataFrame({"x": [1, 2, 0]}, index=pd.Index(["a", "b", "c"], name="key"))
+    tm.assert_frame_equal(result, expected)
+
+    result = df.groupby("key", dropna=False)["x"].nunique(dropna=False, method="approx")
+    expected = df.groupby("key", dropna=False)["x"].nunique(dropna=False)
+    tm.assert_series_equal(result, expected)
+
+
+def test_nunique_approx_raises():
+    gb = Series([1, 2]).groupby([1, 1])
+    with pytest.raises(ValueError, match="method must be 'exact' or 'approx'"):
+        gb.nunique(method="hll")
+    with pytest.raises(ValueError, match="precision must be between 4 and 18"):
+        gb.nunique(method="approx", precision=20)
+
+
 def test_empty_categorical(observed):
     # GH#21334
     cat = Series([1]).astype("category")
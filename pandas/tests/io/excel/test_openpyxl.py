@@ -385,6 +385,27 @@ def test_read_with_empty_trailing_rows(datapath, ext, read_only):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("read_only", [True, False])
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_read_chunksize_with_wider_rows(tmp_excel, read_only, chunksize):
+    # the header is narrower than a later row
+    wb = openpyxl.Workbook()
+    for row in [["a", "b"], [1, 2], [3, 4, 5], [6, 7]]:
+        wb.active.append(row)
+    wb.save(tmp_excel)
+
+    expected = pd.read_excel(
+        tmp_excel, engine="openpyxl", engine_kwargs={"read_only": read_only}
+    )
+    chunks = pd.read_excel(
+        tmp_excel,
+        engine="openpyxl",
+        engine_kwargs={"read_only": read_only},
+        chunksize=chunksize,
+    )
+    tm.assert_frame_equal(pd.concat(chunks), expected)
+
+
 # When read_only is None, use read_excel instead of a workbook
 @pytest.mark.parametrize("read_only", [True, False, None])
 def test_read_empty_with_blank_row(datapath, ext, read_only):
@@ -429,3 +450,37 @@ def test_read_multiindex_header_no_index_names(datapath, ext):
         index=pd.MultiIndex.from_tuples([("A", "AA", "AAA"), ("A", "BB", "BBB")]),
     )
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("merge_cells", [True, False])
+@pytest.mark.parametrize("styled", [True, False])
+def test_write_only(tmp_excel, merge_cells, styled):
+    df = DataFrame(
+        {
+            "a": [1.5, np.nan, 3.0],
+            "b": pd.date_range("2020-01-01", periods=3, unit="us"),
+        },
+        index=pd.MultiIndex.from_tuples([(1, "x"), (1, "y"), (2, "x")]),
+    )
+    with ExcelWriter(
+        tmp_excel, engine="openpyxl", engine_kwargs={"write_only": True}
+    ) as writer:
+        (df.style if styled else df).to_excel(
+            writer, merge_cells=merge_cells, startrow=1, startcol=1, freeze_panes=(2, 3)
+        )
+
+    with contextlib.closing(openpyxl.load_workbook(tmp_excel)) as wb:
+        assert wb["Sheet1"].freeze_panes == "D3"
+    result = pd.read_excel(tmp_excel, index_col=[0, 1, 2], skiprows=1)
+    result.index = result.index.droplevel(0)
+    tm.assert_frame_equal(result, df, check_index_type=False)
+
+
+def test_write_only_sheet_exists(tmp_excel):
+    with ExcelWriter(
+        tmp_excel, engine="openpyxl", engine_kwargs={"write_only": True}
+    ) as writer:
+        DataFrame({"a": [1]}).to_excel(writer)
+        msg = "Sheet 'Sheet1' already exists and cannot be written to again"
+        with pytest.raises(ValueError, match=msg):
+            DataFrame({"a": [1]}).to_excel(writer, startrow=3)
@@ -794,6 +794,14 @@ class TestReaders:
         tm.assert_contains_all(expected_keys, dfs.keys())
         assert len(expected_keys) == len(dfs.keys())
 
+    def test_reading_all_sheets_max_workers(self, read_ext):
+        basename = "test_multisheet"
+        expected = pd.read_excel(basename + read_ext, sheet_name=None)
+        result = pd.read_excel(basename + read_ext, sheet_name=None, max_workers=2)
+        assert list(result) == list(expected)
+        for sheet_name, df in expected.items():
+            tm.assert_frame_equal(result[sheet_name], df)
+
     def test_reading_all_sheets_with_blank(self, read_ext):
         # Test reading all sheet names by setting sheet_name to None,
         # In the case where some sheets are blank.
@@ -1334,6 +1342,45 @@ class TestReaders:
         expected = expected[:num_rows_to_pull]
         tm.assert_frame_equal(actual, expected)
 
+    @pytest.mark.parametrize("chunksize", [1, 3, 100])
+    @pytest.mark.parametrize("nrows", [None, 5])
+    def test_read_excel_chunksize(self, request, engine, read_ext, chunksize, nrows):
+        xfail_datetimes_with_pyxlsb(engine, request)
+        expected = pd.read_excel("test1" + read_ext, index_col=0, nrows=nrows)
+        chunks = list(
+            pd.read_excel(
+                "test1" + read_ext, index_col=0, nrows=nrows, chunksize=chunksize
+            )
+        )
+        assert all(len(chunk) <= chunksize for chunk in chunks)
+        tm.assert_frame_equal(pd.concat(chunks), expected)
+
+    def test_read_excel_chunksize_multiindex(self, request, engine, read_ext):
+        xfail_datetimes_with_pyxlsb(engine, request)
+        expected = pd.read_excel(
+            "testmultiindex" + read_ext, sheet_name="mi_index", index_col=[0, 1]
+        )
+        chunks = pd.read_excel(
+            "testmultiindex" + read_ext,
+            sheet_name="mi_index",
+            index_col=[0, 1],
+            chunksize=2,
+        )
+        tm.assert_frame_equal(pd.concat(chunks), expected)
+
+    def test_read_excel_chunksize_blank(self, read_ext):
+        chunks = list(pd.read_excel("blank" + read_ext, chunksize=2))
+        assert len(chunks) == 1
+        tm.assert_frame_equal(chunks[0], DataFrame())
+
+    def test_read_excel_chunksize_raises(self, read_ext):
+        msg = "chunksize is only supported when reading one sheet"
+        with pytest.raises(ValueError, match=msg):
+            pd.read_excel("test1" + read_ext, sheet_name=None, chunksize=2)
+        msg = "chunksize is not supported with a MultiIndex header"
+        with pytest.raises(NotImplementedError, match=msg):
+            pd.read_excel("test1" + read_ext, header=[0, 1], chunksize=2)
+
     def test_read_excel_nrows_greater_than_nrows_in_file(self, read_ext):
         # GH 16645
         expected = pd.read_excel("test1" + read_ext)
@@ -3,7 +3,11 @@ import uuid
 
 import pytest
 
+import numpy as np
+
+import pandas as pd
 from pandas import DataFrame
+import pandas._testing as tm
 
 from pandas.io.excel import ExcelWriter
 
@@ -84,3 +88,46 @@ def test_book_and_sheets_consistent(tmp_excel):
         assert writer.sheets == {}
         sheet = writer.book.add_worksheet("test_name")
         assert writer.sheets == {"test_name": sheet}
+
+
+@pytest.mark.parametrize("merge_cells", [True, False])
+def test_constant_memory(tmp_excel, merge_cells):
+    pytest.importorskip("openpyxl")
+    df = DataFrame(
+        {
+            "a": [1.5, np.nan, 3.0],
+            "b": pd.date_range("2020-01-01", periods=3, unit="us"),
+        },
+        index=pd.MultiIndex.from_tuples([(1, "x"), (1, "y"), (2, "x")]),
+    )
+    engine_kwargs = {"options": {"constant_memory": True}}
+    with ExcelWriter(
+        tmp_excel, engine="xlsxwriter", engine_kwargs=engine_kwargs
+    ) as writer:
+        df.to_excel(writer, merge_cells=merge_cells, startrow=1, startcol=1)
+
+    result = pd.read_excel(tmp_excel, index_col=[0, 1, 2], skiprows=1)
+    result.index = result.index.droplevel(0)
+    tm.assert_frame_equal(result, df, check_index_type=False)
+
+
+def test_constant_memory_row_blocks(tmp_excel, monkeypatch):
+    # the rows are formatted in blocks of 2 rows
+    pytest.importorskip("openpyxl")
+    monkeypatch.setattr("pandas.io.formats.excel._DEFAULT_CHUNKSIZE_CELLS", 4)
+    df = DataFrame(
+        {"a": [1.25, np.nan, np.inf, -np.inf, 5.0], "b": [1, 2, 3, 4, 5]},
+        index=pd.period_range("2020-01-01", periods=5, freq="D"),
+    )
+    engine_kwargs = {"options": {"constant_memory": True}}
+    with ExcelWriter(
+        tmp_excel, engine="xlsxwriter", engine_kwargs=engine_kwargs
+    ) as writer:
+        df.to_excel(writer, float_format="%.1f", na_rep="NA", inf_rep="INF")
+
+    result = pd.read_excel(tmp_excel, index_col=0, keep_default_na=False)
+    expected = DataFrame(
+        {"a": [1.2, "NA", "INF", "-INF", 5.0], "b": [1, 2, 3, 4, 5]},
+        index=pd.date_range("2020-01-01", periods=5, unit="us"),
+    )
+    tm.assert_frame_equal(result, expected, check_index_type=False, check_freq=False)
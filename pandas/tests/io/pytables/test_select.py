@@ -929,6 +929,128 @@ def test_select_as_multiple(setup_path):
             )
 
 
+def test_select_iterator_prefetch(setup_path):
+    df = DataFrame(
+        np.random.default_rng(2).standard_normal((10, 4)),
+        columns=Index(list("ABCD"), dtype=object),
+        index=date_range("2000-01-01", periods=10, freq="B"),
+    )
+
+    with ensure_clean_store(setup_path) as store:
+        store.append("df", df, data_columns=["A"])
+
+        results = list(store.select("df", chunksize=3, prefetch=True))
+        assert len(results) == 4
+        tm.assert_frame_equal(concat(results), store.select("df"))
+
+        expected = store.select("df", where="A>0")
+        results = list(store.select("df", where="A>0", chunksize=2, prefetch=True))
+        tm.assert_frame_equal(concat(results), expected)
+
+        # stopping early leaves the store usable
+        it = store.select("df", chunksize=2, prefetch=True)
+        next(iter(it))
+        tm.assert_frame_equal(store.select("df"), df, check_freq=False)
+
+
+def test_select_iterator_prefetch_write(setup_path):
+    # writing to the store while a chunk is read waits for the read
+    df = DataFrame(
+        np.random.default_rng(2).standard_normal((10, 4)),
+        columns=Index(list("ABCD"), dtype=object),
+        index=date_range("2000-01-01", periods=10, freq="B"),
+    )
+
+    with ensure_clean_store(setup_path) as store:
+        store.append("df", df, data_columns=["A"])
+
+        results = []
+        for chunk in store.select("df", chunksize=2, prefetch=True):
+            results.append(chunk)
+            store.append("other", chunk)
+            store.put("fixed", chunk)
+        tm.assert_frame_equal(concat(results), store.select("df"))
+        tm.assert_frame_equal(store.select("other"), store.select("df"))
+        tm.assert_frame_equal(store.select("fixed"), results[-1])
+
+        for chunk in store.select("other", chunksize=3, prefetch=True):
+            store.remove("df", where=f"index in {list(chunk.index)}")
+        assert len(store.select("df")) == 0
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_select_as_multiple_parallel(setup_path, prefetch):
+    df1 = DataFrame(
+        np.random.default_rng(2).standard_normal((10, 4)),
+        columns=Index(list("ABCD"), dtype=object),
+        index=date_range("2000-01-01", periods=10, freq="B"),
+    )
+    df2 = df1.copy().rename(columns="{}_2".format)
+    df2["foo"] = "bar"
+
+    with ensure_clean_store(setup_path) as store:
+        store.append("df1", df1, data_columns=["A", "B"])
+        store.append("df2", df2)
+
+        expected = store.select_as_multiple(
+            ["df1", "df2"], where=["A>0", "B>0"], selector="df1"
+        )
+        result = store.select_as_multiple(
+            ["df1", "df2"], where=["A>0", "B>0"], selector="df1", parallel=True
+        )
+        tm.assert_frame_equal(result, expected)
+
+        results = store.select_as_multiple(
+            ["df1", "df2"],
+            where=["A>0", "B>0"],
+            selector="df1",
+            chunksize=2,
+            parallel=True,
+            prefetch=prefetch,
+        )
+        tm.assert_frame_equal(concat(list(results)), expected)
+
+
+def test_select_selection_cache(setup_path):
+    df = DataFrame(
+        {"A": np.arange(10, dtype="float64"), "B": np.arange(10, dtype="int64")},
+        index=date_range("2000-01-01", periods=10, freq="B"),
+    )
+
+    with pd.option_context("io.hdf.selection_cache_size", 2):
+        with ensure_clean_store(setup_path) as store:
+            store.append("df", df, data_columns=["A"])
+
+            expected = df[df.A > 4]
+            tm.assert_frame_equal(store.select("df", where="A>4"), expected)
+            assert len(store._selection_cache) == 1
+            tm.assert_frame_equal(store.select("df", where="A>4"), expected)
+            assert len(store._selection_cache) == 1
+
+            results = list(store.select("df", where="A>4", chunksize=2))
+            tm.assert_frame_equal(concat(results), expected)
+            coords = store.select_as_coordinates("df", where="A>4")
+            tm.assert_index_equal(coords, Index(np.arange(5, 10)))
+
+            # local variables are part of the key
+            for threshold in [2, 7]:
+                result = store.select("df", where="A>threshold")
+                tm.assert_frame_equal(result, df[df.A > threshold])
+            assert len(store._selection_cache) == 2
+
+            # unhashable references are not cached
+            values = [1.0, 2.0]
+            result = store.select("df", where="A=values")
+            tm.assert_frame_equal(result, df.iloc[[1, 2]])
+            assert len(store._selection_cache) == 2
+
+            # writes invalidate the cache
+            store.append("df", df)
+            assert len(store._selection_cache) == 0
+            result = store.select("df", where="A>4")
+            tm.assert_frame_equal(result, concat([expected, expected]))
+
+
 def test_nan_selection_bug_4858(setup_path):
     with ensure_clean_store(setup_path) as store:
         df = DataFrame({"cols": range(6), "values": range(6)}, dtype="float64")
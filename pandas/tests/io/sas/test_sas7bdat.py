@@ -102,6 +102,22 @@ class TestSAS7BDAT:
                 y += x.shape[0]
         assert y == rdr.row_count
 
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunksize", (None, 3, 11))
+    def test_nthreads(self, dirpath, data_test_ix, chunksize):
+        expected, test_ix = data_test_ix
+        for k in test_ix:
+            fname = os.path.join(dirpath, f"test{k}.sas7bdat")
+            with pd.read_sas(
+                fname,
+                chunksize=chunksize,
+                iterator=True,
+                encoding="utf-8",
+                nthreads=2,
+            ) as rdr:
+                df = pd.concat(rdr) if chunksize else rdr.read()
+            tm.assert_frame_equal(df, expected)
+
     def test_iterator_read_too_much(self, dirpath):
         # github #14734
         fname = os.path.join(dirpath, "test1.sas7bdat")
@@ -393,15 +409,23 @@ def test_meta2_page(datapath):
         ("test3.sas7bdat", 118170, 184, "Out of bounds"),
     ],
 )
+@pytest.mark.parametrize("nthreads", [None, 2])
 def test_rle_rdc_exceptions(
-    datapath, test_file, override_offset, override_value, expected_msg
+    datapath, test_file, override_offset, override_value, expected_msg, nthreads
 ):
     """Errors in RLE/RDC decompression should propagate."""
     with open(datapath("io", "sas", "data", test_file), "rb") as fd:
         data = bytearray(fd.read())
     data[override_offset] = override_value
     with pytest.raises(Exception, match=expected_msg):
-        pd.read_sas(io.BytesIO(data), format="sas7bdat")
+        pd.read_sas(io.BytesIO(data), format="sas7bdat", nthreads=nthreads)
+
+
+@pytest.mark.parametrize("nthreads", [0, 1.5])
+def test_nthreads_invalid(datapath, nthreads):
+    fname = datapath("io", "sas", "data", "test1.sas7bdat")
+    with pytest.raises(ValueError, match="nthreads must be a positive integer"):
+        pd.read_sas(fname, nthreads=nthreads)
 
 
 def test_0x40_control_byte(datapath):
@@ -379,3 +379,69 @@ def test_tar_no_error_on_close():
     with io.BytesIO() as buffer:
         with icom._BytesTarFile(fileobj=buffer, mode="w"):
             pass
+
+
+@pytest.mark.parametrize("threads", [2, -1])
+@pytest.mark.parametrize("method", ["to_pickle", "to_json", "to_csv"])
+def test_compression_threads_roundtrip(compression_only, method, threads):
+    if compression_only in ("zip", "tar"):
+        pytest.skip("threads is not supported when writing archives")
+    if compression_only == "zstd":
+        pytest.importorskip("zstandard")
+    # more than one block of _COMPRESSION_BLOCK_SIZE
+    df = pd.DataFrame(
+        np.random.default_rng(2).standard_normal((60_000, 4)), columns=list("abcd")
+    )
+    compression = {"method": compression_only, "threads": threads}
+
+    with tm.ensure_clean() as path:
+        getattr(df, method)(path, compression=compression)
+        result = {
+            "to_pickle": pd.read_pickle,
+            "to_json": pd.read_json,
+            "to_csv": lambda *args, **kwargs: pd.read_csv(
+                *args, index_col=0, **kwargs
+            ),
+        }[method](path, compression=compression)
+        expected = {
+            "to_pickle": pd.read_pickle,
+            "to_json": pd.read_json,
+            "to_csv": lambda *args, **kwargs: pd.read_csv(
+                *args, index_col=0, **kwargs
+            ),
+        }[method](path, compression=compression_only)
+
+    tm.assert_frame_equal(result, expected)
+    if method == "to_pickle":
+        tm.assert_frame_equal(result, df)
+
+
+def test_gzip_threads_file_object():
+    df = pd.DataFrame({"a": range(300_000)})
+    buffer = io.BytesIO()
+    df.to_csv(buffer, compression={"method": "gzip", "threads": 2, "mtime": 1})
+    # concatenated gzip members are a valid gzip file
+    data = gzip.decompress(buffer.getvalue())
+    assert data == df.to_csv().encode()
+
+    buffer = io.BytesIO()
+    pd.DataFrame().to_csv(buffer, compression={"method": "gzip", "threads": 2})
+    assert gzip.decompress(buffer.getvalue()) == b'""\n'
+
+
+@pytest.mark.parametrize("threads", [0, -2, 1.5])
+def test_compression_threads_invalid(threads):
+    with tm.ensure_clean() as path:
+        with pytest.raises(ValueError, match="threads must be a positive integer"):
+            pd.DataFrame({"a": [1]}).to_csv(
+                path, compression={"method": "gzip", "threads": threads}
+            )
+
+
+@pytest.mark.parametrize("archive", ["zip", "tar"])
+def test_compression_threads_archive_raises(archive):
+    with tm.ensure_clean() as path:
+        with pytest.raises(ValueError, match=f"when writing {archive} files"):
+            pd.DataFrame({"a": [1]}).to_csv(
+                path, compression={"method": archive, "threads": 2}
+            )
@@ -0,0 +1,132 @@
+"""
+Tests for pandas.io.instrumentation
+"""
+
+from io import StringIO
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+import pandas as pd
+import pandas._testing as tm
+
+from pandas.io.instrumentation import (
+    StageStats,
+    io_stage,
+    is_recording,
+    record_io,
+)
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {"a": np.arange(1000), "b": np.arange(1000) / 3, "c": ["x", "y"] * 500}
+    )
+
+
+def test_record_io_disabled():
+    assert not is_recording()
+    with io_stage("parse") as stage:
+        stage.record(rows=3)
+    with record_io() as stats:
+        assert is_recording()
+    assert not is_recording()
+    assert stats.stages == {}
+
+
+def test_nested_stages_exclusive():
+    with record_io() as stats:
+        with io_stage("parse") as outer:
+            outer.record(rows=2)
+            with io_stage("read") as inner:
+                inner.record(nbytes=10)
+            with io_stage("read") as inner:
+                inner.record(nbytes=5)
+
+    assert stats["parse"] == StageStats(
+        calls=1,
+        wall_time=stats["parse"].wall_time,
+        cpu_time=stats["parse"].cpu_time,
+        rows=2,
+    )
+    assert stats["read"].calls == 2
+    assert stats["read"].nbytes == 15
+    assert stats.wall_time == pytest.approx(
+        stats["parse"].wall_time + stats["read"].wall_time
+    )
+
+
+def test_record_io_callback():
+    calls = []
+    with record_io(callback=lambda name, stats: calls.append((name, stats.rows))):
+        with io_stage("parse") as stage:
+            stage.record(rows=1)
+        with io_stage("parse") as stage:
+            stage.record(rows=2)
+    assert calls == [("parse", 1), ("parse", 2)]
+
+
+def test_record_io_per_thread():
+    with record_io() as stats:
+        thread = threading.Thread(target=lambda: io_stage("parse").__enter__())
+        thread.start()
+        thread.join()
+    assert stats.stages == {}
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_csv_roundtrip(df, compression, temp_file):
+    with record_io() as stats:
+        df.to_csv(temp_file, index=False, compression=compression)
+    assert stats["serialize"].rows == len(df)
+    nbytes = temp_file.stat().st_size
+    assert stats["write"].nbytes == nbytes
+    if compression:
+        assert stats["compress"].nbytes > nbytes
+
+    with record_io() as stats:
+        result = pd.read_csv(temp_file, compression=compression)
+    tm.assert_frame_equal(result, df)
+    assert stats["read"].nbytes == nbytes
+    assert stats["convert"].rows == len(df)
+    assert stats["consolidate"].rows == len(df)
+    assert {"tokenize", "parse"} <= set(stats.stages)
+    assert ("decompress" in stats.stages) == bool(compression)
+
+    frame = stats.to_frame()
+    assert list(frame.columns) == ["calls", "wall_time", "cpu_time", "nbytes", "rows"]
+    assert frame.loc["read", "nbytes"] == nbytes
+
+
+def test_json_roundtrip(df, temp_file):
+    with record_io() as stats:
+        df.to_json(temp_file)
+        pd.read_json(temp_file)
+    assert stats["serialize"].rows == len(df)
+    assert stats["write"].nbytes == stats["read"].nbytes == temp_file.stat().st_size
+    assert stats["convert"].rows == len(df)
+    assert "parse" in stats.stages
+
+
+def test_sql_roundtrip(df):
+    with sqlite3.connect(":memory:") as con:
+        with record_io() as stats:
+            df.to_sql("test", con, index=False)
+            result = pd.read_sql("SELECT * FROM test", con)
+            chunks = list(pd.read_sql("SELECT * FROM test", con, chunksize=300))
+    tm.assert_frame_equal(result, df)
+    assert len(chunks) == 4
+    assert stats["write"].rows == len(df)
+    assert stats["fetch"].rows == stats["convert"].rows == 2 * len(df)
+    assert stats["query"].calls >= 2
+
+
+def test_read_csv_buffer_untouched():
+    # only files opened by pandas are instrumented
+    with record_io() as stats:
+        pd.read_csv(StringIO("a,b\n1,2\n3,4"))
+    assert "read" not in stats.stages
+    assert stats["consolidate"].rows == 2
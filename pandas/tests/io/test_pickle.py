@@ -19,6 +19,7 @@ import functools
 from functools import partial
 import gzip
 import io
+import mmap
 import os
 from pathlib import Path
 import pickle
@@ -383,6 +384,59 @@ def test_pickle_buffer_roundtrip():
         tm.assert_frame_equal(df, result)
 
 
+@pytest.mark.parametrize("memory_map", [True, False])
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_pickle_out_of_band_roundtrip(tmp_path, memory_map, compression):
+    df = DataFrame(
+        {
+            "a": 1.1 * np.arange(30),
+            "b": np.arange(30),
+            "c": pd.date_range("2000-01-01", periods=30, tz="UTC"),
+            "d": pd.Categorical(["x", "y", "z"] * 10),
+            "e": Index([f"i-{i}" for i in range(30)], dtype=object),
+        }
+    )
+    path = tmp_path / "frame.pkl"
+    df.to_pickle(path, compression=compression, out_of_band=True)
+    result = pd.read_pickle(path, compression=compression, memory_map=memory_map)
+    tm.assert_frame_equal(result, df)
+
+    # arrays are writable and writing to them leaves the file unchanged
+    result.iloc[0, 0] = -1.0
+    result.loc[1, "b"] = -1
+    tm.assert_frame_equal(pd.read_pickle(path, compression=compression), df)
+
+
+def test_pickle_out_of_band_memory_map_zero_copy(tmp_path):
+    df = DataFrame({"a": np.arange(100, dtype=np.float64)})
+    path = tmp_path / "frame.pkl"
+    df.to_pickle(path, out_of_band=True)
+    result = pd.read_pickle(path, memory_map=True)
+    tm.assert_frame_equal(result, df)
+
+    base = result._mgr.blocks[0].values
+    while getattr(base, "base", None) is not None:
+        base = base.base
+    assert isinstance(base.obj, mmap.mmap)
+
+
+def test_pickle_out_of_band_buffer():
+    ser = Series(np.arange(10), name="x")
+    buf = io.BytesIO()
+    ser.to_pickle(buf, compression=None, out_of_band=True)
+    buf.seek(0)
+    result = pd.read_pickle(buf, compression=None, memory_map=True)
+    tm.assert_series_equal(result, ser)
+
+
+def test_pickle_out_of_band_protocol(tmp_path):
+    msg = "out_of_band requires protocol 5 or higher"
+    with pytest.raises(ValueError, match=msg):
+        DataFrame({"a": [1]}).to_pickle(
+            tmp_path / "frame.pkl", protocol=4, out_of_band=True
+        )
+
+
 # ---------------------
 # tests for URL I/O
 # ---------------------
@@ -31,6 +31,7 @@ from pandas.io.stata import (
     StataMissingValue,
     StataReader,
     StataWriter,
+    StataWriter117,
     StataWriterUTF8,
     ValueLabelTypeMismatch,
     read_stata,
@@ -1369,6 +1370,45 @@ class TestStata:
             from_chunks = pd.concat(itr)
         tm.assert_frame_equal(parsed, from_chunks)
 
+    @pytest.mark.parametrize(
+        "file",
+        [
+            "stata3_117.dta",
+            "stata8_117.dta",
+            "stata12_117.dta",
+            "stata12_be_117.dta",
+            "stata14_118.dta",
+            "stata1_119.dta.gz",
+        ],
+    )
+    @pytest.mark.parametrize("convert_missing", [False, True])
+    def test_memory_map(self, file, convert_missing, datapath):
+        fname = datapath("io", "data", "stata", file)
+        kwargs = {"convert_missing": convert_missing, "convert_categoricals": False}
+
+        expected = read_stata(fname, **kwargs)
+        result = read_stata(fname, memory_map=True, **kwargs)
+        tm.assert_frame_equal(result, expected)
+
+        with read_stata(fname, chunksize=3, memory_map=True, **kwargs) as itr:
+            from_chunks = pd.concat(itr)
+        tm.assert_frame_equal(from_chunks, expected)
+
+    @pytest.mark.filterwarnings("ignore::pandas.errors.CategoricalConversionWarning")
+    @pytest.mark.parametrize(
+        "file",
+        ["stata4_117.dta", "stata10_117.dta", "stata11_117.dta", "stata14_118.dta"],
+    )
+    def test_memory_map_categoricals(self, file, datapath):
+        # the categories of the chunks depend on the values in each chunk, so
+        #  compare to the chunks read without memory map
+        fname = datapath("io", "data", "stata", file)
+        with read_stata(fname, chunksize=3) as itr:
+            expected = pd.concat(itr)
+        with read_stata(fname, chunksize=3, memory_map=True) as itr:
+            result = pd.concat(itr)
+        tm.assert_frame_equal(result, expected)
+
     @pytest.mark.xfail(using_string_dtype(), reason="TODO(infer_string)", strict=False)
     @pytest.mark.filterwarnings("ignore::UserWarning")
     @pytest.mark.parametrize(
@@ -2593,3 +2633,58 @@ def test_empty_frame(temp_file):
     df3 = read_stata(path, columns=["a"])
     assert "b" not in df3
     tm.assert_series_equal(df3.dtypes, dtypes.loc[["a"]])
+
+
+@pytest.mark.parametrize("version", [117, 118, 119])
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_write_chunks(version, compression, temp_file):
+    df = DataFrame(
+        {
+            "ints": np.arange(10, dtype=np.int16),
+            "floats": np.linspace(0, 1, 10),
+            "strs": [f"s{i}" for i in range(10)],
+            "strls": ["a long string", "", "b", None, "a long string"] * 2,
+            "cat": pd.Categorical(["x", "y", None, "x", "y"] * 2),
+            "dates": pd.date_range("2000-01-01", periods=10),
+        }
+    )
+    df.loc[3, "floats"] = np.nan
+    chunks = [df.iloc[i : i + 3] for i in range(0, 10, 3)]
+    kwargs = {"convert_strl": ["strls"], "compression": compression}
+    if version == 117:
+        writer = StataWriter117(temp_file, chunks[0], **kwargs)
+    else:
+        writer = StataWriterUTF8(temp_file, chunks[0], version=version, **kwargs)
+    writer.write_chunks(iter(chunks[1:]))
+
+    result = read_stata(temp_file, compression=compression, index_col="index")
+    bio = io.BytesIO()
+    df.to_stata(bio, version=version, convert_strl=["strls"])
+    bio.seek(0)
+    expected = read_stata(bio, index_col="index")
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "chunk, msg",
+    [
+        (DataFrame({"a": [1], "c": ["x"]}), "The columns of each chunk"),
+        (DataFrame({"a": [1], "b": ["long"]}), "Strings in b are longer"),
+        (DataFrame({"a": [1.5], "b": ["x"]}), "Column a with type float64"),
+        (DataFrame({"a": [1000], "b": ["x"]}), "Column a with type int32"),
+    ],
+)
+def test_write_chunks_errors(chunk, msg, temp_file):
+    schema = DataFrame({"a": np.array([1], dtype=np.int8), "b": ["xy"]})
+    writer = StataWriter117(temp_file, schema, write_index=False)
+    with pytest.raises(ValueError, match=msg):
+        writer.write_chunks([chunk])
+    assert not os.path.isfile(temp_file)
+
+
+def test_write_chunks_categories(temp_file):
+    schema = DataFrame({"a": pd.Categorical(["x", "y"])})
+    chunk = DataFrame({"a": pd.Categorical(["x", "z"])})
+    writer = StataWriter117(temp_file, schema, write_index=False)
+    with pytest.raises(ValueError, match="The categories of a must match"):
+        writer.write_chunks([chunk])
@@ -1911,6 +1911,98 @@ def test_online_stylesheet():
     tm.assert_frame_equal(df_expected, df_xsl)
 
 
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 10])
+def test_iterparse_chunksize(xml_books, parser, chunksize):
+    iterparse = {"book": ["category", "title", "year", "author", "price"]}
+    expected = read_xml(xml_books, parser=parser, iterparse=iterparse)
+
+    chunks = list(
+        read_xml(xml_books, parser=parser, iterparse=iterparse, chunksize=chunksize)
+    )
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [chunksize] * (len(chunks) - 1)
+    for chunk in chunks:
+        tm.assert_series_equal(chunk.dtypes, expected.dtypes)
+    tm.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_iterparse_chunksize_stable_dtypes(parser, tmp_path):
+    xml = """<?xml version='1.0' encoding='utf-8'?>
+<data>
+  <row><shape>square</shape><degrees>360</degrees><angle>1.5</angle></row>
+  <row><shape>circle</shape><degrees>360</degrees><angle>2.0</angle></row>
+  <row><shape>2</shape><degrees>180</degrees><angle>3</angle><sides>3</sides></row>
+  <row><shape>3</shape><degrees>180.5</degrees><angle>3</angle><sides>3</sides></row>
+</data>"""
+    iterparse = {"row": ["shape", "degrees", "angle", "sides"]}
+
+    path = tmp_path / "rows.xml"
+    path.write_text(xml, encoding="utf-8")
+
+    chunks = read_xml(path, parser=parser, iterparse=iterparse, chunksize=1)
+    first = next(chunks)
+    assert first.dtypes.tolist() == [object, np.int64, np.float64, np.float64]
+
+    next(chunks)
+    expected = DataFrame(
+        {"shape": ["2"], "degrees": [180], "angle": [3.0], "sides": [3]},
+        index=range(2, 3),
+    )
+    tm.assert_frame_equal(next(chunks), expected)
+
+    msg = "Unable to hold the values of column degrees in the chunk starting at row 3"
+    with pytest.raises(ValueError, match=msg):
+        next(chunks)
+
+
+def test_iterparse_chunksize_missing_int(parser, tmp_path):
+    xml = """<?xml version='1.0' encoding='utf-8'?>
+<data>
+  <row><a>1</a><b>x</b></row>
+  <row><a>2</a><b>y</b></row>
+  <row><b>z</b></row>
+  <row><a>4</a><b>w</b></row>
+</data>"""
+    iterparse = {"row": ["a", "b"]}
+
+    path = tmp_path / "rows.xml"
+    path.write_text(xml, encoding="utf-8")
+
+    chunks = list(read_xml(path, parser=parser, iterparse=iterparse, chunksize=2))
+    assert chunks[0]["a"].dtype == np.int64
+    assert chunks[1]["a"].dtype == np.float64
+
+    expected = read_xml(path, parser=parser, iterparse=iterparse)
+    assert expected["a"].dtype == np.float64
+    tm.assert_frame_equal(pd.concat(chunks), expected)
+
+    # the column stays float64 in the following chunks
+    chunks = list(read_xml(path, parser=parser, iterparse=iterparse, chunksize=1))
+    assert chunks[3]["a"].dtype == np.float64
+    tm.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_iterparse_chunksize_raises(xml_books, parser):
+    with pytest.raises(ValueError, match="chunksize is only supported with iterparse"):
+        read_xml(xml_books, parser=parser, chunksize=2)
+
+    with pytest.raises(ValueError, match="chunksize must be an integer >=1"):
+        read_xml(
+            xml_books,
+            parser=parser,
+            iterparse={"book": ["category", "title"]},
+            chunksize=0,
+        )
+
+    with pytest.raises(ParserError, match="No result from selected items"):
+        read_xml(
+            xml_books,
+            parser=parser,
+            iterparse={"shelf": ["category", "title"]},
+            chunksize=2,
+        )
+
+
 # COMPRESSION
 
 
@@ -8,6 +8,7 @@ from pandas import (
     MultiIndex,
     Series,
     Timestamp,
+    concat,
     date_range,
     to_datetime,
 )
@@ -1024,6 +1025,35 @@ class TestRolling:
         with pytest.raises(ValueError, match="Each group within B must be monotonic."):
             df.groupby("A").rolling("365D", on="B")
 
+    @pytest.mark.parametrize("window", [1, 3, "3D"])
+    @pytest.mark.parametrize("closed", [None, "left", "right", "both", "neither"])
+    @pytest.mark.parametrize("center", [False, True])
+    def test_groupby_rolling_bounds_per_group(self, window, closed, center):
+        # the bounds of all groups are computed at once, restarting at each group
+        rng = np.random.default_rng(2)
+        df = DataFrame(
+            {"key": rng.integers(0, 5, 50), "x": rng.standard_normal(50)},
+            index=date_range("2020", periods=50, freq="D"),
+        )
+        # the index of the last group is decreasing
+        key = df["key"].to_numpy()
+        df = df.iloc[np.r_[np.flatnonzero(key != 4), np.flatnonzero(key == 4)[::-1]]]
+        result = (
+            df.groupby("key")["x"]
+            .rolling(window, closed=closed, center=center, min_periods=1)
+            .sum()
+        )
+        expected = concat(
+            {
+                key: group["x"]
+                .rolling(window, closed=closed, center=center, min_periods=1)
+                .sum()
+                for key, group in df.groupby("key")
+            },
+            names=["key"],
+        )
+        tm.assert_series_equal(result, expected)
+
 
 class TestExpanding:
     @pytest.fixture